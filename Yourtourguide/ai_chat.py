@@ -0,0 +1,103 @@
+"""
+Backends and limits for the AI chat proxy (ai_views.ai_chat_proxy).
+
+The model is reached through a backend: any class with a ``reply(message)``
+method, named by ``settings.AI_CHAT_BACKEND``. One instance is created per
+process and shared by every request, so the Gradio client handshake happens
+once rather than on every message.
+
+Calls run on a small thread pool of ``AI_CHAT_MAX_CONCURRENT`` workers. A
+request that finds them all busy is refused straight away instead of queueing
+behind them, and one that waits longer than ``AI_CHAT_TIMEOUT`` seconds gives
+up, so a slow model can tie up at most that many web workers for that long.
+Replies are cached per normalised message for ``AI_CHAT_CACHE_TIMEOUT``.
+"""
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.module_loading import import_string
+
+DEFAULT_BACKEND = 'Yourtourguide.ai_chat.GradioBackend'
+DEFAULT_SPACE = 'ashad0167/chatbot-copenhagenmemories-gp2'
+
+
+class Busy(Exception):
+    """Every chat worker is in use"""
+
+
+class GradioBackend:
+    def __init__(self):
+        self.space = getattr(settings, 'AI_CHAT_SPACE', DEFAULT_SPACE)
+        self._client = None
+        self._lock = threading.Lock()
+
+    def client(self):
+        # Connecting fetches the Space's API description, so it's done once and lazily
+        with self._lock:
+            if self._client is None:
+                from gradio_client import Client
+                self._client = Client(self.space)
+            return self._client
+
+    def reply(self, message):
+        return self.client().predict(msg=message, api_name='/chat')
+
+
+@lru_cache(maxsize=None)
+def _load_backend(path):
+    return import_string(path)()
+
+
+def backend():
+    return _load_backend(getattr(settings, 'AI_CHAT_BACKEND', DEFAULT_BACKEND))
+
+
+class Limiter:
+    def __init__(self, size):
+        self.slots = threading.BoundedSemaphore(size)
+        self.pool = ThreadPoolExecutor(max_workers=size, thread_name_prefix='ai-chat')
+
+    def submit(self, func, *args):
+        if not self.slots.acquire(blocking=False):
+            raise Busy
+        try:
+            future = self.pool.submit(func, *args)
+        except BaseException:
+            self.slots.release()
+            raise
+        # The slot is held until the call finishes, even if the request stopped waiting
+        future.add_done_callback(lambda done: self.slots.release())
+        return future
+
+
+@lru_cache(maxsize=None)
+def _limiter(size):
+    return Limiter(size)
+
+
+def limiter():
+    return _limiter(getattr(settings, 'AI_CHAT_MAX_CONCURRENT', 4))
+
+
+def normalize(message):
+    """Lowercase, collapse whitespace and drop trailing punctuation, so repeats of a question share a cache entry"""
+    return ' '.join(message.lower().split()).rstrip('?!. ')
+
+
+def cache_key(message):
+    return 'ai-chat:' + hashlib.sha256(normalize(message).encode()).hexdigest()
+
+
+def reply(message):
+    """The model's reply to ``message``; raises Busy, or concurrent.futures.TimeoutError when the model is too slow"""
+    key = cache_key(message)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+    answer = limiter().submit(backend().reply, message).result(timeout=getattr(settings, 'AI_CHAT_TIMEOUT', 30))
+    cache.set(key, answer, getattr(settings, 'AI_CHAT_CACHE_TIMEOUT', 60 * 60 * 24))
+    return answer
@@ -1,7 +1,10 @@
-
+from concurrent.futures import TimeoutError as ChatTimeout
 from django.http import JsonResponse
 import json
-from gradio_client import Client
+import logging
+from . import ai_chat
+
+logger = logging.getLogger(__name__)
 
 def ai_chat_proxy(request):
     if request.method == 'POST':
@@ -12,24 +15,29 @@ def ai_chat_proxy(request):
                 user_message = data.get('message')
             else:
                 user_message = request.POST.get('message')
-            
-            if not user_message:
+
+            if not isinstance(user_message, str) or not ai_chat.normalize(user_message):
                 return JsonResponse({'status': 'error', 'message': 'No message provided'}, status=400)
 
             try:
-                client = Client("ashad0167/chatbot-copenhagenmemories-gp2")
-                result = client.predict(
-                    msg=user_message,
-                    api_name="/chat"
-                )
+                result = ai_chat.reply(user_message)
                 return JsonResponse({'status': 'success', 'response': result})
+            except ai_chat.Busy:
+                response = JsonResponse({
+                    'status': 'busy',
+                    'message': 'Our assistant is helping other travellers right now. Please try again in a moment.'
+                }, status=429)
+                response['Retry-After'] = '5'
+                return response
+            except ChatTimeout:
+                return JsonResponse({'status': 'error', 'message': 'AI Service Error: timed out'}, status=504)
             except Exception as e:
                  # Fallback/Error handling for Gradio connection
-                 print(f"Gradio Error: {e}")
+                 logger.warning('Gradio error', exc_info=True)
                  return JsonResponse({'status': 'error', 'message': f"AI Service Error: {str(e)}"}, status=500)
 
         except Exception as e:
-            print(f"View Error: {e}")
+            logger.exception('AI chat view error')
             return JsonResponse({'status': 'error', 'message': str(e)}, status=500)
-    
+
     return JsonResponse({'status': 'error', 'message': 'Invalid method'}, status=405)
@@ -114,6 +114,8 @@ class FrontendBookingForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         self.tour = kwargs.pop('tour', None)
         self.user = kwargs.pop('user', None)
+        # Callers that already know whether the tour has open departures can skip the check
+        has_schedules = kwargs.pop('has_schedules', None)
         super().__init__(*args, **kwargs)
 
         if self.tour:
@@ -128,7 +130,9 @@ class FrontendBookingForm(forms.ModelForm):
             ).order_by('date', 'start_time')
 
             # If no schedules, make it optional
-            if not self.fields['schedule'].queryset.exists():
+            if has_schedules is None:
+                has_schedules = self.fields['schedule'].queryset.exists()
+            if not has_schedules:
                 self.fields['schedule'].required = False
         else:
             self.fields['tour'].queryset = Tour.objects.filter(status='active')
@@ -52,6 +52,8 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'accounts.profiling.ProfilingMiddleware',
+    'accounts.db_router.PinPrimaryAfterWriteMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -60,7 +62,8 @@ ROOT_URLCONF = 'Yourtourguide.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # DjangoTemplates, timing template rendering for request profiles (accounts/profiling.py)
+        'BACKEND': 'accounts.profiling.ProfilingTemplates',
         'DIRS': [TEMPLATES_DIR],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -81,13 +84,63 @@ WSGI_APPLICATION = 'Yourtourguide.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# WAL lets readers carry on while a booking is being written; synchronous=NORMAL
+# is durable across application crashes in WAL mode. Writers take the lock
+# when their transaction starts (IMMEDIATE) and wait up to "timeout" seconds
+# for it instead of failing with "database is locked".
+SQLITE_OPTIONS = {
+    'init_command': (
+        'PRAGMA journal_mode=WAL;'
+        'PRAGMA synchronous=NORMAL;'
+        'PRAGMA mmap_size=268435456;'
+        'PRAGMA temp_store=MEMORY;'
+    ),
+    'timeout': 20,
+    'transaction_mode': 'IMMEDIATE',
+}
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': SQLITE_OPTIONS,
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+    },
+    # Copy of default refreshed by "manage.py sync_replica"; see accounts/db_router.py
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'db.replica.sqlite3',
+        'OPTIONS': SQLITE_OPTIONS,
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'TEST': {'MIRROR': 'default'},
+    },
+}
+
+DATABASE_ROUTERS = ['accounts.db_router.ReplicaRouter']
+
+# Send admin analytics and listing reads to the replica. Turn on once
+# sync_replica runs on a schedule shorter than READ_REPLICA_PIN_SECONDS.
+READ_REPLICA = False
+READ_REPLICA_PIN_SECONDS = 60
+
+# Shared by every worker process, so cached pages, version keys and locks are
+# seen by all of them. Whole-page payloads also keep a small per-process LRU
+# in front of it (accounts/tiered_cache.py). RedisCache can replace the file
+# backend without other changes.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'cache',
+        'TIMEOUT': 60 * 60,
+        'OPTIONS': {'MAX_ENTRIES': 10000},
     }
 }
 
+# Runs the tests against an in-memory cache instead of the one above
+TEST_RUNNER = 'accounts.test_runner.LocalCacheTestRunner'
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -136,6 +189,16 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']
+# collectstatic output; not tracked in git
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+
+# collectstatic writes content-hashed names, the {% bundle %} files and .gz/.br
+# siblings (accounts/static_storage.py). Serve STATIC_ROOT with precompressed
+# files enabled and a far-future "Cache-Control: immutable" on hashed names.
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'accounts.static_storage.CompressedManifestStaticFilesStorage'},
+}
 
 # Media files (User uploaded files)
 MEDIA_URL = 'media/'
@@ -146,6 +209,20 @@ MEDIA_ROOT = BASE_DIR / 'media'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Profile every request (accounts/profiling.py). Staff can profile single
+# requests with an "X-Profile: 1" header while this is off.
+REQUEST_PROFILING = False
+
+# AI chat proxy (Yourtourguide/ai_chat.py)
+AI_CHAT_BACKEND = 'Yourtourguide.ai_chat.GradioBackend'
+AI_CHAT_SPACE = 'ashad0167/chatbot-copenhagenmemories-gp2'
+AI_CHAT_MAX_CONCURRENT = 4  # model calls in flight per process; more are refused with a 429
+AI_CHAT_TIMEOUT = 30  # seconds
+AI_CHAT_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Threads that resize uploaded images (accounts/renditions.py); 0 resizes inline
+IMAGE_RENDITION_WORKERS = 2
+
 AUTHENTICATION_BACKENDS = [
     'accounts.backends.EmailBackend',
     'django.contrib.auth.backends.ModelBackend',
@@ -1,8 +1,13 @@
+from functools import partial
 from django.shortcuts import render, get_object_or_404
 from django.core.paginator import Paginator
-from django.db.models import Q, Avg, Count, Value
+from django.db.models import Q, Avg, Count
 from django.db.models.functions import Coalesce
 from accounts.models import Tour, Category, DestinationRegion, City, TourReview
+from accounts import search
+from accounts.facets import tour_facets, ids_to_bitmap
+from accounts.pagination import KeysetPaginator
+from accounts.tour_cards import listed_tours, tour_cards, tour_list_paginator
 
 from accounts.models import BlogPost, ContactUs, SiteSetting, CustomerReviewStatic, FAQ, TourSupplier, Country, FeatureSection, Slider,Page, Tour
 from django.db.models import Prefetch
@@ -45,7 +50,7 @@ def tour_cities(request):
 
 
 def tour_providers(request):
-    suppliers_qs = TourSupplier.objects.filter(status='active').annotate(
+    suppliers_qs = TourSupplier.objects.filter(status='active').select_related('country').annotate(
         tour_count=Count('tours', filter=Q(tours__status='active'))
     ).order_by('-tour_count', 'company_name')
 
@@ -81,42 +86,58 @@ def set_language(request, lang_code):
 
 
 def blog_list(request):
-    blogs = BlogPost.objects.filter(status='published').order_by('-created_at')
-    paginator = Paginator(blogs, 12)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    blogs = BlogPost.objects.filter(status='published').select_related('author', 'category')
+    paginator = KeysetPaginator(blogs, 12, ordering=('-created_at',))
+    page_obj = paginator.get_page(request.GET.get('cursor'))
     context = {
         'page_obj': page_obj,
     }
     return render(request, 'frontend/pages/blog/blog_list.html', context)
 
 def blog_detail(request, blog_id):
-    blog = get_object_or_404(BlogPost, pk=blog_id)
+    blog = get_object_or_404(BlogPost.objects.select_related('author', 'category'), pk=blog_id)
     context = {
         'blog': blog,
     }
     return render(request, 'frontend/pages/blog/blog_detail.html', context)
 
+# Query parameters the cached pages read; the page cache ignores every other one
+HOME_PARAMS = ('search', 'start_date', 'guests')
+
+TOUR_LIST_FEATURES = (
+    'live_guide', 'skip_the_line', 'instant_confirmation', 'wheelchair_accessible', 'mobile_ticket',
+    'free_cancellation',
+)
+
+TOUR_LIST_PARAMS = (
+    'search', 'category', 'supplier', 'country', 'region', 'city', 'min_price', 'max_price', 'sort', 'rating',
+    'difficulty', 'guests', 'start_date', 'cursor',
+) + TOUR_LIST_FEATURES
+
 def home(request):
+    from accounts import page_cache
+
+    if page_cache.is_cacheable(request):
+        return page_cache.cached_page(
+            request, 'home', partial(_render_home, request), tags=page_cache.home_page.tags(),
+            params=HOME_PARAMS
+        )
+    return _render_home(request)
+
+def _render_home(request, **extra_context):
+    from accounts import page_cache
 
     reviews = CustomerReviewStatic.objects.filter(is_active=True).order_by('display_order', '-created_at')
-    featured_blogs = BlogPost.objects.filter(status='published', is_featured=True).order_by('-created_at')
+    featured_blogs = BlogPost.objects.filter(status='published', is_featured=True).select_related('author').order_by('-created_at')
     faqs = FAQ.objects.filter(status='active', is_featured=True).order_by('display_order', '-created_at')
     
     cities = City.objects.filter(is_active=True).annotate(tour_count=Count('tours', filter=Q(tours__status='active'))).order_by('name')
     categories = Category.objects.filter(status='active').annotate(tour_count=Count('tours', filter=Q(tours__status='active'))).order_by('display_order', 'name')
-    tour_suppliers = TourSupplier.objects.filter(status='active').annotate(tour_count=Count('tours', filter=Q(tours__status='active'))).order_by('-rating', 'company_name')
+    tour_suppliers = TourSupplier.objects.filter(status='active').select_related('country').annotate(tour_count=Count('tours', filter=Q(tours__status='active'))).order_by('-rating', 'company_name')
     destination_regions = DestinationRegion.objects.filter(is_active=True).annotate(tour_count=Count('tours', filter=Q(tours__status='active'))).order_by('name')
     countries = Country.objects.filter(is_active=True).annotate(tour_count=Count('cities__tours', filter=Q(cities__tours__status='active'))).order_by('name')
     feature_sections = FeatureSection.objects.filter(status='active').prefetch_related(
-        Prefetch('section_tours__tour', queryset=Tour.objects.annotate(
-            calculated_average_rating=Coalesce(Avg('reviews__overall_rating'), Value(0.0)),
-            calculated_total_reviews=Count('reviews')
-        ).select_related(
-            'supplier',
-            'city__country',
-            'destination_region'
-        ).prefetch_related('images')),
+        Prefetch('section_tours__tour', queryset=tour_cards()),
     ).order_by('rank', '-created_at')
     sliders = Slider.objects.filter(status='active').order_by('-created_at')
     
@@ -131,6 +152,9 @@ def home(request):
         'countries': countries,
         'feature_sections': feature_sections,
         'sliders': sliders,
+        'home_cache_version': page_cache.home_version(),
+        'home_cache_timeout': page_cache.CACHE_TIMEOUT,
+        **extra_context,
     }
     return render(request, 'frontend/pages/home.html', context)
 
@@ -212,6 +236,12 @@ def contactus(request):
     }
     return render(request, 'frontend/pages/contactus.html', context)
 
+def _with_facet_counts(queryset, counts):
+    objects = list(queryset)
+    for obj in objects:
+        obj.active_tour_count = counts.get(obj.pk, 0)
+    return objects
+
 def _build_tour_list_context(request):
     # Get search and filter parameters
     search_query = request.GET.get('search', '')
@@ -231,55 +261,26 @@ def _build_tour_list_context(request):
     start_date = request.GET.get('start_date', '')
     
     # Feature filters (checkboxes)
-    features = {
-        'live_guide': request.GET.get('live_guide'),
-        'skip_the_line': request.GET.get('skip_the_line'),
-        'instant_confirmation': request.GET.get('instant_confirmation'),
-        'wheelchair_accessible': request.GET.get('wheelchair_accessible'),
-        'mobile_ticket': request.GET.get('mobile_ticket'),
-        'free_cancellation': request.GET.get('free_cancellation'),
-    }
+    features = {feature: request.GET.get(feature) for feature in TOUR_LIST_FEATURES}
 
-    # Base queryset with related data
-    tours = Tour.objects.annotate(
-        calculated_average_rating=Coalesce(Avg('reviews__overall_rating'), Value(0.0)),
-        calculated_total_reviews=Count('reviews')
-    ).select_related(
-        'supplier', 'category', 'destination_region', 'city'
-    ).prefetch_related(
-        'images', 'reviews'
-    ).filter(status='active')
-
-    # Apply search filter
-    if search_query:
-        tours = tours.filter(
-            Q(title__icontains=search_query) |
-            Q(title_dk__icontains=search_query) |
-            Q(short_description__icontains=search_query) |
-            Q(description__icontains=search_query) |
-            Q(city__name__icontains=search_query) |
-            Q(destination_region__name__icontains=search_query)
-        )
-
-    # Apply category filter
-    if category_id:
-        tours = tours.filter(category_id=category_id)
+    tours = listed_tours()
 
-    # Apply country filter (via city relation)
-    if country_id:
-        tours = tours.filter(city__country_id=country_id)
-
-    # Apply region filter
-    if region_id:
-        tours = tours.filter(destination_region_id=region_id)
-
-    # Apply city filter
-    if city_id:
-        tours = tours.filter(city_id=city_id)
-
-    # Apply supplier filter
-    if supplier_id:
-        tours = tours.filter(supplier_id=supplier_id)
+    # Apply search filter (matches in the full-text index, filters below narrow them down)
+    ranked = False
+    if search_query:
+        matches = search.matching(search_query)
+        if matches is None:
+            tours = tours.filter(
+                Q(title__icontains=search_query) |
+                Q(title_dk__icontains=search_query) |
+                Q(short_description__icontains=search_query) |
+                Q(description__icontains=search_query) |
+                Q(city__name__icontains=search_query) |
+                Q(destination_region__name__icontains=search_query)
+            )
+        else:
+            tours = tours.filter(matches)
+            ranked = True
 
     # Apply price filter
     if min_price:
@@ -289,7 +290,7 @@ def _build_tour_list_context(request):
         
     # Apply rating filter
     if rating:
-        tours = tours.filter(calculated_average_rating__gte=rating)
+        tours = tours.filter(average_rating__gte=rating)
 
     # Apply difficulty filter
     if difficulty:
@@ -315,42 +316,54 @@ def _build_tour_list_context(request):
             filter_kwargs = {feature: True}
             tours = tours.filter(**filter_kwargs)
 
-    # Apply sorting
-    if sort_by == 'price_low':
-        tours = tours.order_by('base_price')
-    elif sort_by == 'price_high':
-        tours = tours.order_by('-base_price')
-    elif sort_by == 'rating':
-        tours = tours.order_by('-calculated_average_rating')
-    elif sort_by == 'newest':
-        tours = tours.order_by('-created_at')
-    else:  # recommended - featured tours first, then by rating
-        tours = tours.order_by('-is_featured', '-calculated_average_rating', '-created_at')
-
-    # Capture total before pagination
-    total_tours = tours.count()
-
-    # Pagination
-    paginator = Paginator(tours, 12)  # 12 tours per page
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    # Tours matching everything except the sidebar facets, as a bitmap for facet counts
+    other_filters = min_price or max_price or rating or difficulty or guests or any(features.values())
+    if not (search_query or other_filters):
+        base_bitmap = None
+    else:
+        base_bitmap = ids_to_bitmap(tours.values_list('pk', flat=True))
 
-    # Get filter options
-    categories = Category.objects.filter(status='active').annotate(
-        active_tour_count=Count('tours', filter=Q(tours__status='active'))
-    ).order_by('name')
-    regions = DestinationRegion.objects.filter(is_active=True).annotate(
-        active_tour_count=Count('tours', filter=Q(tours__status='active'))
-    ).order_by('name')
-    cities = City.objects.filter(is_active=True).annotate(
-        active_tour_count=Count('tours', filter=Q(tours__status='active'))
-    ).order_by('name')
-    countries = Country.objects.filter(is_active=True).annotate(
-        active_tour_count=Count('cities__tours', filter=Q(cities__tours__status='active'))
-    ).order_by('name')
-    suppliers = TourSupplier.objects.filter(status='active').annotate(
-        active_tour_count=Count('tours', filter=Q(tours__status='active'))
-    ).order_by('company_name')
+    # Apply category filter
+    if category_id:
+        tours = tours.filter(category_id=category_id)
+
+    # Apply country filter (via city relation)
+    if country_id:
+        tours = tours.filter(city__country_id=country_id)
+
+    # Apply region filter
+    if region_id:
+        tours = tours.filter(destination_region_id=region_id)
+
+    # Apply city filter
+    if city_id:
+        tours = tours.filter(city_id=city_id)
+
+    # Apply supplier filter
+    if supplier_id:
+        tours = tours.filter(supplier_id=supplier_id)
+
+    # Apply sorting and pagination
+    paginator = tour_list_paginator(tours, sort_by, search_query if ranked else None)
+    page_obj = paginator.get_page(request.GET.get('cursor'))
+    total_tours = paginator.count
+
+    # Get filter options, counted against the visitor's current filters
+    facet_counts = tour_facets.counts(
+        selected={
+            'category': category_id,
+            'region': region_id,
+            'city': city_id,
+            'country': country_id,
+            'supplier': supplier_id,
+        },
+        base=base_bitmap
+    )
+    categories = _with_facet_counts(Category.objects.filter(status='active').order_by('name'), facet_counts['category'])
+    regions = _with_facet_counts(DestinationRegion.objects.filter(is_active=True).order_by('name'), facet_counts['region'])
+    cities = _with_facet_counts(City.objects.filter(is_active=True).order_by('name'), facet_counts['city'])
+    countries = _with_facet_counts(Country.objects.filter(is_active=True).order_by('name'), facet_counts['country'])
+    suppliers = _with_facet_counts(TourSupplier.objects.filter(status='active').order_by('company_name'), facet_counts['supplier'])
     
     # Difficulty choices for filter
     difficulty_choices = [
@@ -411,7 +424,18 @@ def _build_tour_list_context(request):
 
 
 def tour_list(request, template_name='frontend/pages/tour/tour_list.html'):
+    from accounts import page_cache
+
+    if page_cache.is_cacheable(request):
+        return page_cache.cached_page(
+            request, f'tour_list:{template_name}', partial(_render_tour_list, request, template_name),
+            tags=page_cache.tour_list_page.tags(), params=TOUR_LIST_PARAMS
+        )
+    return _render_tour_list(request, template_name)
+
+def _render_tour_list(request, template_name, **extra_context):
     context = _build_tour_list_context(request)
+    context.update(extra_context)
     return render(request, template_name, context)
 
 
@@ -427,38 +451,27 @@ def find_tour_page(request):
 
 def tour_detail(request, tour_id):
     from .forms import FrontendBookingForm
-    from accounts.models import Customer, Coupon, Booking, BookingParticipant
+    from accounts.models import Customer, Coupon, Booking
+    from accounts.bookings import create_booking, ScheduleSoldOut
+    from accounts.read_models import TourDetailReadModel
+    from django.http import Http404
     from django.contrib import messages
     import json
     from decimal import Decimal
-    import random
-    import string
     from django.db.models import Avg, Count, Value
     from django.db.models.functions import Coalesce
 
 
     # Get tour with all related data
-    tour = get_object_or_404(
-        Tour.objects.select_related(
-            'supplier', 'category', 'destination_region', 'city'
-        ).annotate(
-            calculated_average_rating=Coalesce(Avg('reviews__overall_rating'), Value(0.0)),
-            calculated_total_reviews=Count('reviews')
-        ).prefetch_related(
-            'images', 'highlights', 'included_items', 'excluded_items',
-            'itinerary_steps', 'requirements', 'faqs', 'pricing_options',
-            'schedules'
-        ),
-        pk=tour_id,
-        status='active'
-    )
+    try:
+        detail = TourDetailReadModel.get(tour_id)
+    except Tour.DoesNotExist:
+        raise Http404('No Tour matches the given query.')
+    tour = detail.tour
+    pricing_table = detail.pricing_table
 
     # Get related tours (same category or region)
-    related_tours = Tour.objects.select_related(
-        'supplier', 'category', 'destination_region', 'city'
-    ).prefetch_related('images').filter(
-        status='active'
-    ).exclude(pk=tour_id)
+    related_tours = listed_tours().exclude(pk=tour_id)
 
     # Filter by category first, then by region if no category matches
     if tour.category:
@@ -506,49 +519,8 @@ def tour_detail(request, tour_id):
                     participants = json.loads(participants_data)
 
                     # Calculate pricing
-                    subtotal = Decimal('0.00')
-                    participant_details = []
-
-                    for participant in participants:
-                        participant_type = participant.get('type', 'adult')
-                        age = participant.get('age')
-
-                        # Find appropriate pricing
-                        pricing = None
-                        if age is not None:
-                            pricing = tour.pricing_options.filter(
-                                is_active=True,
-                                min_age__lte=age,
-                                max_age__gte=age
-                            ).first()
-
-                        if not pricing:
-                            # Default pricing based on participant type
-                            if participant_type == 'adult':
-                                pricing = tour.pricing_options.filter(
-                                    participant_type='adult',
-                                    is_active=True
-                                ).first()
-                            elif participant_type == 'child':
-                                pricing = tour.pricing_options.filter(
-                                    participant_type='child',
-                                    is_active=True
-                                ).first()
-                            else:
-                                pricing = tour.pricing_options.filter(
-                                    participant_type='infant',
-                                    is_active=True
-                                ).first()
-
-                        if not pricing:
-                            # Fallback to base price
-                            price = tour.base_price
-                        else:
-                            price = pricing.price
-
-                        participant['price'] = str(price)
-                        subtotal += price
-                        participant_details.append(participant)
+                    subtotal = pricing_table.price_participants(participants)
+                    participant_details = participants
 
                     # Handle coupon discount
                     discount_amount = Decimal('0.00')
@@ -576,21 +548,13 @@ def tour_detail(request, tour_id):
                     tax_amount = (subtotal - discount_amount) * tax_rate
                     total_amount = subtotal - discount_amount + tax_amount
 
-                    # Generate booking number
-                    while True:
-                        booking_number = 'BK' + ''.join(random.choices(string.digits, k=8))
-                        if not Booking.objects.filter(booking_number=booking_number).exists():
-                            break
-
-                    # Create booking
-                    booking = Booking.objects.create(
-                        booking_number=booking_number,
+                    # Create booking, reserving seats on the chosen departure
+                    booking = Booking(
                         customer=customer,
                         tour=tour,
                         schedule=booking_form.cleaned_data.get('schedule'),
                         tour_date=booking_form.cleaned_data['tour_date'],
                         tour_time=booking_form.cleaned_data.get('tour_time'),
-                        total_participants=len(participants),
                         participant_details=participant_details,
                         subtotal=subtotal,
                         discount_amount=discount_amount,
@@ -606,26 +570,17 @@ def tour_detail(request, tour_id):
                         status='pending',
                         payment_status='pending'
                     )
-
-                    # Create participants
-                    for participant in participants:
-                        BookingParticipant.objects.create(
-                            booking=booking,
-                            participant_type=participant.get('type', 'adult'),
-                            first_name=participant.get('first_name', ''),
-                            last_name=participant.get('last_name', ''),
-                            age=participant.get('age'),
-                            email=participant.get('email', ''),
-                            phone=participant.get('phone', ''),
-                            special_requirements=participant.get('special_requirements', ''),
-                            price=Decimal(participant.get('price', '0'))
-                        )
-
-                    booking_success = True
-                    messages.success(request, f'Booking {booking_number} created successfully!')
-
-                    # Redirect to booking confirmation page
-                    return redirect('booking_confirmation', booking_id=booking.pk)
+                    try:
+                        create_booking(booking, participants)
+                    except ScheduleSoldOut as sold_out:
+                        booking_error = str(sold_out)
+                    else:
+                        booking_number = booking.booking_number
+                        booking_success = True
+                        messages.success(request, f'Booking {booking_number} created successfully!')
+
+                        # Redirect to booking confirmation page
+                        return redirect('booking_confirmation', booking_id=booking.pk)
 
                 else:
                     booking_error = "Please correct the errors below."
@@ -636,7 +591,7 @@ def tour_detail(request, tour_id):
 
     # Initialize form for GET requests
     if not booking_form:
-        booking_form = FrontendBookingForm(tour=tour, user=request.user)
+        booking_form = FrontendBookingForm(tour=tour, user=request.user, has_schedules=bool(detail.schedules))
 
         # Pre-fill user data if authenticated
         if request.user.is_authenticated:
@@ -644,24 +599,7 @@ def tour_detail(request, tour_id):
             booking_form.fields['contact_email'].initial = request.user.email
 
     # Get pricing options as JSON for JavaScript
-    pricing_options = tour.pricing_options.filter(is_active=True).values(
-        'participant_type', 'min_age', 'max_age', 'price', 'currency'
-    )
-
-    # Convert Decimal objects to floats for JavaScript
-    pricing_options_json = []
-    for option in pricing_options:
-        pricing_options_json.append({
-            'participant_type': option['participant_type'],
-            'min_age': option['min_age'],
-            'max_age': option['max_age'],
-            'price': float(option['price']) if option['price'] else 0.0,
-            'currency': option['currency']
-        })
-
-    # Ensure pricing_options_json is always available (even if empty)
-    if not pricing_options_json:
-        pricing_options_json = []
+    pricing_options_json = json.dumps(pricing_table.as_json())
 
     # Get non-form errors if form exists and has been validated
     non_form_errors = []
@@ -711,50 +649,27 @@ def tour_detail(request, tour_id):
         from .forms import TourReviewForm
         review_form = TourReviewForm()
 
-    # Get reviews and calculate stats
-    from django.db.models import Avg, Count
-    reviews = tour.reviews.filter(status='approved').order_by('-created_at')
-    total_reviews = reviews.count()
-    avg_rating = reviews.aggregate(Avg('overall_rating'))['overall_rating__avg'] or 0.0
-    
-    rating_stats = {}
-    if total_reviews > 0:
-        from django.db.models import Count
-        rating_counts = reviews.values('overall_rating').annotate(count=Count('overall_rating'))
-        rating_map = {item['overall_rating']: item['count'] for item in rating_counts}
-        
-        for i in range(5, 0, -1):
-            count = rating_map.get(i, 0)
-            percentage = (count / total_reviews) * 100
-            rating_stats[i] = {
-                'count': count,
-                'percentage': percentage
-            }
-    else:
-        for i in range(5, 0, -1):
-            rating_stats[i] = {'count': 0, 'percentage': 0}
-
     context = {
         'tour': tour,
         'related_tours': related_tours,
-        'images': tour.images.all().order_by('display_order'),
-        'highlights': tour.highlights.all().order_by('display_order'),
-        'included_items': tour.included_items.all().order_by('display_order'),
-        'excluded_items': tour.excluded_items.all().order_by('display_order'),
-        'itinerary_steps': tour.itinerary_steps.all().order_by('step_number'),
-        'requirements': tour.requirements.all().order_by('display_order'),
-        'faqs': tour.faqs.all().order_by('display_order'),
-        'pricing_options': tour.pricing_options.filter(is_active=True),
+        'images': detail.images,
+        'highlights': detail.highlights,
+        'included_items': detail.included_items,
+        'excluded_items': detail.excluded_items,
+        'itinerary_steps': detail.itinerary_steps,
+        'requirements': detail.requirements,
+        'faqs': detail.faqs,
+        'pricing_options': detail.pricing_options,
         'pricing_options_json': pricing_options_json,
-        'schedules': tour.schedules.filter(status='available').order_by('date', 'start_time')[:10],
+        'schedules': detail.schedules,
         'booking_form': booking_form,
         'booking_success': booking_success,
         'booking_error': booking_error,
         'non_form_errors': non_form_errors,
-        'reviews': reviews,
-        'rating_stats': rating_stats,
-        'avg_rating': avg_rating,
-        'total_reviews': total_reviews,
+        'reviews': detail.reviews,
+        'rating_stats': detail.rating_stats,
+        'avg_rating': detail.avg_rating,
+        'total_reviews': detail.total_reviews,
         'review_form': review_form,
     }
 
@@ -799,17 +714,10 @@ def tour_feature_section(request, feature_id):
     feature_section = get_object_or_404(FeatureSection, pk=feature_id, status='active')
     
     # Get all tours related to this feature section
-    tours_list = Tour.objects.filter(
+    tours_list = tour_cards(Tour.objects.filter(
         featuresectiontour__feature_section=feature_section,
         status='active'
-    ).select_related(
-        'city', 'city__country', 'destination_region'
-    ).annotate(
-        calculated_average_rating=Coalesce(Avg('reviews__overall_rating'), Value(0.0)),
-        calculated_total_reviews=Count('reviews')
-    ).prefetch_related(
-        'images'
-    ).order_by('-created_at')
+    )).order_by('-created_at')
 
     paginator = Paginator(tours_list, 12)
     page_number = request.GET.get('page')
@@ -828,18 +736,10 @@ def tour_feature_section(request, feature_id):
     return render(request, 'frontend/pages/tour/tour_feature_section.html', context) 
 
 def testimonial(request):
-    from accounts.models import CustomerReviewStatic, TourReview
-    from django.core.paginator import Paginator
-    from itertools import chain
+    from accounts.testimonials import TestimonialFeed
 
-    # Fetch reviews
-    static_reviews = CustomerReviewStatic.objects.filter(is_active=True).order_by('-created_at')
-    tour_reviews = TourReview.objects.filter(status='approved').select_related('customer__user').order_by('-created_at')
-    
-    combined_reviews = list(chain(static_reviews, tour_reviews))
-    
-    # Pagination
-    paginator = Paginator(combined_reviews, 9) # Show 9 reviews per page
+    # Static and customer reviews merged newest first in SQL; only the page's rows are loaded
+    paginator = Paginator(TestimonialFeed(), 9) # Show 9 reviews per page
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
 
@@ -230,9 +230,9 @@ class CouponUsageAdmin(admin.ModelAdmin):
 
 @admin.register(Notification)
 class NotificationAdmin(admin.ModelAdmin):
-    list_display = ('customer', 'notification_type', 'title', 'is_sent', 'is_read', 'created_at')
+    list_display = ('customer', 'notification_type', 'title', 'recipient', 'is_sent', 'attempts', 'is_read', 'created_at')
     list_filter = ('notification_type', 'is_sent', 'is_read', 'created_at')
-    search_fields = ('customer__user__username', 'title', 'message')
+    search_fields = ('customer__user__username', 'recipient', 'title', 'message')
     readonly_fields = ('created_at',)
 
 @admin.register(BlogPost)
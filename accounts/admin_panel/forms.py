@@ -244,6 +244,11 @@ class GroupForm(forms.ModelForm):
             'permissions': forms.SelectMultiple(attrs={'class': 'form-select', 'style': 'height: 300px;'}),
         }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Permission labels include their content type; load it with the choices
+        self.fields['permissions'].queryset = self.fields['permissions'].queryset.select_related('content_type')
+
 class AdminUserForm(forms.ModelForm):
     password = forms.CharField(widget=forms.PasswordInput(attrs={'class': 'form-control'}), required=False, help_text="Leave empty to keep current password")
     groups = forms.ModelMultipleChoiceField(queryset=Group.objects.all(), required=False, widget=forms.CheckboxSelectMultiple)
@@ -261,6 +266,10 @@ class AdminUserForm(forms.ModelForm):
             'user_permissions': forms.SelectMultiple(attrs={'class': 'form-select', 'style': 'height: 300px;'}),
         }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields['user_permissions'].queryset = self.fields['user_permissions'].queryset.select_related('content_type')
+
     def save(self, commit=True):
         user = super().save(commit=False)
         if self.cleaned_data['password']:
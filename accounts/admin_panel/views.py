@@ -3,6 +3,7 @@ from django.contrib.auth import login
 from django.contrib.auth.decorators import login_required, user_passes_test
 from accounts.forms import AdminRegistrationForm, LoginForm
 from django.contrib import messages
+from accounts.db_router import replica_reads
 
 # Import separated views
 from .views_destination import (
@@ -105,13 +106,37 @@ def register_admin(request):
         form = AdminRegistrationForm()
     return render(request, 'accounts/admin/register.html', {'form': form})
 
+def _chart_range(request, today):
+    """
+    The dashboard chart's ``?start=`` / ``?end=`` dates, ending no later than
+    today and spanning at most MAX_SPAN_DAYS. Missing, malformed or reversed
+    dates fall back to the last 6 x 30 days.
+    """
+    from accounts.stats import clamp_start
+    from django.utils.dateparse import parse_date
+    from datetime import timedelta
+
+    default = (today - timedelta(days=30 * 6 - 1), today)
+    try:
+        # parse_date returns None for malformed input and raises for impossible dates (2024-02-30)
+        end = min(parse_date(request.GET.get('end') or '') or today, today)
+        start = parse_date(request.GET.get('start') or '') or end - timedelta(days=30 * 6 - 1)
+    except ValueError:
+        return default
+    if start > end:
+        return default
+    return clamp_start(start, end), end
+
+
 @login_required
 @user_passes_test(lambda u: u.is_staff)
+@replica_reads
 def admin_dashboard(request):
     from accounts.models import (
         Booking, Payment, Tour, Customer, TourReview, 
         Coupon, City, BlogPost
     )
+    from accounts.stats import stats_series
     from django.db.models import Sum, Count, Q, Avg
     from django.utils import timezone
     from datetime import timedelta
@@ -122,42 +147,58 @@ def admin_dashboard(request):
     last_7_days = today - timedelta(days=7)
     
     # Booking Statistics
-    total_bookings = Booking.objects.count()
-    pending_bookings = Booking.objects.filter(status='pending').count()
-    confirmed_bookings = Booking.objects.filter(status='confirmed').count()
-    cancelled_bookings = Booking.objects.filter(status='cancelled').count()
-    bookings_this_month = Booking.objects.filter(created_at__gte=last_30_days).count()
+    booking_stats = Booking.objects.aggregate(
+        total=Count('id'),
+        pending=Count('id', filter=Q(status='pending')),
+        confirmed=Count('id', filter=Q(status='confirmed')),
+        cancelled=Count('id', filter=Q(status='cancelled')),
+        this_month=Count('id', filter=Q(created_at__gte=last_30_days)),
+    )
+    total_bookings = booking_stats['total']
+    pending_bookings = booking_stats['pending']
+    confirmed_bookings = booking_stats['confirmed']
+    cancelled_bookings = booking_stats['cancelled']
+    bookings_this_month = booking_stats['this_month']
     
     # Revenue Statistics
-    total_revenue = Payment.objects.filter(status='completed').aggregate(
-        total=Sum('amount')
-    )['total'] or 0
-    revenue_this_month = Payment.objects.filter(
-        status='completed',
-        created_at__gte=last_30_days
-    ).aggregate(total=Sum('amount'))['total'] or 0
-    pending_payments = Payment.objects.filter(status='pending').aggregate(
-        total=Sum('amount')
-    )['total'] or 0
+    payment_stats = Payment.objects.aggregate(
+        total_revenue=Sum('amount', filter=Q(status='completed')),
+        revenue_this_month=Sum('amount', filter=Q(status='completed', created_at__gte=last_30_days)),
+        pending_payments=Sum('amount', filter=Q(status='pending')),
+    )
+    total_revenue = payment_stats['total_revenue'] or 0
+    revenue_this_month = payment_stats['revenue_this_month'] or 0
+    pending_payments = payment_stats['pending_payments'] or 0
     
     # Tour Statistics
-    total_tours = Tour.objects.count()
-    active_tours = Tour.objects.filter(status='active').count()
-    draft_tours = Tour.objects.filter(status='draft').count()
+    tour_stats = Tour.objects.aggregate(
+        total=Count('id'),
+        active=Count('id', filter=Q(status='active')),
+        draft=Count('id', filter=Q(status='draft')),
+    )
+    total_tours = tour_stats['total']
+    active_tours = tour_stats['active']
+    draft_tours = tour_stats['draft']
     
     # Customer Statistics
-    total_customers = Customer.objects.count()
-    new_customers_this_month = Customer.objects.filter(
-        created_at__gte=last_30_days
-    ).count()
+    customer_stats = Customer.objects.aggregate(
+        total=Count('id'),
+        this_month=Count('id', filter=Q(created_at__gte=last_30_days)),
+    )
+    total_customers = customer_stats['total']
+    new_customers_this_month = customer_stats['this_month']
     
     # Review Statistics
-    total_reviews = TourReview.objects.count()
-    pending_reviews = TourReview.objects.filter(status='pending').count()
-    approved_reviews = TourReview.objects.filter(status='approved').count()
-    average_rating = TourReview.objects.filter(
-        status='approved'
-    ).aggregate(avg=Avg('overall_rating'))['avg'] or 0
+    review_stats = TourReview.objects.aggregate(
+        total=Count('id'),
+        pending=Count('id', filter=Q(status='pending')),
+        approved=Count('id', filter=Q(status='approved')),
+        average_rating=Avg('overall_rating', filter=Q(status='approved')),
+    )
+    total_reviews = review_stats['total']
+    pending_reviews = review_stats['pending']
+    approved_reviews = review_stats['approved']
+    average_rating = review_stats['average_rating'] or 0
     
     # Recent Bookings (last 10)
     recent_bookings = Booking.objects.select_related(
@@ -174,26 +215,19 @@ def admin_dashboard(request):
         booking_count=Count('bookings')
     ).order_by('-booking_count')[:5]
     
-    # Monthly booking data for chart (last 6 months)
+    # Booking/revenue chart from the DailyStats rollup (default: last 6 x 30 days)
+    chart_start, chart_end = _chart_range(request, today)
+    
+    chart_labels = []
     monthly_bookings = []
     monthly_revenue = []
-    for i in range(5, -1, -1):
-        month_start = today - timedelta(days=30*i)
-        month_end = today - timedelta(days=30*(i-1)) if i > 0 else today
-        
-        bookings = Booking.objects.filter(
-            created_at__gte=month_start,
-            created_at__lt=month_end
-        ).count()
-        
-        revenue = Payment.objects.filter(
-            status='completed',
-            created_at__gte=month_start,
-            created_at__lt=month_end
-        ).aggregate(total=Sum('amount'))['total'] or 0
-        
-        monthly_bookings.append(bookings)
-        monthly_revenue.append(float(revenue))
+    for window_start, window_end, totals in stats_series(chart_start, chart_end, buckets=6):
+        if window_start == window_end:
+            chart_labels.append(window_start.strftime('%b %d'))
+        else:
+            chart_labels.append(f"{window_start.strftime('%b %d')} - {window_end.strftime('%b %d')}")
+        monthly_bookings.append(totals['bookings'])
+        monthly_revenue.append(float(totals['revenue']))
     
     # Booking status distribution
     booking_status_data = {
@@ -228,6 +262,9 @@ def admin_dashboard(request):
         'top_tours': top_tours,
         
         # Chart data
+        'chart_start': chart_start,
+        'chart_end': chart_end,
+        'chart_labels': chart_labels,
         'monthly_bookings': monthly_bookings,
         'monthly_revenue': monthly_revenue,
         'booking_status_data': booking_status_data,
@@ -6,6 +6,7 @@ from .forms import AdminUserForm
 from django.core.paginator import Paginator
 from django.db.models import Q
 from .decorators import permission_required_with_message
+from accounts.db_router import replica_reads
 
 def is_admin(user):
     return user.is_staff
@@ -13,6 +14,7 @@ def is_admin(user):
 @login_required
 @user_passes_test(is_admin)
 @permission_required_with_message('auth.view_user')
+@replica_reads
 def admin_list(request):
     query = request.GET.get('q')
     admins = User.objects.filter(is_staff=True).order_by('-date_joined')
@@ -7,10 +7,12 @@ from django.contrib.auth.models import User
 from accounts.models import BlogPost, Category
 from .forms_additions import BlogPostForm
 from .decorators import permission_required_with_message
+from accounts.db_router import replica_reads
 
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_blogpost')
+@replica_reads
 def blog_list(request):
     search_query = request.GET.get('search', '')
     status = request.GET.get('status', '')
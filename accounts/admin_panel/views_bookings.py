@@ -1,21 +1,23 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
-from django.core.paginator import Paginator
+from accounts.pagination import KeysetPaginator
 from django.db.models import Q
-from accounts.models import Booking, BookingParticipant
+from accounts.models import Booking
 from .decorators import permission_required_with_message
 from .forms_additions import BookingForm
+from accounts.db_router import replica_reads
 
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_booking')
+@replica_reads
 def booking_list(request):
     search_query = request.GET.get('search', '')
     status = request.GET.get('status', '')
     payment_status = request.GET.get('payment_status', '')
     
-    bookings = Booking.objects.select_related('customer', 'tour', 'schedule').all()
+    bookings = Booking.objects.select_related('customer__user', 'tour', 'schedule').all()
     
     if search_query:
         bookings = bookings.filter(
@@ -31,10 +33,8 @@ def booking_list(request):
     if payment_status:
         bookings = bookings.filter(payment_status=payment_status)
     
-    bookings = bookings.order_by('-created_at')
-    paginator = Paginator(bookings, 10)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    paginator = KeysetPaginator(bookings, 10, ordering=('-created_at',), approximate_count=True)
+    page_obj = paginator.get_page(request.GET.get('cursor'))
     
     return render(request, 'accounts/admin/bookings/list.html', {
         'page_obj': page_obj,
@@ -63,14 +63,26 @@ def booking_detail(request, pk):
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.change_booking')
 def booking_status_update(request, pk):
+    from django.db import transaction
+    from accounts.bookings import move_seats, seats_held, ScheduleSoldOut
+
     booking = get_object_or_404(Booking, pk=pk)
     if request.method == 'POST':
         new_status = request.POST.get('status')
         if new_status in dict(Booking._meta.get_field('status').choices):
-            booking.status = new_status
-            booking.save()
-            messages.success(request, f'Booking status updated to {new_status}!')
-            return redirect('booking_detail', pk=booking.pk)
+            held_seats = seats_held(booking.schedule_id, booking.total_participants, booking.status)
+            try:
+                # Cancelling gives the seats back, un-cancelling takes them again
+                with transaction.atomic():
+                    move_seats(held_seats, seats_held(booking.schedule_id, booking.total_participants, new_status))
+                    booking.status = new_status
+                    booking.save()
+            except ScheduleSoldOut as e:
+                booking.refresh_from_db()
+                messages.error(request, str(e))
+            else:
+                messages.success(request, f'Booking status updated to {new_status}!')
+                return redirect('booking_detail', pk=booking.pk)
         else:
             messages.error(request, 'Invalid status!')
     
@@ -82,6 +94,7 @@ def booking_status_update(request, pk):
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_bookingparticipant')
+@replica_reads
 def booking_participants_list(request, booking_id):
     booking = get_object_or_404(Booking, pk=booking_id)
     participants = booking.participants.all()
@@ -191,8 +204,10 @@ def booking_add_payment(request, pk):
 @permission_required_with_message('accounts.view_booking')
 def booking_send_invoice(request, pk):
     from django.http import JsonResponse
-    from django.core.mail import send_mail
     from django.conf import settings
+    from django.core.exceptions import ValidationError
+    from django.core.validators import validate_email
+    from accounts.outbox import enqueue
     
     if request.method != 'POST':
         return JsonResponse({'success': False, 'error': 'Invalid request method'}, status=405)
@@ -210,36 +225,29 @@ def booking_send_invoice(request, pk):
         if not to_email:
             return JsonResponse({'success': False, 'error': 'Recipient email is required'}, status=400)
         
+        try:
+            validate_email(to_email)
+        except ValidationError:
+            return JsonResponse({'success': False, 'error': 'Recipient email is not valid'}, status=400)
+        
         if not subject:
             return JsonResponse({'success': False, 'error': 'Email subject is required'}, status=400)
         
         if not message:
             return JsonResponse({'success': False, 'error': 'Email message is required'}, status=400)
         
-        # Send email
-        try:
-            send_mail(
-                subject=subject,
-                message=message,
-                from_email=from_email,
-                recipient_list=[to_email],
-                fail_silently=False,
-            )
-            
-            messages.success(request, f'Invoice sent successfully to {to_email}!')
-            
-            return JsonResponse({
-                'success': True,
-                'message': f'Invoice sent successfully to {to_email}!'
-            })
-            
-        except Exception as email_error:
-            # Log the error but return a user-friendly message
-            print(f"Email sending error: {str(email_error)}")
-            return JsonResponse({
-                'success': False, 
-                'error': 'Failed to send email. Please check email configuration.'
-            }, status=500)
+        # Queue the email; the send_outbox worker delivers it
+        enqueue(
+            subject, message, to_email, from_email=from_email, notification_type='invoice',
+            customer=booking.customer, booking=booking, tour=booking.tour,
+        )
+        
+        messages.success(request, f'Invoice queued for {to_email}!')
+        
+        return JsonResponse({
+            'success': True,
+            'message': f'Invoice queued for {to_email}!'
+        })
         
     except Exception as e:
         return JsonResponse({'success': False, 'error': f'An error occurred: {str(e)}'}, status=500)
@@ -250,10 +258,8 @@ def booking_send_invoice(request, pk):
 @permission_required_with_message('accounts.add_booking')
 def booking_create(request):
     import json
-    from decimal import Decimal
-    import random
-    import string
-    from datetime import datetime
+    from accounts.bookings import create_booking, ScheduleSoldOut
+    from accounts.pricing import reprice_booking
     
     if request.method == 'POST':
         form = BookingForm(request.POST)
@@ -269,38 +275,16 @@ def booking_create(request):
                 
                 # Create booking instance but don't save yet
                 booking = form.save(commit=False)
-                
-                # Generate unique booking number
-                while True:
-                    booking_number = 'BK' + ''.join(random.choices(string.digits, k=8))
-                    if not Booking.objects.filter(booking_number=booking_number).exists():
-                        break
-                
-                booking.booking_number = booking_number
-                booking.total_participants = len(participants_data)
-                
-                # Save the booking
-                booking.save()
-                
-                # Create participants
-                for participant_data in participants_data:
-                    BookingParticipant.objects.create(
-                        booking=booking,
-                        participant_type=participant_data.get('type', 'adult'),
-                        first_name=participant_data.get('first_name', ''),
-                        last_name=participant_data.get('last_name', ''),
-                        age=participant_data.get('age') or None,
-                        email=participant_data.get('email', ''),
-                        phone=participant_data.get('phone', ''),
-                        special_requirements=participant_data.get('special_requirements', ''),
-                        price=Decimal(participant_data.get('price', '0'))
-                    )
+                reprice_booking(booking, participants_data)
+                create_booking(booking, participants_data)
                 
                 messages.success(request, f'Booking {booking.booking_number} created successfully!')
                 return redirect('booking_detail', pk=booking.pk)
                 
             except json.JSONDecodeError:
                 messages.error(request, 'Invalid participant data.')
+            except ScheduleSoldOut as e:
+                messages.error(request, str(e))
             except Exception as e:
                 messages.error(request, f'Error creating booking: {str(e)}')
         else:
@@ -318,11 +302,15 @@ def booking_create(request):
 @permission_required_with_message('accounts.change_booking')
 def booking_edit(request, pk):
     import json
-    from decimal import Decimal
+    from django.db import transaction
+    from accounts.bookings import move_seats, seats_held, replace_participants, ScheduleSoldOut
+    from accounts.pricing import get_pricing_table, reprice_booking
     
     booking = get_object_or_404(Booking, pk=pk)
     
     if request.method == 'POST':
+        # Form validation writes onto the instance, so note what it holds now
+        held_seats = seats_held(booking.schedule_id, booking.total_participants, booking.status)
         form = BookingForm(request.POST, instance=booking)
         
         if form.is_valid():
@@ -337,32 +325,22 @@ def booking_edit(request, pk):
                         'booking': booking
                     })
                 
-                # Update booking
+                # Update booking, moving its seats if the departure, party size or status changed
                 booking = form.save(commit=False)
                 booking.total_participants = len(participants_data)
-                booking.save()
-                
-                # Delete existing participants and create new ones
-                booking.participants.all().delete()
-                
-                for participant_data in participants_data:
-                    BookingParticipant.objects.create(
-                        booking=booking,
-                        participant_type=participant_data.get('type', 'adult'),
-                        first_name=participant_data.get('first_name', ''),
-                        last_name=participant_data.get('last_name', ''),
-                        age=participant_data.get('age') or None,
-                        email=participant_data.get('email', ''),
-                        phone=participant_data.get('phone', ''),
-                        special_requirements=participant_data.get('special_requirements', ''),
-                        price=Decimal(participant_data.get('price', '0'))
-                    )
+                reprice_booking(booking, participants_data)
+                with transaction.atomic():
+                    move_seats(held_seats, seats_held(booking.schedule_id, booking.total_participants, booking.status))
+                    booking.save()
+                    replace_participants(booking, participants_data)
                 
                 messages.success(request, f'Booking {booking.booking_number} updated successfully!')
                 return redirect('booking_detail', pk=booking.pk)
                 
             except json.JSONDecodeError:
                 messages.error(request, 'Invalid participant data.')
+            except ScheduleSoldOut as e:
+                messages.error(request, str(e))
             except Exception as e:
                 messages.error(request, f'Error updating booking: {str(e)}')
         else:
@@ -384,5 +362,18 @@ def booking_edit(request, pk):
     return render(request, 'accounts/admin/bookings/edit.html', {
         'form': form,
         'booking': booking,
-        'participants_json': json.dumps(participants)
+        'participants_json': json.dumps(participants),
+        'tour_pricing': get_pricing_table(booking.tour).as_dict(),
     })
+
+
+@login_required
+@user_passes_test(lambda u: u.is_staff)
+@permission_required_with_message('accounts.add_booking')
+def booking_tour_pricing(request, tour_id):
+    from django.http import JsonResponse
+    from accounts.models import Tour
+    from accounts.pricing import get_pricing_table
+    
+    tour = get_object_or_404(Tour, pk=tour_id)
+    return JsonResponse(get_pricing_table(tour).as_dict())
@@ -2,21 +2,23 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
 from django.core.paginator import Paginator
-from django.db.models import Q
+from django.db.models import Count, Q
 from accounts.models import City
 from .decorators import permission_required_with_message
 from .forms_additions import CityForm
+from accounts.db_router import replica_reads
 
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_city')
+@replica_reads
 def city_list(request):
     search_query = request.GET.get('search', '')
     country = request.GET.get('country', '')
     region = request.GET.get('region', '')
     is_active = request.GET.get('is_active', '')
     
-    cities = City.objects.select_related('country', 'region').all()
+    cities = City.objects.select_related('country', 'region').annotate(tour_count=Count('tours'))
     
     if search_query:
         cities = cities.filter(
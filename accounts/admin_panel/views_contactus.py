@@ -6,10 +6,12 @@ from django.db.models import Q
 from accounts.models import ContactUs
 from .forms import ContactUsForm
 from .decorators import permission_required_with_message
+from accounts.db_router import replica_reads
 
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_contactus')
+@replica_reads
 def contactus_list(request):
     search_query = request.GET.get('search', '')
     contactus = ContactUs.objects.all()
@@ -6,10 +6,12 @@ from django.db.models import Q
 from accounts.models import Coupon, CouponUsage
 from .decorators import permission_required_with_message
 from .forms_additions import CouponForm
+from accounts.db_router import replica_reads
 
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_coupon')
+@replica_reads
 def coupon_list(request):
     search_query = request.GET.get('search', '')
     is_active = request.GET.get('is_active', '')
@@ -2,14 +2,17 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
 from django.core.paginator import Paginator
+from accounts.pagination import KeysetPaginator
 from django.db.models import Q
 from accounts.models import Customer
 from .forms import CustomerForm
 from .decorators import permission_required_with_message
+from accounts.db_router import replica_reads
 
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_customer')
+@replica_reads
 def customer_list(request):
     search_query = request.GET.get('search', '')
     customers = Customer.objects.select_related('user').all()
@@ -23,9 +26,9 @@ def customer_list(request):
             Q(phone__icontains=search_query)
         )
     
-    paginator = Paginator(customers, 10)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    # created_at is nullable on old rows; the id follows signup order
+    paginator = KeysetPaginator(customers, 10, ordering=('-pk',), approximate_count=True)
+    page_obj = paginator.get_page(request.GET.get('cursor'))
     
     return render(request, 'accounts/admin/customers/list.html', {
         'page_obj': page_obj,
@@ -87,6 +90,7 @@ def customer_delete(request, pk):
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_booking')
+@replica_reads
 def customer_booking_list(request, pk):
     customer = get_object_or_404(Customer, pk=pk)
     bookings = customer.bookings.select_related('tour', 'schedule').all().order_by('-created_at')
@@ -6,13 +6,15 @@ from django.db.models import Q
 from accounts.models import DestinationRegion
 from .forms import DestinationRegionForm
 from .decorators import permission_required_with_message
+from accounts.db_router import replica_reads
 
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_destinationregion')
+@replica_reads
 def destination_region_list(request):
     search_query = request.GET.get('search', '')
-    regions = DestinationRegion.objects.all()
+    regions = DestinationRegion.objects.select_related('country')
     
     if search_query:
         regions = regions.filter(
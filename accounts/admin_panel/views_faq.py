@@ -5,9 +5,11 @@ from django.core.paginator import Paginator
 from django.db.models import Q
 from accounts.models import FAQ
 from .forms import FAQForm
+from accounts.db_router import replica_reads
 
 @login_required
 @user_passes_test(lambda u: u.is_staff)
+@replica_reads
 def faq_list(request):
     search_query = request.GET.get('search', '')
     faqs = FAQ.objects.all()
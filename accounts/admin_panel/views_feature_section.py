@@ -6,10 +6,12 @@ from django.db.models import Q
 from accounts.models import FeatureSection
 from .forms import FeatureSectionForm
 from .decorators import permission_required_with_message
+from accounts.db_router import replica_reads
 
 @login_required # turbo
 @user_passes_test(lambda u: u.is_staff)
 #@permission_required_with_message('accounts.view_featuresection')
+@replica_reads
 def feature_section_list(request):
     search_query = request.GET.get('search', '')
     feature_sections = FeatureSection.objects.all()
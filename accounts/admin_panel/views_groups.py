@@ -6,6 +6,7 @@ from .forms import GroupForm
 from django.core.paginator import Paginator
 from django.db.models import Q
 from .decorators import permission_required_with_message
+from accounts.db_router import replica_reads
 
 def is_admin(user):
     return user.is_staff
@@ -13,6 +14,7 @@ def is_admin(user):
 @login_required
 @user_passes_test(is_admin)
 @permission_required_with_message('auth.view_group')
+@replica_reads
 def group_list(request):
     query = request.GET.get('q')
     groups = Group.objects.all().order_by('name')
@@ -1,15 +1,17 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.core.paginator import Paginator
+from accounts.pagination import KeysetPaginator
 from django.db.models import Q
 from django.utils import timezone
 from accounts.models import CustomerMessage, Customer
 from accounts.admin_panel.forms import CustomerMessageForm, MessageReplyForm
 from accounts.admin_panel.decorators import admin_required
+from accounts.db_router import replica_reads
 
 @login_required
 @admin_required
+@replica_reads
 def message_list(request):
     """Display all customer messages with filtering options"""
     search_query = request.GET.get('search', '')
@@ -35,12 +37,9 @@ def message_list(request):
     elif status_filter == 'read':
         conversations = conversations.filter(is_read=True)
     
-    conversations = conversations.order_by('-created_at')
-    
     # Pagination
-    paginator = Paginator(conversations, 20)
-    page_number = request.GET.get('page', 1)
-    page_obj = paginator.get_page(page_number)
+    paginator = KeysetPaginator(conversations, 20, ordering=('-created_at',), approximate_count=True)
+    page_obj = paginator.get_page(request.GET.get('cursor'))
     
     # Count unread messages
     unread_count = CustomerMessage.objects.filter(
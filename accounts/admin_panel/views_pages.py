@@ -6,10 +6,12 @@ from django.db.models import Q
 from accounts.models import Page
 from .forms import PageForm
 from .decorators import permission_required_with_message
+from accounts.db_router import replica_reads
 
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_page')
+@replica_reads
 def page_list(request):
     search_query = request.GET.get('search', '')
     pages = Page.objects.all()
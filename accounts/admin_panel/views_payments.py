@@ -1,15 +1,17 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
-from django.core.paginator import Paginator
+from accounts.pagination import KeysetPaginator
 from django.db.models import Q
 from accounts.models import Payment
 from .decorators import permission_required_with_message
 from .forms_additions import PaymentForm
+from accounts.db_router import replica_reads
 
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_payment')
+@replica_reads
 def payment_list(request):
     search_query = request.GET.get('search', '')
     status = request.GET.get('status', '')
@@ -30,10 +32,8 @@ def payment_list(request):
     if payment_method:
         payments = payments.filter(payment_method=payment_method)
     
-    payments = payments.order_by('-created_at')
-    paginator = Paginator(payments, 10)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    paginator = KeysetPaginator(payments, 10, ordering=('-created_at',), approximate_count=True)
+    page_obj = paginator.get_page(request.GET.get('cursor'))
     
     return render(request, 'accounts/admin/payments/list.html', {
         'page_obj': page_obj,
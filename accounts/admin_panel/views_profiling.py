@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.contrib import messages
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.http import JsonResponse
+from django.shortcuts import render, redirect
+from accounts.profiling import store, LATENCY_BUCKETS_MS
+from accounts.tiered_cache import payload_cache
+
+
+@login_required
+@user_passes_test(lambda u: u.is_staff)
+def request_profiles(request):
+    if request.method == 'POST':
+        store.clear()
+        messages.success(request, 'Request profiles cleared.')
+        return redirect('request_profiles')
+
+    return render(request, 'accounts/admin/profiling/list.html', {
+        'profiles': store.summary(),
+        'window': store.window,
+        'buckets': LATENCY_BUCKETS_MS,
+        'profiling_enabled': getattr(settings, 'REQUEST_PROFILING', False),
+        'cache_stats': payload_cache.stats(),
+    })
+
+
+@login_required
+@user_passes_test(lambda u: u.is_staff)
+def request_profiles_json(request):
+    return JsonResponse({
+        'window': store.window,
+        'profiling_enabled': getattr(settings, 'REQUEST_PROFILING', False),
+        'profiles': store.summary(),
+        'payload_cache': payload_cache.stats(),
+    })
@@ -2,15 +2,18 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
 from django.core.paginator import Paginator
+from accounts.pagination import KeysetPaginator
 from django.db.models import Q
 from accounts.models import CustomerReviewStatic, TourReview
 from .forms import CustomerReviewStaticForm
 from .decorators import permission_required_with_message
 from .forms_additions import TourReviewForm
+from accounts.db_router import replica_reads
 
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_customerreviewstatic')
+@replica_reads
 def review_list(request):
     search_query = request.GET.get('search', '')
     reviews = CustomerReviewStatic.objects.all()
@@ -82,12 +85,13 @@ def review_delete(request, pk):
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_tourreview')
+@replica_reads
 def tour_review_list(request):
     search_query = request.GET.get('search', '')
     status = request.GET.get('status', '')
     rating_filter = request.GET.get('rating', '')
     
-    reviews = TourReview.objects.select_related('tour', 'customer', 'booking').all()
+    reviews = TourReview.objects.select_related('tour', 'customer__user', 'booking').all()
     
     if search_query:
         reviews = reviews.filter(
@@ -103,10 +107,8 @@ def tour_review_list(request):
     if rating_filter:
         reviews = reviews.filter(overall_rating=int(rating_filter))
     
-    reviews = reviews.order_by('-created_at')
-    paginator = Paginator(reviews, 10)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    paginator = KeysetPaginator(reviews, 10, ordering=('-created_at',), approximate_count=True)
+    page_obj = paginator.get_page(request.GET.get('cursor'))
     
     return render(request, 'accounts/admin/tour_reviews/list.html', {
         'page_obj': page_obj,
@@ -6,10 +6,12 @@ from django.db.models import Q
 from accounts.models import Slider
 from .forms import SliderForm
 from .decorators import permission_required_with_message
+from accounts.db_router import replica_reads
 
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_slider')
+@replica_reads
 def slider_list(request):
     search_query = request.GET.get('search', '')
     sliders = Slider.objects.all()
@@ -2,23 +2,22 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
 from django.core.paginator import Paginator
-from django.db.models import Q, Avg, Count, Value
-from django.db.models.functions import Coalesce
+from django.db import transaction
+from django.db.models import Q
 from accounts.models import Tour, TourImage, TourHighlight, TourIncluded, TourExcluded, TourItinerary, TourRequirement, TourFAQ, TourPricing, TourSchedule, TourBlackoutDate
 from .decorators import permission_required_with_message
 from .forms_additions import TourForm, TourImageForm, TourHighlightForm, TourIncludedForm, TourExcludedForm, TourItineraryForm, TourRequirementForm, TourFAQForm, TourPricingForm, TourScheduleForm, TourBlackoutDateForm
+from accounts.db_router import replica_reads
 
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_tour')
+@replica_reads
 def tour_list(request):
     search_query = request.GET.get('search', '')
     status = request.GET.get('status', '')
     
-    tours = Tour.objects.select_related('supplier', 'category', 'destination_region', 'city').annotate(
-        calculated_average_rating=Coalesce(Avg('reviews__overall_rating'), Value(0.0)),
-        calculated_total_reviews=Count('reviews')
-    ).order_by('-id')
+    tours = Tour.objects.select_related('supplier', 'category', 'destination_region', 'city').order_by('-id')
     
     if search_query:
         tours = tours.filter(
@@ -116,6 +115,7 @@ def tour_view(request, pk):
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_tourimage')
+@replica_reads
 def tour_image_list(request, tour_id):
     tour = get_object_or_404(Tour, pk=tour_id)
     images = tour.images.all().order_by('display_order')
@@ -128,6 +128,7 @@ def tour_image_list(request, tour_id):
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_tourhighlight')
+@replica_reads
 def tour_highlights_list(request, tour_id):
     tour = get_object_or_404(Tour, pk=tour_id)
     highlights = tour.highlights.all().order_by('display_order')
@@ -221,11 +222,13 @@ def tour_image_set_primary(request, tour_id, image_id):
     
     if request.method == 'POST':
         try:
-            # Remove primary from all images for this tour
-            tour.images.all().update(is_primary=False)
-            # Set this image as primary
-            image.is_primary = True
-            image.save()
+            # One commit, so the tour's card image is refreshed once with the new primary
+            with transaction.atomic():
+                # Remove primary from all images for this tour
+                tour.images.all().update(is_primary=False)
+                # Set this image as primary
+                image.is_primary = True
+                image.save()
             messages.success(request, 'Image set as primary!')
         except Exception as e:
             messages.error(request, f'Error setting primary image: {str(e)}')
@@ -315,6 +318,7 @@ def tour_highlight_delete(request, tour_id, highlight_id):
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_tourincluded')
+@replica_reads
 def tour_included_list(request, tour_id):
     tour = get_object_or_404(Tour, pk=tour_id)
     included_items = tour.included_items.all().order_by('display_order')
@@ -370,6 +374,7 @@ def tour_included_delete(request, tour_id, item_id):
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_tourexcluded')
+@replica_reads
 def tour_excluded_list(request, tour_id):
     tour = get_object_or_404(Tour, pk=tour_id)
     excluded_items = tour.excluded_items.all().order_by('display_order')
@@ -425,6 +430,7 @@ def tour_excluded_delete(request, tour_id, item_id):
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_touritinerary')
+@replica_reads
 def tour_itinerary_list(request, tour_id):
     tour = get_object_or_404(Tour, pk=tour_id)
     itinerary_steps = tour.itinerary_steps.all().order_by('step_number')
@@ -480,6 +486,7 @@ def tour_itinerary_delete(request, tour_id, step_id):
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_tourrequirement')
+@replica_reads
 def tour_requirement_list(request, tour_id):
     tour = get_object_or_404(Tour, pk=tour_id)
     requirements = tour.requirements.all().order_by('display_order')
@@ -535,6 +542,7 @@ def tour_requirement_delete(request, tour_id, req_id):
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_tourfaq')
+@replica_reads
 def tour_faq_list(request, tour_id):
     tour = get_object_or_404(Tour, pk=tour_id)
     faqs = tour.faqs.all().order_by('display_order')
@@ -590,6 +598,7 @@ def tour_faq_delete(request, tour_id, faq_id):
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_tourpricing')
+@replica_reads
 def tour_pricing_list(request, tour_id):
     tour = get_object_or_404(Tour, pk=tour_id)
     pricing_options = tour.pricing_options.all()
@@ -645,6 +654,7 @@ def tour_pricing_delete(request, tour_id, pricing_id):
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_tourschedule')
+@replica_reads
 def tour_schedule_list(request, tour_id):
     tour = get_object_or_404(Tour, pk=tour_id)
     schedules = tour.schedules.all().order_by('date', 'start_time')
@@ -700,6 +710,7 @@ def tour_schedule_delete(request, tour_id, schedule_id):
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_tourblackoutdate')
+@replica_reads
 def tour_blackout_list(request, tour_id):
     tour = get_object_or_404(Tour, pk=tour_id)
     blackout_dates = tour.blackout_dates.all().order_by('start_date')
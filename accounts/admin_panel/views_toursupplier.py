@@ -6,10 +6,12 @@ from accounts.admin_panel.forms import TourSupplierForm
 from django.db.models import Q
 from django.core.paginator import Paginator
 from .decorators import permission_required_with_message
+from accounts.db_router import replica_reads
 
 @login_required
 @user_passes_test(lambda u: u.is_staff)
 @permission_required_with_message('accounts.view_toursupplier')
+@replica_reads
 def tour_supplier_list(request):
     query = request.GET.get('q')
     suppliers_list = TourSupplier.objects.all().order_by('-created_at')
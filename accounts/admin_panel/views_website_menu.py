@@ -5,9 +5,11 @@ from django.core.paginator import Paginator
 from django.db.models import Q
 from accounts.models import WebsiteMenu
 from .forms import WebsiteMenuForm
+from accounts.db_router import replica_reads
 
 @login_required # turbo
 @user_passes_test(lambda u: u.is_staff)
+@replica_reads
 def website_menu_list(request):
     search_query = request.GET.get('search', '')
     menus = WebsiteMenu.objects.all()
@@ -76,6 +78,7 @@ from .forms import WebsiteSubMenuForm
 
 @login_required # turbo
 @user_passes_test(lambda u: u.is_staff)
+@replica_reads
 def website_submenu_list(request, menu_id):
     menu = get_object_or_404(WebsiteMenu, pk=menu_id)
     submenus = WebsiteSubMenu.objects.filter(menu=menu)
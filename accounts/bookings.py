@@ -0,0 +1,176 @@
+"""
+Booking creation with schedule seat reservation.
+
+Seats are reserved with a single conditional UPDATE on TourSchedule
+(``booked_slots + seats <= available_slots``) inside the same transaction
+that inserts the booking and its participants, so concurrent checkouts for
+the same departure can never oversell it: the losing request gets
+``ScheduleSoldOut`` and nothing is written. ``QuerySet.update()`` sends no
+signals, so ``move_seats`` reports the changed departures to the cache
+dependency registry itself; the cached tour detail then drops departures
+that just sold out.
+
+Booking numbers are derived from the booking's primary key, so they are
+unique without probing the table.
+"""
+import uuid
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Case, F, Value, When
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+
+class ScheduleSoldOut(Exception):
+    def __init__(self, schedule_id, seats_requested, seats_left):
+        self.schedule_id = schedule_id
+        self.seats_requested = seats_requested
+        self.seats_left = seats_left
+        if seats_left > 0:
+            message = f'Only {seats_left} seat(s) left on this departure, {seats_requested} requested.'
+        else:
+            message = 'This departure is sold out.'
+        super().__init__(message)
+
+
+def booking_number_for(booking):
+    """``BK`` + booking day (YYMMDD) + zero-padded id, e.g. BK25101800042"""
+    day = timezone.localdate(booking.created_at) if booking.created_at else timezone.localdate()
+    return f'BK{day:%y%m%d}{booking.pk:05d}'
+
+
+def reserve_seats(schedule_id, seats):
+    """Atomically take ``seats`` on a schedule. Returns False if they are not available."""
+    from .models import TourSchedule
+
+    updated = TourSchedule.objects.filter(
+        pk=schedule_id,
+        status='available',
+        booked_slots__lte=F('available_slots') - seats,
+    ).update(
+        booked_slots=F('booked_slots') + seats,
+        # Right-hand sides see the pre-update row
+        status=Case(
+            When(available_slots__lte=F('booked_slots') + seats, then=Value('full')),
+            default=F('status'),
+        ),
+        updated_at=timezone.now(),
+    )
+    return updated == 1
+
+
+def release_seats(schedule_id, seats):
+    from .models import TourSchedule
+
+    TourSchedule.objects.filter(pk=schedule_id).update(
+        booked_slots=Greatest(F('booked_slots') - seats, Value(0)),
+        status=Case(When(status='full', then=Value('available')), default=F('status')),
+        updated_at=timezone.now(),
+    )
+
+
+def seats_held(schedule_id, total_participants, status):
+    """``(schedule_id, seats)`` a booking in this state holds, or ``(None, 0)``"""
+    if not schedule_id or status == 'cancelled':
+        return None, 0
+    return schedule_id, total_participants
+
+
+def _raise_sold_out(schedule_id, seats):
+    from .models import TourSchedule
+
+    schedule = TourSchedule.objects.filter(pk=schedule_id).values('available_slots', 'booked_slots', 'status').first()
+    seats_left = 0
+    if schedule and schedule['status'] == 'available':
+        seats_left = max(schedule['available_slots'] - schedule['booked_slots'], 0)
+    raise ScheduleSoldOut(schedule_id, seats, seats_left)
+
+
+def _schedules_changed(schedule_ids, tour_id=None):
+    from .cache_deps import dependencies
+    from .models import TourSchedule
+
+    if tour_id is None:
+        tour_ids = list(
+            TourSchedule.objects.filter(pk__in=schedule_ids).values_list('tour_id', flat=True).distinct().order_by()
+        )
+    else:
+        tour_ids = [tour_id]
+    dependencies.changed(TourSchedule, tour_id=tour_ids)
+
+
+def move_seats(previous, current, tour_id=None):
+    """
+    Swap the seats held by a booking from ``previous`` to ``current`` (both
+    ``(schedule_id, seats)`` pairs, see ``seats_held``). Must run inside
+    ``transaction.atomic`` so a sold out target rolls the release back.
+    ``tour_id`` is the tour both schedules belong to, when the caller knows it.
+    """
+    if previous == current:
+        return
+    previous_schedule, previous_seats = previous
+    schedule_id, seats = current
+    changed = []
+    if previous_schedule and previous_seats:
+        release_seats(previous_schedule, previous_seats)
+        changed.append(previous_schedule)
+    if schedule_id and seats:
+        if not reserve_seats(schedule_id, seats):
+            _raise_sold_out(schedule_id, seats)
+        changed.append(schedule_id)
+    if changed:
+        _schedules_changed(changed, tour_id)
+
+
+def participant_rows(booking, participants):
+    from .models import BookingParticipant
+
+    return [
+        BookingParticipant(
+            booking=booking,
+            participant_type=participant.get('type', 'adult'),
+            first_name=participant.get('first_name', ''),
+            last_name=participant.get('last_name', ''),
+            age=participant.get('age') if participant.get('age') not in ('', None) else None,
+            email=participant.get('email', ''),
+            phone=participant.get('phone', ''),
+            special_requirements=participant.get('special_requirements', ''),
+            price=Decimal(participant.get('price') or '0'),
+        )
+        for participant in participants
+    ]
+
+
+def replace_participants(booking, participants):
+    from .models import BookingParticipant
+
+    booking.participants.all().delete()
+    BookingParticipant.objects.bulk_create(participant_rows(booking, participants))
+
+
+def create_booking(booking, participants):
+    """
+    Save an unsaved ``Booking`` (booking_number is assigned here) together
+    with its participants, reserving seats on ``booking.schedule`` first.
+
+    ``participants`` are dicts as posted by the booking forms (type,
+    first_name, ..., price). Raises ``ScheduleSoldOut`` without writing
+    anything when the schedule cannot take them.
+    """
+    from .models import Booking, BookingParticipant
+
+    booking.total_participants = len(participants)
+    with transaction.atomic():
+        move_seats(
+            (None, 0), seats_held(booking.schedule_id, booking.total_participants, booking.status),
+            tour_id=booking.tour_id,
+        )
+
+        booking.booking_number = f'TMP-{uuid.uuid4().hex}'
+        booking.save()
+        booking.booking_number = booking_number_for(booking)
+        Booking.objects.filter(pk=booking.pk).update(booking_number=booking.booking_number)
+
+        BookingParticipant.objects.bulk_create(participant_rows(booking, participants))
+    return booking
@@ -0,0 +1,152 @@
+"""
+Declarative cache dependencies.
+
+A cached computation declares the models it reads instead of wiring its own
+signal handlers::
+
+    tour_detail = dependencies.declare(
+        'tour_detail',
+        models=('accounts.Category', ...),                          # any row
+        keyed={'accounts.Tour': 'pk', 'accounts.TourImage': 'tour_id'},  # one tour's rows
+    )
+    payload_cache.get_or_set(key, build, tags=tour_detail.tags(tour_id))
+
+Entries are tagged with the computation's name and, for keyed computations,
+``name:key``. One post_save/post_delete/m2m_changed receiver for every model
+(connected from accounts/signals.py) maps a changed row to those tags: the
+name when the model is read as a whole, ``name:<field value>`` when it is
+keyed. Bumps are collected per thread and flushed once, deduplicated, when
+the transaction commits, so deleting a tour with hundreds of child rows or
+a bulk admin edit in one transaction bumps each tag once. When more than
+``KEY_LIMIT`` keys of one computation change together the whole computation
+is bumped instead. Loops that don't run in a transaction can be wrapped in
+``dependencies.batch()``. ``QuerySet.update()`` and ``bulk_create()`` send no
+signals; call ``dependencies.changed()`` after them. Changes queued by a
+transaction that rolls back are flushed with the next commit, which costs an
+extra invalidation at worst.
+"""
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+
+from django.db import transaction
+
+from .tiered_cache import payload_cache
+
+# Above this many keys of one computation in a flush, bump the computation as a whole
+KEY_LIMIT = 50
+
+
+class Dependency:
+    def __init__(self, name):
+        self.name = name
+
+    def tags(self, key=None):
+        if key is None:
+            return (self.name,)
+        return (self.name, f'{self.name}:{key}')
+
+
+class _Pending(threading.local):
+    def __init__(self):
+        self.names = set()
+        self.keys = defaultdict(set)
+        self.depth = 0
+
+
+class DependencyRegistry:
+    def __init__(self):
+        self.dependencies = {}
+        # model label -> [(dependency, key field or None)]
+        self._readers = defaultdict(list)
+        self._pending = _Pending()
+
+    def declare(self, name, models=(), keyed=None):
+        """Register a cached computation reading every row of ``models`` and, per key, the ``keyed`` rows"""
+        if name in self.dependencies:
+            raise ValueError(f'Cache dependency {name!r} is already declared')
+        dependency = self.dependencies[name] = Dependency(name)
+        for label in models:
+            self._readers[label].append((dependency, None))
+        for label, field in (keyed or {}).items():
+            self._readers[label].append((dependency, field))
+        return dependency
+
+    def reads(self, model):
+        return model._meta.label in self._readers
+
+    def changed(self, model, instance=None, **keys):
+        """
+        Record a change to ``model`` rows: ``instance``, or the rows with the given
+        key values (``pk=[...]``, ``tour_id=5``); computations keyed on a field
+        that isn't given are bumped as a whole
+        """
+        pending = self._pending
+        for dependency, field in self._readers.get(model._meta.label, ()):
+            if field is None:
+                pending.names.add(dependency.name)
+            elif instance is not None:
+                pending.keys[dependency.name].add(getattr(instance, field))
+            elif field in keys:
+                values = keys[field]
+                pending.keys[dependency.name].update(values if isinstance(values, (list, tuple, set)) else [values])
+            else:
+                pending.names.add(dependency.name)
+        if pending.depth == 0:
+            # One callback per change; the first to run flushes and the rest find nothing pending
+            transaction.on_commit(self.flush, robust=True)
+
+    @contextmanager
+    def batch(self):
+        """Hold back the bumps of every change inside the block and flush them once at the end"""
+        self._pending.depth += 1
+        try:
+            yield
+        finally:
+            self._pending.depth -= 1
+            if self._pending.depth == 0:
+                transaction.on_commit(self.flush, robust=True)
+
+    def flush(self):
+        pending = self._pending
+        tags = set(pending.names)
+        for name, keys in pending.keys.items():
+            keys.discard(None)
+            if name in tags:
+                continue
+            if len(keys) > KEY_LIMIT:
+                tags.add(name)
+            else:
+                tags.update(f'{name}:{key}' for key in keys)
+        pending.names = set()
+        pending.keys = defaultdict(set)
+        if tags:
+            payload_cache.invalidate_tags(*sorted(tags))
+
+    def _saved(self, sender, instance, raw=False, **kwargs):
+        if not raw and self.reads(sender):
+            self.changed(sender, instance)
+
+    def _deleted(self, sender, instance, **kwargs):
+        if self.reads(sender):
+            self.changed(sender, instance)
+
+    def _m2m_changed(self, sender, instance, action, reverse, model, pk_set, **kwargs):
+        if action not in ('post_add', 'post_remove', 'post_clear'):
+            return
+        if self.reads(type(instance)):
+            self.changed(type(instance), instance)
+        if self.reads(model):
+            if pk_set:
+                self.changed(model, pk=list(pk_set))
+            else:
+                self.changed(model)
+
+    def connect(self):
+        from django.db.models.signals import m2m_changed, post_delete, post_save
+        post_save.connect(self._saved, dispatch_uid='cache_dependencies_save')
+        post_delete.connect(self._deleted, dispatch_uid='cache_dependencies_delete')
+        m2m_changed.connect(self._m2m_changed, dispatch_uid='cache_dependencies_m2m')
+
+
+dependencies = DependencyRegistry()
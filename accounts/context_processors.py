@@ -1,20 +1,14 @@
-from .models import SiteSetting, WebsiteMenu
+from .profiling import profiled_context_processor
+from .site_chrome import site_chrome
 
+@profiled_context_processor
 def site_settings(request):
     """
     Context processor to make site settings available to all templates
     """
-    settings = SiteSetting.get_settings()
-    website_menus = WebsiteMenu.objects.filter(status='active', section_type='header').prefetch_related('submenus').order_by('rank', '-created_at')
-
-    website_menus_footer = WebsiteMenu.objects.filter(status='active', section_type='footer').prefetch_related('submenus').order_by('rank', '-created_at')
-    
-    return {
-        'site_settings': settings,
-        'website_menus': website_menus,
-        'website_menus_footer': website_menus_footer
-    }
+    return site_chrome()
 
+@profiled_context_processor
 def current_language(request):
     """
     Context processor to make current language available to all templates
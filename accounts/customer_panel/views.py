@@ -37,7 +37,7 @@ def customer_dashboard(request):
     from django.utils import timezone
     
     customer = request.user.customer_profile
-    bookings = Booking.objects.filter(customer=customer)
+    bookings = Booking.objects.filter(customer=customer).select_related('tour')
     
     # Statistics
     total_bookings_count = bookings.count()
@@ -89,7 +89,7 @@ def customer_dashboard(request):
 @login_required
 @user_passes_test(lambda u: not u.is_staff)
 def customer_booking_list(request):
-    bookings = request.user.customer_profile.bookings.all().order_by('-created_at')
+    bookings = request.user.customer_profile.bookings.select_related('tour').order_by('-created_at')
     return render(request, 'accounts/customer/pages/customer_tour_booking_list.html', {'bookings': bookings})
 
 @login_required
@@ -98,7 +98,10 @@ def customer_booking_detail(request, booking_id):
     from accounts.models import Booking
     from django.shortcuts import get_object_or_404
     
-    booking = get_object_or_404(Booking, id=booking_id, customer__user=request.user)
+    booking = get_object_or_404(
+        Booking.objects.select_related('tour__city', 'tour__destination_region').prefetch_related('participants'),
+        id=booking_id, customer__user=request.user
+    )
     return render(request, 'accounts/customer/pages/customer_tour_booking_view.html', {'booking': booking})
 
 @login_required
@@ -155,7 +158,7 @@ def customer_reviews(request):
     from accounts.models import TourReview
     
     customer = request.user.customer_profile
-    reviews = TourReview.objects.filter(customer=customer).order_by('-created_at')
+    reviews = TourReview.objects.filter(customer=customer).select_related('tour__supplier').order_by('-created_at')
     
     context = {
         'reviews': reviews,
@@ -182,9 +185,12 @@ def customer_review_delete(request, review_id):
 @user_passes_test(lambda u: not u.is_staff)
 def customer_wishlist_page(request):
     from accounts.models import Wishlist
+    from accounts.tour_cards import CARD_RELATIONS, card_fields
     
     customer = request.user.customer_profile
-    wishlist_items = Wishlist.objects.filter(customer=customer).select_related('tour', 'tour__city', 'tour__destination_region').order_by('-created_at')
+    wishlist_items = Wishlist.objects.filter(customer=customer).select_related(
+        *[f'tour__{relation}' for relation in CARD_RELATIONS]
+    ).only('created_at', 'tour', *card_fields('tour__')).order_by('-created_at')
     
     context = {
         'wishlist_items': wishlist_items,
@@ -0,0 +1,83 @@
+"""
+Read replica routing.
+
+Views decorated with ``replica_reads`` (admin analytics and listings) read
+from the ``replica`` database alias while ``settings.READ_REPLICA`` is on.
+Every write, and every read outside those views, goes to ``default``. The
+replica is a copy of the primary refreshed by the ``sync_replica`` command,
+so it lags by up to the sync interval. ``PinPrimaryAfterWriteMiddleware``
+therefore sends a client's reads back to the primary for
+``READ_REPLICA_PIN_SECONDS`` after it posts a change, so that the list a
+form redirects to already shows the change. Reads whose results are written
+back (e.g. the dashboard's daily stats backfill) run inside ``primary_reads``.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+
+REPLICA = 'replica'
+PIN_COOKIE = 'primary_pin'
+
+_replica_reads = ContextVar('replica_reads', default=False)
+
+
+def replica_enabled():
+    return getattr(settings, 'READ_REPLICA', False) and REPLICA in settings.DATABASES
+
+
+def replica_reads(view_func):
+    """Route the view's reads to the replica unless the client just wrote something"""
+    @wraps(view_func)
+    def _wrapped_view(request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD') or PIN_COOKIE in request.COOKIES:
+            return view_func(request, *args, **kwargs)
+        token = _replica_reads.set(True)
+        try:
+            return view_func(request, *args, **kwargs)
+        finally:
+            _replica_reads.reset(token)
+    return _wrapped_view
+
+
+@contextmanager
+def primary_reads():
+    """Send the reads inside the block to ``default``, even within a ``replica_reads`` view"""
+    token = _replica_reads.set(False)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if _replica_reads.get() and replica_enabled():
+            return REPLICA
+        return None
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same rows
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica gets its schema from the primary along with the data
+        return db != REPLICA
+
+
+class PinPrimaryAfterWriteMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if request.method not in ('GET', 'HEAD', 'OPTIONS') and replica_enabled():
+            response.set_cookie(
+                PIN_COOKIE, '1', max_age=getattr(settings, 'READ_REPLICA_PIN_SECONDS', 60), httponly=True,
+                samesite='Lax',
+            )
+        return response
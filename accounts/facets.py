@@ -0,0 +1,177 @@
+"""
+In-memory facet index for the public tour list sidebar.
+
+Active tours are kept as bitmaps (Python ints, one bit per tour id) for each
+category, region, city, country and supplier. Facet counts are computed by
+intersecting bitmaps, so the sidebar costs no aggregate queries and its
+counts reflect the filters the visitor has already applied.
+
+The index is built lazily per process, patched in place by the Tour signals
+in accounts/signals.py and rebuilt when another process bumps its tag
+version in the payload cache (accounts/tiered_cache.py). Patching in place
+needs a cache backend with an atomic ``incr()`` (LocMemCache, Redis,
+Memcached); on others, such as the FileBasedCache in settings, every change
+rebuilds the index instead.
+"""
+import threading
+
+from .tiered_cache import payload_cache
+
+FACETS = ('category', 'region', 'city', 'country', 'supplier')
+
+VERSION_TAG = 'tour_facet_index'
+
+
+def ids_to_bitmap(ids):
+    ids = [int(pk) for pk in ids]
+    if not ids:
+        return 0
+    bits = bytearray(max(ids) // 8 + 1)
+    for pk in ids:
+        bits[pk >> 3] |= 1 << (pk & 7)
+    return int.from_bytes(bits, 'little')
+
+
+def _parse_id(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class TourFacetIndex:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._built = False
+        self._version = None
+        self._all = 0
+        self._tours = {}
+        self._postings = {facet: {} for facet in FACETS}
+
+    # Building and maintenance
+
+    def _facet_values(self, category_id, region_id, city_id, country_id, supplier_id):
+        return {
+            'category': category_id,
+            'region': region_id,
+            'city': city_id,
+            'country': country_id,
+            'supplier': supplier_id,
+        }
+
+    def _add(self, tour_id, values):
+        bit = 1 << tour_id
+        self._tours[tour_id] = values
+        self._all |= bit
+        for facet, value in values.items():
+            if value is not None:
+                postings = self._postings[facet]
+                postings[value] = postings.get(value, 0) | bit
+
+    def _discard(self, tour_id):
+        values = self._tours.pop(tour_id, None)
+        if values is None:
+            return
+        mask = ~(1 << tour_id)
+        self._all &= mask
+        for facet, value in values.items():
+            if value is not None:
+                postings = self._postings[facet]
+                postings[value] &= mask
+                if not postings[value]:
+                    del postings[value]
+
+    def build(self):
+        from .models import Tour
+
+        rows = Tour.objects.filter(status='active').values_list(
+            'id', 'category_id', 'destination_region_id', 'city_id', 'city__country_id', 'supplier_id'
+        )
+        with self._lock:
+            self._all = 0
+            self._tours = {}
+            self._postings = {facet: {} for facet in FACETS}
+            for tour_id, *values in rows:
+                self._add(tour_id, self._facet_values(*values))
+            self._built = True
+            self._version = self._current_version()
+
+    def _current_version(self):
+        return payload_cache.tag_versions((VERSION_TAG,))[0]
+
+    def _ensure_current(self):
+        if not self._built or self._current_version() != self._version:
+            self.build()
+
+    def _bump_version(self):
+        return payload_cache.bump_tag(VERSION_TAG)
+
+    def _patch(self, apply):
+        with self._lock:
+            previous = self._version
+            version = self._bump_version()
+            # Patch in place only if nobody else changed the index since our last sync. That needs an
+            # atomic bump: two read-then-write bumps can both return previous + 1 and each miss the other's change.
+            if payload_cache.atomic_bumps and self._built and previous is not None and version == previous + 1:
+                apply()
+                self._version = version
+            else:
+                self._built = False
+
+    def update_tour(self, tour):
+        """Re-index one tour after it was saved (status or any facet may have changed)"""
+        def apply():
+            self._discard(tour.pk)
+            if tour.status == 'active':
+                country_id = tour.city.country_id if tour.city_id else None
+                self._add(tour.pk, self._facet_values(
+                    tour.category_id, tour.destination_region_id, tour.city_id, country_id, tour.supplier_id
+                ))
+        self._patch(apply)
+
+    def remove_tour(self, tour_id):
+        self._patch(lambda: self._discard(tour_id))
+
+    def invalidate(self):
+        """Force a full rebuild on next use, in this and every other process"""
+        with self._lock:
+            self._bump_version()
+            self._built = False
+
+    # Queries
+
+    def counts(self, selected=None, base=None):
+        """
+        Facet counts conditioned on the current selection.
+
+        ``selected`` maps facet name to the chosen value (e.g. the ``category``
+        GET parameter); ``base`` is an optional bitmap of tours already
+        narrowed down by the non-facet filters (search, price, features...).
+        Each facet is counted against every other active selection but not its
+        own, so alternative values in the same facet keep meaningful counts.
+
+        Returns ``{facet: {value: count}}`` with zero counts omitted.
+        """
+        selected = {facet: _parse_id(value) for facet, value in (selected or {}).items() if value}
+        with self._lock:
+            self._ensure_current()
+            universe = self._all if base is None else self._all & base
+
+            result = {}
+            for facet in FACETS:
+                scope = universe
+                for other, value in selected.items():
+                    if other != facet and value is not None:
+                        scope &= self._postings[other].get(value, 0)
+
+                facet_counts = {}
+                if scope:
+                    for value, bitmap in self._postings[facet].items():
+                        count = (bitmap & scope).bit_count()
+                        if count:
+                            facet_counts[value] = count
+                result[facet] = facet_counts
+            return result
+
+
+tour_facets = TourFacetIndex()
@@ -0,0 +1,836 @@
+"""
+Synthetic data for performance tests and benchmarks.
+
+``LoadDataGenerator`` fills every model with plausible, deterministic data:
+the same seed on the same database produces the same rows, with timestamps
+relative to the time of the run (spread over the last two years, so the
+admin lists, rollups and date filters see a realistic history). Popular
+tours get most of the bookings, reviews and page views.
+
+The large tables (bookings and their participants, payments and
+notifications, reviews, votes, views, searches, tour details) are written
+with executemany from plain dicts; the small ones with chunked
+``bulk_create``. Each section keeps only the ids later sections need and
+free text comes from a fixed pool of generated sentences, so memory stays
+flat at millions of rows.
+
+Bulk inserts bypass the model signals, so the generator finishes by doing
+their work in bulk: tour ratings and booking totals, booked schedule slots,
+the search index and the daily stats rollup are recomputed in SQL and the
+cache is cleared. The generate_load_data command drives it from the shell.
+"""
+import random
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import time, timedelta
+from decimal import Decimal
+from itertools import accumulate
+
+from django.apps import apps
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connections, router, transaction
+from django.db.models import Count, F, IntegerField, Max, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+BATCH_SIZE = 1000
+
+# Generated sentences per length; ``_text()`` draws from these instead of building every string
+TEXT_POOL_SIZE = 64
+
+
+HISTORY_DAYS = 730
+
+WORDS = (
+    'harbour', 'castle', 'canal', 'viking', 'royal', 'old town', 'food', 'bike', 'design', 'island',
+    'fjord', 'palace', 'market', 'museum', 'sunset', 'nordic', 'brewery', 'garden', 'cathedral', 'lighthouse',
+)
+
+KINDS = ('walking tour', 'boat trip', 'day trip', 'tasting', 'bike ride', 'guided visit', 'private tour')
+
+FIRST_NAMES = ('Anna', 'Mads', 'Sofie', 'Lars', 'Emma', 'Jonas', 'Ida', 'Oliver', 'Freja', 'Noah', 'Clara', 'Lucas')
+
+LAST_NAMES = ('Jensen', 'Nielsen', 'Hansen', 'Pedersen', 'Andersen', 'Larsen', 'Smith', 'Garcia', 'Müller', 'Rossi')
+
+PLACES = (
+    ('Denmark', 'DK', 'DKK', ('Zealand', 'Jutland', 'Funen'), ('Copenhagen', 'Roskilde', 'Aarhus', 'Odense', 'Helsingør')),
+    ('Sweden', 'SE', 'SEK', ('Scania', 'Stockholm County'), ('Malmö', 'Stockholm', 'Lund')),
+    ('Norway', 'NO', 'NOK', ('Vestland', 'Oslo'), ('Bergen', 'Oslo')),
+)
+
+BOOKING_STATUSES = (('completed', 45), ('confirmed', 30), ('pending', 12), ('cancelled', 9), ('refunded', 2), ('no_show', 2))
+
+REVIEW_STATUSES = (('approved', 80), ('pending', 12), ('rejected', 5), ('flagged', 3))
+
+PARTICIPANT_COUNTS = ((1, 25), (2, 40), (3, 14), (4, 12), (5, 5), (6, 4))
+
+USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 14_2) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15',
+    'Mozilla/5.0 (iPhone; CPU iPhone OS 17_2 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148',
+    'Mozilla/5.0 (Linux; Android 14; Pixel 8) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Mobile Safari/537.36',
+)
+
+REFERRERS = ('', '', 'https://www.google.com/', 'https://www.tripadvisor.com/', 'https://www.facebook.com/')
+
+
+def _weighted(rng, pairs):
+    values, weights = zip(*pairs)
+    return rng.choices(values, weights)[0]
+
+
+def _chunks(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+@contextmanager
+def explicit_timestamps():
+    """Let bulk_create keep generated ``auto_now_add`` values instead of stamping now()"""
+    fields = [
+        field
+        for model in apps.get_app_config('accounts').get_models()
+        for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now_add', False)
+    ]
+    for field in fields:
+        field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field in fields:
+            field.auto_now_add = True
+
+
+class LoadDataGenerator:
+    """
+    ``LoadDataGenerator(seed=1).generate(tours=..., customers=..., ...)``
+    returns a Counter of rows created per model. Generated names, slugs and
+    numbers carry the seed, so different seeds can be loaded side by side;
+    loading the same seed twice fails on the unique columns.
+    """
+
+    def __init__(self, seed=1, batch_size=BATCH_SIZE, password=None, log=None):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.password = make_password(password)
+        self.log = log or (lambda message: None)
+        self.now = timezone.now()
+        self.today = timezone.localdate()
+        self.created = Counter()
+        self.texts = {}
+
+    def generate(self, tours=200, customers=500, bookings=2000, reviews=1000, schedules_per_tour=12,
+                 threads=None, blog_posts=30, views=None, searches=None):
+        threads = customers // 5 if threads is None else threads
+        views = bookings * 2 if views is None else views
+        searches = views // 4 if searches is None else searches
+        with transaction.atomic(), explicit_timestamps():
+            self.site_content()
+            self.geography()
+            self.suppliers_and_categories(max(3, tours // 25))
+            self.tours(tours)
+            self.tour_details(schedules_per_tour)
+            self.customers(customers)
+            self.coupons(max(10, bookings // 20000))
+            self.bookings(bookings, reviewable=reviews)
+            self.reviews(reviews)
+            self.messages(threads)
+            self.wishlists()
+            self.traffic(views, searches)
+            self.blog(blog_posts)
+            self.recompute()
+        cache.clear()
+        return self.created
+
+    # -- helpers -------------------------------------------------------
+
+    def _insert(self, model, rows, keep=None):
+        """
+        bulk_create ``rows`` (any iterable) in chunks and return the created
+        objects, or ``keep(obj)`` for each one, or nothing when ``keep`` is
+        False, so large tables are not held in memory.
+        """
+        kept = []
+        for chunk in _chunks(rows, self.batch_size):
+            created = self._write(model, chunk)
+            if keep is not False:
+                kept.extend(created if keep is None else map(keep, created))
+        self.log(f'{model.__name__}: {self.created[model.__name__]}')
+        return kept
+
+    def _write(self, model, objs):
+        created = model.objects.bulk_create(objs, batch_size=self.batch_size)
+        self.created[model.__name__] += len(created)
+        return created
+
+    def _insert_rows(self, model, rows):
+        """
+        INSERT ``rows`` (dicts keyed by attname; missing columns take their
+        default) with executemany. Skips building model instances and
+        bulk_create's per-statement parameter limit, for the large tables whose
+        new ids nothing reads back. Returns the row count.
+        """
+        db = connections[router.db_for_write(model)]
+        fields = [field for field in model._meta.concrete_fields if not field.primary_key]
+        quote = db.ops.quote_name
+        sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+            quote(model._meta.db_table), ', '.join(quote(field.column) for field in fields),
+            ', '.join(['%s'] * len(fields)),
+        )
+        defaults = {
+            field.attname: self.now if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False)
+            else field.get_default()
+            for field in fields
+        }
+        columns = [(field.attname, self._adapter(field, db)) for field in fields]
+        count = 0
+        with db.cursor() as cursor:
+            for chunk in _chunks(rows, self.batch_size):
+                values = [[row.get(name, defaults[name]) for name, prepare in columns] for row in chunk]
+                for position, (name, prepare) in enumerate(columns):
+                    if prepare:
+                        for row in values:
+                            if row[position] is not None:
+                                row[position] = prepare(row[position])
+                cursor.executemany(sql, values)
+                count += len(chunk)
+        self.created[model.__name__] += count
+        return count
+
+    @staticmethod
+    def _adapter(field, db):
+        """
+        What ``field.get_db_prep_save()`` does to an already valid value, or
+        None when the driver takes the value as it is
+        """
+        kind = field.get_internal_type()
+        if kind == 'DateTimeField':
+            return db.ops.adapt_datetimefield_value
+        if kind == 'DateField':
+            return db.ops.adapt_datefield_value
+        if kind == 'TimeField':
+            return db.ops.adapt_timefield_value
+        if kind == 'DecimalField':
+            return lambda value: db.ops.adapt_decimalfield_value(value, field.max_digits, field.decimal_places)
+        if kind == 'JSONField':
+            return lambda value: field.get_db_prep_save(value, db)
+        return None
+
+    def _past(self, max_days=HISTORY_DAYS, min_days=0):
+        """A timestamp between ``max_days`` and ``min_days`` ago, weighted towards recent days"""
+        span = max(max_days - min_days, 0)
+        days = min_days + span * (1 - self.rng.random() ** 0.6)
+        return self.now - timedelta(days=days, seconds=self.rng.randrange(86400))
+
+    def _name(self):
+        return self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+
+    def _text(self, words=20):
+        pool = self.texts.get(words)
+        if pool is None:
+            pool = self.texts[words] = [
+                ' '.join(self.rng.choice(WORDS) for _ in range(words)).capitalize() + '.'
+                for _ in range(TEXT_POOL_SIZE)
+            ]
+        return self.rng.choice(pool)
+
+    def _money(self, value):
+        return Decimal(value).quantize(Decimal('0.01'))
+
+    def _tag(self, name, index):
+        return f'load-{self.seed}-{name}-{index}'
+
+    # -- sections ------------------------------------------------------
+
+    def site_content(self):
+        from .models import (
+            SiteSetting, Slider, FAQ, Page, CustomerReviewStatic, WebsiteMenu, WebsiteSubMenu, ContactUs,
+        )
+        from django.contrib.auth.models import Group, Permission
+        from todo.models import Todo
+
+        group, created = Group.objects.get_or_create(name=self._tag('group', 0))
+        if created:
+            group.permissions.set(Permission.objects.filter(content_type__app_label='accounts', codename__startswith='view_'))
+            self.created['Group'] += 1
+
+        if not SiteSetting.objects.exists():
+            SiteSetting.objects.create(site_logo='settings/logo.png', site_logo_dark='settings/logo-dark.png')
+            self.created['SiteSetting'] += 1
+
+        self._insert(Slider, (
+            Slider(title=f'Discover {word}', subtitle=self._text(8), image='sliders/slider.jpg', display_order=index,
+                   created_at=self._past(60))
+            for index, word in enumerate(WORDS[:3])
+        ))
+        self._insert(FAQ, (
+            FAQ(qus_en=f'{self._text(6)}?', ans_en=self._text(30), display_order=index,
+                is_featured=index < 4, created_at=self._past())
+            for index in range(12)
+        ))
+        self.pages = self._insert(Page, (
+            Page(title=f'Page {index}', slug=self._tag('page', index), content=self._text(120),
+                 display_section=('header', 'footer', 'default')[index % 3], created_at=self._past())
+            for index in range(6)
+        ))
+        self._insert(CustomerReviewStatic, (
+            CustomerReviewStatic(name=' '.join(self._name()), address=self.rng.choice(PLACES)[0],
+                                 review=self._text(25), rating=self.rng.choice((4, 5, 5)), display_order=index,
+                                 created_at=self._past())
+            for index in range(12)
+        ))
+        menus = self._insert(WebsiteMenu, (
+            WebsiteMenu(title=word.title(), section_type=section, rank=index, link='/tour-list/',
+                        has_submenu=index % 2 == 0, created_at=self._past())
+            for index, (word, section) in enumerate(zip(WORDS[:8], ('header', 'footer') * 4))
+        ))
+        self._insert(WebsiteSubMenu, (
+            WebsiteSubMenu(menu=menu, title=f'{menu.title} {rank}', rank=rank, link='/tour-list/',
+                           created_at=self._past())
+            for menu in menus if menu.has_submenu
+            for rank in range(3)
+        ))
+        self._insert(Todo, (Todo(title=self._text(4), description=self._text(12)) for _ in range(5)))
+        self._insert(ContactUs, (
+            ContactUs(name=' '.join(self._name()), email=f'{self._tag("contact", index)}@example.com',
+                      subject=self._text(4), message=self._text(40), is_replied=self.rng.random() < 0.6,
+                      created_at=self._past())
+            for index in range(40)
+        ))
+
+    def geography(self):
+        from .models import Country, DestinationRegion, City
+
+        self.countries = self._insert(Country, (
+            Country(name=f'{name} ({self.seed})', code=code, currency_code=currency, created_at=self._past())
+            for name, code, currency, regions, cities in PLACES
+        ))
+        self.regions = self._insert(DestinationRegion, (
+            DestinationRegion(country=country, name=region, slug=self._tag('region', f'{country.code}-{index}'),
+                              is_popular=index == 0, created_at=self._past())
+            for country, place in zip(self.countries, PLACES)
+            for index, region in enumerate(place[3])
+        ))
+        regions = defaultdict(list)
+        for region in self.regions:
+            regions[region.country_id].append(region)
+        self.cities = self._insert(City, (
+            City(country=country, region=regions[country.pk][index % len(regions[country.pk])], name=city,
+                 slug=self._tag('city', f'{country.code}-{index}'), is_popular=index < 2,
+                 image='cities/city.jpg', created_at=self._past())
+            for country, place in zip(self.countries, PLACES)
+            for index, city in enumerate(place[4])
+        ))
+
+    def suppliers_and_categories(self, suppliers):
+        from .models import TourSupplier, Category
+
+        self.suppliers = self._insert(TourSupplier, (
+            TourSupplier(company_name=f'{self.rng.choice(WORDS).title()} Tours {index}', contact_name=' '.join(self._name()),
+                         email=f'{self._tag("supplier", index)}@example.com', phone='+45 1234 5678',
+                         address=self._text(5), country=self.rng.choice(self.countries), verified=index % 3 != 0,
+                         password=self.password, created_at=self._past())
+            for index in range(suppliers)
+        ))
+        self.categories = self._insert(Category, (
+            Category(name=kind.title(), slug=self._tag('category', index), display_order=index,
+                     is_featured=index < 4, created_at=self._past())
+            for index, kind in enumerate(KINDS)
+        ))
+
+    def tours(self, count):
+        from .models import Tour
+
+        def rows():
+            for index in range(count):
+                city = self.rng.choice(self.cities)
+                kind = self.rng.choice(KINDS)
+                title = f'{self.rng.choice(WORDS).title()} {kind} in {city.name} #{index}'
+                yield Tour(
+                    supplier=self.rng.choice(self.suppliers), category=self.rng.choice(self.categories),
+                    destination_region_id=city.region_id, city=city, title=title, slug=self._tag('tour', index),
+                    short_description=self._text(15), description=self._text(150),
+                    main_image='tours/tour.jpg' if self.rng.random() < 0.9 else None,
+                    duration_hours=self._money(self.rng.choice((1.5, 2, 3, 4, 6, 8))),
+                    min_participants=1, max_participants=self.rng.choice((8, 12, 20, 30)),
+                    difficulty_level=self.rng.choice(('easy', 'easy', 'moderate', 'challenging')),
+                    base_price=self._money(self.rng.randrange(150, 2500, 25)), meeting_point=self._text(6),
+                    languages_offered=['English', 'Danish'][:self.rng.randint(1, 2)],
+                    free_cancellation=self.rng.random() < 0.6, instant_confirmation=self.rng.random() < 0.5,
+                    status=_weighted(self.rng, (('active', 90), ('inactive', 4), ('draft', 6))),
+                    is_featured=self.rng.random() < 0.1, is_bestseller=self.rng.random() < 0.05,
+                    created_at=self._past(),
+                )
+
+        self.tour_list = self._insert(Tour, rows())
+        # Zipf-like popularity: a few tours take most of the bookings, reviews and views
+        popularity = [1 / (rank + 1) ** 0.8 for rank in range(len(self.tour_list))]
+        self.rng.shuffle(popularity)
+        self.tour_weights = popularity
+        self.active_tours = [tour for tour in self.tour_list if tour.status == 'active']
+        weights = dict(zip((tour.pk for tour in self.tour_list), popularity))
+        self.active_cum_weights = list(accumulate(weights[tour.pk] for tour in self.active_tours or self.tour_list))
+
+    def _popular_tour(self):
+        """An active tour, drawn by popularity"""
+        return self.rng.choices(self.active_tours or self.tour_list, cum_weights=self.active_cum_weights)[0]
+
+    def tour_details(self, schedules_per_tour):
+        from .models import (
+            TourImage, TourHighlight, TourIncluded, TourExcluded, TourItinerary, TourRequirement, TourFAQ,
+            TourPricing, TourSchedule, TourBlackoutDate,
+        )
+
+        tours = self.tour_list
+        self._insert_rows(TourImage, (
+            dict(tour_id=tour.pk, image='tours/gallery/tour.jpg', caption=self._text(4), display_order=order,
+                 is_primary=order == 0, created_at=tour.created_at)
+            for tour in tours for order in range(self.rng.randint(2, 6))
+        ))
+        self._insert_rows(TourHighlight, (
+            dict(tour_id=tour.pk, highlight=self._text(8), display_order=order, created_at=tour.created_at)
+            for tour in tours for order in range(self.rng.randint(3, 5))
+        ))
+        self._insert_rows(TourIncluded, (
+            dict(tour_id=tour.pk, item=self._text(4), display_order=order, created_at=tour.created_at)
+            for tour in tours for order in range(self.rng.randint(2, 5))
+        ))
+        self._insert_rows(TourExcluded, (
+            dict(tour_id=tour.pk, item=self._text(4), display_order=order, created_at=tour.created_at)
+            for tour in tours for order in range(self.rng.randint(1, 3))
+        ))
+        self._insert_rows(TourItinerary, (
+            dict(tour_id=tour.pk, step_number=step, title=self._text(3), description=self._text(25),
+                 created_at=tour.created_at)
+            for tour in tours for step in range(1, self.rng.randint(2, 6))
+        ))
+        self._insert_rows(TourRequirement, (
+            dict(tour_id=tour.pk, requirement=self._text(6), display_order=order, created_at=tour.created_at)
+            for tour in tours for order in range(self.rng.randint(1, 3))
+        ))
+        self._insert_rows(TourFAQ, (
+            dict(tour_id=tour.pk, question=f'{self._text(6)}?', answer=self._text(20), display_order=order,
+                 created_at=tour.created_at)
+            for tour in tours for order in range(self.rng.randint(1, 4))
+        ))
+
+        self.prices = defaultdict(dict)
+
+        def pricing_rows():
+            for tour in tours:
+                prices = self.prices[tour.pk]
+                prices['adult'] = tour.base_price
+                prices['child'] = self._money(tour.base_price * Decimal('0.5'))
+                if self.rng.random() < 0.4:
+                    prices['senior'] = self._money(tour.base_price * Decimal('0.8'))
+                for kind, price in prices.items():
+                    ages = {'adult': (18, None), 'child': (4, 17), 'senior': (65, None)}[kind]
+                    yield dict(tour_id=tour.pk, participant_type=kind, min_age=ages[0], max_age=ages[1], price=price,
+                               created_at=tour.created_at, updated_at=tour.created_at)
+
+        self._insert_rows(TourPricing, pricing_rows())
+
+        # Departures from a month ago to two months ahead, denser for popular tours
+        def schedule_rows():
+            for tour, weight in zip(tours, self.tour_weights):
+                count = max(1, round(schedules_per_tour * min(2.0, 0.5 + weight * 3)))
+                days = sorted(self.rng.sample(range(-30, 61), min(count, 91)))
+                for day in days:
+                    yield dict(
+                        tour_id=tour.pk, date=self.today + timedelta(days=day),
+                        start_time=time(self.rng.choice((9, 10, 13, 15))), available_slots=tour.max_participants,
+                        status='cancelled' if self.rng.random() < 0.02 else 'available',
+                        created_at=tour.created_at, updated_at=tour.created_at,
+                    )
+
+        self._insert_rows(TourSchedule, schedule_rows())
+        # ``(pk, date, start_time)`` per tour, all a booking needs from its departure
+        self.schedules = defaultdict(list)
+        departures = TourSchedule.objects.filter(tour__slug__startswith=self._tag('tour', '')).order_by('pk')
+        for tour_id, *schedule in departures.values_list('tour_id', 'pk', 'date', 'start_time').iterator():
+            self.schedules[tour_id].append(tuple(schedule))
+
+        self._insert_rows(TourBlackoutDate, (
+            dict(tour_id=tour.pk, start_date=self.today + timedelta(days=offset),
+                 end_date=self.today + timedelta(days=offset + self.rng.randint(0, 6)),
+                 reason='Private event', created_at=tour.created_at)
+            for tour in tours if self.rng.random() < 0.15
+            for offset in [self.rng.randint(5, 90)]
+        ))
+        for model in (TourImage, TourHighlight, TourIncluded, TourExcluded, TourItinerary, TourRequirement, TourFAQ,
+                      TourPricing, TourSchedule, TourBlackoutDate):
+            self.log(f'{model.__name__}: {self.created[model.__name__]}')
+
+    def customers(self, count):
+        from .models import Customer
+
+        self.customer_ids, self.customer_joined = [], []
+
+        def users():
+            for index in range(count):
+                first, last = self._name()
+                yield dict(username=self._tag('customer', index), email=f'{self._tag("customer", index)}@example.com',
+                           first_name=first, last_name=last, password=self.password, date_joined=self._past())
+
+        for chunk in _chunks(users(), self.batch_size):
+            self._insert_rows(User, chunk)
+            user_ids = dict(User.objects.filter(
+                username__in=[user['username'] for user in chunk]
+            ).values_list('username', 'pk'))
+            self._insert_rows(Customer, (
+                dict(user_id=user_ids[user['username']], phone=f'+45 {self.rng.randrange(10000000, 99999999)}',
+                     nationality=self.rng.choice(PLACES)[0], preferred_language=self.rng.choice(('en', 'en', 'dk')),
+                     created_at=user['date_joined'], updated_at=user['date_joined'])
+                for user in chunk
+            ))
+            joined = {user_ids[user['username']]: user['date_joined'] for user in chunk}
+            for user_id, customer_id in Customer.objects.filter(user_id__in=joined).order_by('pk').values_list(
+                'user_id', 'pk'
+            ):
+                self.customer_ids.append(customer_id)
+                self.customer_joined.append(joined[user_id])
+        for model in (User, Customer):
+            self.log(f'{model.__name__}: {self.created[model.__name__]}')
+
+    def coupons(self, count):
+        from .models import Coupon
+
+        self.coupon_list = self._insert(Coupon, (
+            Coupon(code=f'LOAD{self.seed}X{index}', discount_type=('percentage', 'fixed_amount')[index % 2],
+                   discount_value=Decimal(10 if index % 2 == 0 else 100), valid_from=self.now - timedelta(days=HISTORY_DAYS),
+                   valid_until=self.now + timedelta(days=90 * (index % 3 - 1) + 1), is_active=index != 7,
+                   usage_limit=None if index % 4 else 1000, created_at=self._past())
+            for index in range(count)
+        ))
+
+    def _coupon_for(self, created_at):
+        """A coupon that was valid and under its usage limit at ``created_at``, or None"""
+        coupon = self.rng.choice(self.coupon_list)
+        if not coupon.is_active or not coupon.valid_from <= created_at <= coupon.valid_until:
+            return None
+        if coupon.usage_limit is not None and coupon.used_count >= coupon.usage_limit:
+            return None
+        coupon.used_count += 1
+        return coupon
+
+    def bookings(self, count, reviewable=0):
+        """
+        Bookings with their participants, payments, coupon usages and
+        notifications, written one chunk at a time. Keeps a uniform sample of
+        up to ``reviewable`` completed bookings for ``reviews()``.
+        """
+        from .models import Booking, BookingParticipant, Payment, Coupon, CouponUsage, Notification
+
+        self.reviewable = []
+        completed = 0
+
+        def rows():
+            for index in range(count):
+                tour = self._popular_tour()
+                customer = self.rng.randrange(len(self.customer_ids))
+                joined = self.customer_joined[customer]
+                created_at = self._past(min(HISTORY_DAYS, max((self.now - joined).days, 1)))
+                schedules = self.schedules.get(tour.pk)
+                schedule = self.rng.choice(schedules) if schedules and self.rng.random() < 0.8 else None
+                tour_date = schedule[1] if schedule else (created_at + timedelta(days=self.rng.randint(1, 60))).date()
+                participants = _weighted(self.rng, PARTICIPANT_COUNTS)
+                types = ['adult'] + [
+                    'child' if self.rng.random() < 0.25 else 'adult' for _ in range(participants - 1)
+                ]
+                prices = [self.prices[tour.pk].get(kind, tour.base_price) for kind in types]
+                subtotal = sum(prices, Decimal(0))
+                coupon = self._coupon_for(created_at) if self.rng.random() < 0.05 else None
+                discount = Decimal(0)
+                if coupon:
+                    discount = (subtotal * coupon.discount_value / 100 if coupon.discount_type == 'percentage'
+                                else min(coupon.discount_value, subtotal))
+                    discount = self._money(discount)
+                status = _weighted(self.rng, BOOKING_STATUSES)
+                if tour_date > self.today and status in ('completed', 'no_show'):
+                    status = 'confirmed'
+                payment_status = {
+                    'completed': 'paid', 'confirmed': 'paid', 'no_show': 'paid', 'refunded': 'refunded',
+                    'pending': 'pending', 'cancelled': 'failed' if self.rng.random() < 0.3 else 'pending',
+                }[status]
+                first, last = self._name()
+                booking = dict(
+                    booking_number=f'LD{self.seed}-{index:08d}', customer_id=self.customer_ids[customer],
+                    tour_id=tour.pk, schedule_id=schedule and schedule[0], booking_date=created_at,
+                    tour_date=tour_date, tour_time=schedule[2] if schedule else None, total_participants=participants,
+                    participant_details={kind: types.count(kind) for kind in set(types)},
+                    subtotal=subtotal, discount_amount=discount, total_amount=subtotal - discount,
+                    contact_name=f'{first} {last}', contact_email=f'{self._tag("booking", index)}@example.com',
+                    contact_phone='+45 1234 5678', status=status, payment_status=payment_status,
+                    confirmed_at=created_at if status in ('confirmed', 'completed', 'no_show') else None,
+                    cancelled_at=created_at + timedelta(days=1) if status == 'cancelled' else None,
+                    created_at=created_at, updated_at=created_at,
+                )
+                yield booking, (types, prices, coupon, discount)
+
+        def payment_rows(bookings):
+            for booking in bookings:
+                status = {'paid': 'completed', 'refunded': 'refunded', 'failed': 'failed'}.get(booking['payment_status'])
+                if status is None:
+                    continue
+                paid_at = booking['created_at'] + timedelta(minutes=self.rng.randint(1, 120))
+                yield dict(
+                    booking_id=booking['id'], transaction_id=f'{booking["booking_number"]}-TX',
+                    payment_method=self.rng.choice(('credit_card', 'credit_card', 'stripe', 'paypal', 'bank_transfer')),
+                    amount=booking['total_amount'], status=status, card_last_four=f'{self.rng.randrange(10000):04d}',
+                    paid_at=paid_at if status != 'failed' else None,
+                    refunded_at=paid_at + timedelta(days=2) if status == 'refunded' else None,
+                    refund_amount=booking['total_amount'] if status == 'refunded' else None,
+                    created_at=paid_at, updated_at=paid_at,
+                )
+
+        for chunk in _chunks(rows(), self.batch_size):
+            bookings = [booking for booking, plan in chunk]
+            self._insert_rows(Booking, bookings)
+            # Booking numbers are zero padded, so the chunk is one range of the unique index
+            ids = dict(Booking.objects.filter(
+                booking_number__range=(bookings[0]['booking_number'], bookings[-1]['booking_number'])
+            ).values_list('booking_number', 'pk'))
+            for booking in bookings:
+                booking['id'] = ids[booking['booking_number']]
+
+            self._insert_rows(BookingParticipant, (
+                dict(booking_id=booking['id'], participant_type=kind, first_name=self.rng.choice(FIRST_NAMES),
+                     last_name=self.rng.choice(LAST_NAMES), age=self.rng.randint(4, 17) if kind == 'child' else None,
+                     price=price, created_at=booking['created_at'])
+                for booking, (types, prices, coupon, discount) in chunk
+                for kind, price in zip(types, prices)
+            ))
+            self._insert_rows(Payment, payment_rows(bookings))
+            self._insert_rows(CouponUsage, (
+                dict(coupon_id=coupon.pk, customer_id=booking['customer_id'], booking_id=booking['id'],
+                     discount_amount=discount, used_at=booking['created_at'])
+                for booking, (types, prices, coupon, discount) in chunk
+                if coupon
+            ))
+            self._insert_rows(Notification, (
+                dict(customer_id=booking['customer_id'], notification_type='booking_confirmation',
+                     title=f'Booking {booking["booking_number"]}', message=self._text(20), booking_id=booking['id'],
+                     tour_id=booking['tour_id'], is_read=self.rng.random() < 0.7, is_sent=True,
+                     sent_at=booking['created_at'], created_at=booking['created_at'])
+                for booking in bookings if booking['status'] != 'pending'
+            ))
+
+            # Reservoir sample of completed bookings to hang reviews on
+            for booking in bookings:
+                if booking['status'] != 'completed':
+                    continue
+                entry = (booking['id'], booking['tour_id'], booking['customer_id'], booking['created_at'])
+                completed += 1
+                if len(self.reviewable) < reviewable:
+                    self.reviewable.append(entry)
+                else:
+                    slot = self.rng.randrange(completed)
+                    if slot < reviewable:
+                        self.reviewable[slot] = entry
+
+        for model in (Booking, BookingParticipant, Payment, CouponUsage, Notification):
+            self.log(f'{model.__name__}: {self.created[model.__name__]}')
+        Coupon.objects.bulk_update(self.coupon_list, ['used_count'])
+
+    def reviews(self, count):
+        from .models import TourReview, ReviewHelpful
+
+        reviewable = self.reviewable
+        quality = {tour.pk: self.rng.uniform(-1.2, 0.6) for tour in self.active_tours or self.tour_list}
+        max_votes = len(self.customer_ids) - 1
+
+        def rows():
+            for index in range(count):
+                booking = reviewable.pop() if reviewable and self.rng.random() < 0.6 else None
+                if booking:
+                    booking_id, tour_id, customer_id, booked_at = booking
+                    created_at = booked_at + timedelta(days=self.rng.randint(1, 20))
+                else:
+                    booking_id, tour_id = None, self._popular_tour().pk
+                    customer_id = self.rng.choice(self.customer_ids)
+                    created_at = self._past()
+                created_at = min(created_at, self.now)
+                rating = min(5, max(1, round(self.rng.gauss(4.3 + quality.get(tour_id, 0), 0.9))))
+                status = _weighted(self.rng, REVIEW_STATUSES)
+                yield dict(
+                    tour_id=tour_id, customer_id=customer_id, booking_id=booking_id, overall_rating=rating,
+                    value_rating=min(5, max(1, rating + self.rng.choice((-1, 0, 0, 1)))),
+                    service_rating=min(5, max(1, rating + self.rng.choice((-1, 0, 0, 1)))),
+                    title=self._text(4), review=self._text(self.rng.randint(15, 80)),
+                    verified_booking=booking is not None, status=status,
+                    is_featured=rating == 5 and self.rng.random() < 0.05,
+                    helpful_count=min(int(self.rng.expovariate(0.5)), max_votes) if status == 'approved' else 0,
+                    created_at=created_at, updated_at=created_at,
+                )
+
+        newest = TourReview.objects.aggregate(newest=Max('pk'))['newest'] or 0
+        self._insert_rows(TourReview, rows())
+
+        # Other customers' votes on the new approved reviews: helpful_count of them helpful, a few not
+        def votes():
+            reviews = TourReview.objects.filter(pk__gt=newest, helpful_count__gt=0).order_by('pk').values_list(
+                'pk', 'customer_id', 'helpful_count', 'created_at'
+            )
+            for review_id, customer_id, helpful, created_at in reviews.iterator(chunk_size=self.batch_size):
+                size = min(helpful + sum(self.rng.random() < 0.15 for _ in range(helpful)), max_votes)
+                voters = [voter for voter in self.rng.sample(self.customer_ids, size + 1) if voter != customer_id]
+                for position, voter in enumerate(voters[:size]):
+                    yield dict(review_id=review_id, customer_id=voter, is_helpful=position < helpful,
+                               created_at=min(created_at + timedelta(days=self.rng.randint(1, 30)), self.now))
+
+        self._insert_rows(ReviewHelpful, votes())
+        for model in (TourReview, ReviewHelpful):
+            self.log(f'{model.__name__}: {self.created[model.__name__]}')
+        self.reviewable = []
+
+    def messages(self, threads):
+        from .models import CustomerMessage
+
+        admin = User.objects.filter(is_superuser=True).order_by('pk').first()
+        customers = self.rng.sample(self.customer_ids, min(threads, len(self.customer_ids)))
+        roots = self._insert(CustomerMessage, (
+            CustomerMessage(customer_id=customer_id, sender_type='customer', subject=self._text(5),
+                            message=self._text(30), is_read=self.rng.random() < 0.7, created_at=self._past(365))
+            for customer_id in customers
+        ), keep=lambda root: (root.pk, root.customer_id, root.subject, root.created_at))
+
+        def replies():
+            for root_id, customer_id, subject, created_at in roots:
+                for step in range(self.rng.choice((0, 1, 1, 2, 3, 4))):
+                    created_at = min(created_at + timedelta(hours=self.rng.randint(1, 48)), self.now)
+                    sender = 'admin' if step % 2 == 0 else 'customer'
+                    yield CustomerMessage(
+                        customer_id=customer_id, sender_type=sender, sender_admin=admin if sender == 'admin' else None,
+                        subject=f'Re: {subject}', message=self._text(25), parent_message_id=root_id,
+                        is_read=self.rng.random() < 0.8, created_at=created_at,
+                    )
+
+        self._insert(CustomerMessage, replies(), keep=False)
+
+    def wishlists(self):
+        from .models import Wishlist
+
+        tours = self.active_tours or self.tour_list
+
+        def rows():
+            for customer_id in self.customer_ids:
+                if self.rng.random() < 0.3:
+                    for tour in self.rng.sample(tours, min(len(tours), self.rng.randint(1, 6))):
+                        yield dict(customer_id=customer_id, tour_id=tour.pk, created_at=self._past(365))
+
+        self._insert_rows(Wishlist, rows())
+        self.log(f'Wishlist: {self.created["Wishlist"]}')
+
+    def traffic(self, views, searches):
+        """TourView rows for the tour pages and SearchLog rows for the search box"""
+        from .models import TourView, SearchLog
+
+        def visitor():
+            customer_id = self.rng.choice(self.customer_ids) if self.rng.random() < 0.3 else None
+            ip_address = f'{self.rng.randint(2, 223)}.{self.rng.randrange(256)}.{self.rng.randrange(256)}.{self.rng.randint(1, 254)}'
+            return customer_id, ip_address
+
+        def view_rows():
+            for _ in range(views):
+                customer_id, ip_address = visitor()
+                yield dict(tour_id=self._popular_tour().pk, customer_id=customer_id, ip_address=ip_address,
+                           user_agent=self.rng.choice(USER_AGENTS), referrer=self.rng.choice(REFERRERS),
+                           viewed_at=self._past(365))
+
+        def search_rows():
+            for _ in range(searches):
+                customer_id, ip_address = visitor()
+                city = self.rng.choice(self.cities)
+                query = ' '.join(self.rng.sample(WORDS, self.rng.choice((1, 1, 2, 3))))
+                filters = {'city': city.slug} if self.rng.random() < 0.3 else {}
+                if self.rng.random() < 0.2:
+                    filters['category'] = self.rng.choice(self.categories).slug
+                yield dict(customer_id=customer_id, search_query=query, filters=filters,
+                           results_count=int(self.rng.expovariate(1 / 40)), ip_address=ip_address,
+                           searched_at=self._past(365))
+
+        self._insert_rows(TourView, view_rows())
+        self._insert_rows(SearchLog, search_rows())
+        for model in (TourView, SearchLog):
+            self.log(f'{model.__name__}: {self.created[model.__name__]}')
+
+    def blog(self, count):
+        from .models import BlogPost, FeatureSection, FeatureSectionTour, Newsletter
+
+        author = User.objects.filter(is_staff=True).order_by('pk').first()
+        if author is None:
+            author = User.objects.create(username=self._tag('editor', 0), is_staff=True, password=self.password)
+            self.created['User'] += 1
+
+        def posts():
+            for index in range(count):
+                created_at = self._past()
+                status = _weighted(self.rng, (('published', 80), ('draft', 15), ('archived', 5)))
+                yield BlogPost(
+                    author=author, category=self.rng.choice(self.categories), title=f'{self._text(5)[:-1]} {index}',
+                    slug=self._tag('post', index), featured_image='blog/post.jpg', excerpt=self._text(20),
+                    content=self._text(300), status=status, is_featured=self.rng.random() < 0.2,
+                    view_count=int(self.rng.expovariate(0.01)),
+                    published_at=created_at if status == 'published' else None, created_at=created_at,
+                )
+
+        self._insert(BlogPost, posts())
+
+        sections = self._insert(FeatureSection, (
+            FeatureSection(title=f'{word.title()} favourites', short_description=self._text(10), rank=index,
+                           created_at=self._past())
+            for index, word in enumerate(WORDS[:3])
+        ))
+        tours = self.active_tours or self.tour_list
+        self._insert(FeatureSectionTour, (
+            FeatureSectionTour(feature_section=section, tour=tour, created_at=section.created_at)
+            for section in sections
+            for tour in self.rng.sample(tours, min(len(tours), 8))
+        ))
+        self._insert(Newsletter, (
+            Newsletter(email=f'{self._tag("customer", index)}@example.com', name=self.rng.choice(FIRST_NAMES),
+                       subscribed_at=joined, created_at=joined)
+            for index, joined in enumerate(self.customer_joined) if self.rng.random() < 0.15
+        ), keep=False)
+
+    def recompute(self):
+        """Denormalised columns, booked slots, search index and rollups the signals would have kept"""
+        from .models import Tour, TourSchedule, Booking
+        from .ratings import apply_rating_fixes, find_rating_drift
+        from .search import rebuild_index
+        from .stats import rebuild_daily_stats
+        from .tour_cards import refresh_card_images
+
+        apply_rating_fixes(find_rating_drift())
+
+        tours = Tour.objects.filter(slug__startswith=self._tag('tour', ''))
+        tours.update(total_bookings=Coalesce(Subquery(
+            Booking.objects.filter(tour=OuterRef('pk')).order_by().values('tour').annotate(total=Count('pk'))
+            .values('total'), output_field=IntegerField()
+        ), 0))
+        refresh_card_images(tours)
+
+        # Seats held as bookings.seats_held() counts them: every booking but the cancelled ones
+        schedules = TourSchedule.objects.filter(tour__slug__startswith=self._tag('tour', ''))
+        schedules.update(booked_slots=Coalesce(Subquery(
+            Booking.objects.filter(schedule=OuterRef('pk')).exclude(status='cancelled').order_by().values('schedule')
+            .annotate(seats=Sum('total_participants')).values('seats'), output_field=IntegerField()
+        ), 0))
+        schedules.filter(booked_slots__gt=F('available_slots')).update(available_slots=F('booked_slots'))
+        schedules.filter(status='available', booked_slots__gt=0, booked_slots__gte=F('available_slots')).update(
+            status='full'
+        )
+
+        rebuild_index()
+        start = timezone.localdate(self.now - timedelta(days=HISTORY_DAYS))
+        rebuild_daily_stats(start, self.today)
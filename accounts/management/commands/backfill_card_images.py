@@ -0,0 +1,27 @@
+import time
+from django.core.management.base import BaseCommand
+from accounts.models import Tour
+from accounts.tour_cards import refresh_card_images
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the card image and thumbnail stored on every tour'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tour', type=int, action='append', dest='tours', help='Only this tour id (repeatable)')
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        tours = Tour.objects.all()
+        if options['tours']:
+            tours = tours.filter(pk__in=options['tours'])
+
+        changed = refresh_card_images(tours)
+        without_image = tours.filter(card_image='').count()
+        without_thumbnail = tours.exclude(card_image='').filter(card_thumbnail='').count()
+        self.stdout.write(self.style.SUCCESS(
+            f'Updated {len(changed)} of {tours.count()} tours in {time.monotonic() - started:.2f}s '
+            f'({without_image} without an image, {without_thumbnail} without a thumbnail)'
+        ))
+        if without_thumbnail:
+            self.stdout.write('Run generate_renditions to render the missing thumbnails')
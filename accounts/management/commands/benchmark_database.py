@@ -0,0 +1,136 @@
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from accounts.models import Booking, TourSchedule
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+class Command(BaseCommand):
+    help = ('Runs concurrent booking list reads and seat updates against copies of the database, '
+            'with SQLite defaults and with the settings\' connection options')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8, help='Concurrent workers, like WSGI threads')
+        parser.add_argument('--seconds', type=float, default=5, help='Run time per configuration')
+        parser.add_argument('--write-ratio', type=float, default=0.2, help='Share of operations that write')
+
+    def profiles(self):
+        options = settings.DATABASES['default'].get('OPTIONS', {})
+        pragmas = [pragma.strip() for pragma in options.get('init_command', '').split(';') if pragma.strip()]
+        mode = options.get('transaction_mode')
+        return {
+            # What Django does without OPTIONS/CONN_MAX_AGE: rollback journal, 5s timeout,
+            # deferred transactions and a new connection per request
+            'defaults': {'setup': ['PRAGMA journal_mode=DELETE'], 'pragmas': [], 'timeout': 5,
+                         'begin': 'BEGIN', 'persistent': False},
+            'tuned': {'setup': pragmas, 'pragmas': pragmas, 'timeout': options.get('timeout', 5),
+                      'begin': f'BEGIN {mode}' if mode else 'BEGIN', 'persistent': True},
+        }
+
+    def queries(self):
+        compiler = Booking.objects.select_related('customer__user', 'tour', 'schedule').order_by(
+            '-created_at'
+        )[:20].query.get_compiler('default')
+        sql, params = compiler.as_sql()
+        return sql.replace('%s', '?'), params
+
+    def connect(self, path, profile):
+        connection = sqlite3.connect(path, timeout=profile['timeout'], isolation_level=None)
+        for pragma in profile['pragmas']:
+            connection.execute(pragma)
+        return connection
+
+    def run(self, path, profile, threads, seconds, write_ratio, schedule_ids):
+        read_sql, read_params = self.queries()
+        results = {'read': [], 'write': [], 'errors': 0}
+        lock = threading.Lock()
+        deadline = time.monotonic() + seconds
+        start = threading.Barrier(threads)
+
+        def worker(seed):
+            rng = random.Random(seed)
+            reads, writes, errors = [], [], 0
+            connection = self.connect(path, profile) if profile['persistent'] else None
+            start.wait()
+            while time.monotonic() < deadline:
+                conn = connection or self.connect(path, profile)
+                started = time.perf_counter()
+                try:
+                    if rng.random() < write_ratio:
+                        schedule_id = rng.choice(schedule_ids)
+                        conn.execute(profile['begin'])
+                        try:
+                            booked, = conn.execute(
+                                'SELECT booked_slots FROM accounts_tourschedule WHERE id = ?', (schedule_id,)
+                            ).fetchone()
+                            conn.execute(
+                                'UPDATE accounts_tourschedule SET booked_slots = ? WHERE id = ?', (booked, schedule_id)
+                            )
+                            conn.execute('COMMIT')
+                        except BaseException:
+                            conn.execute('ROLLBACK')
+                            raise
+                        writes.append((time.perf_counter() - started) * 1000)
+                    else:
+                        conn.execute(read_sql, read_params).fetchall()
+                        reads.append((time.perf_counter() - started) * 1000)
+                except sqlite3.OperationalError:
+                    errors += 1
+                finally:
+                    if conn is not connection:
+                        conn.close()
+            if connection:
+                connection.close()
+            with lock:
+                results['read'] += reads
+                results['write'] += writes
+                results['errors'] += errors
+
+        workers = [threading.Thread(target=worker, args=(seed,)) for seed in range(threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        return results
+
+    def handle(self, *args, **options):
+        threads, seconds, write_ratio = options['threads'], options['seconds'], options['write_ratio']
+        if threads < 1 or seconds <= 0 or not 0 <= write_ratio <= 1:
+            raise CommandError('--threads and --seconds must be positive and --write-ratio between 0 and 1')
+        if connections['default'].vendor != 'sqlite':
+            raise CommandError('The benchmark compares SQLite settings')
+        schedule_ids = list(TourSchedule.objects.values_list('pk', flat=True)[:5000])
+        if not schedule_ids or not Booking.objects.exists():
+            raise CommandError('The database has no bookings or schedules; run generate_load_data first')
+
+        source = sqlite3.connect(str(settings.DATABASES['default']['NAME']))
+        self.stdout.write(f'{threads} threads, {seconds:g}s each, {write_ratio:.0%} writes')
+        self.stdout.write(f'{"profile":<10} {"reads/s":>9} {"writes/s":>9} {"p95 read":>9} {"p95 write":>10} {"locked":>7}')
+        with tempfile.TemporaryDirectory() as directory:
+            for name, profile in self.profiles().items():
+                path = os.path.join(directory, f'{name}.sqlite3')
+                copy = sqlite3.connect(path)
+                source.backup(copy)
+                for pragma in profile['setup']:
+                    copy.execute(pragma)
+                copy.close()
+
+                results = self.run(path, profile, threads, seconds, write_ratio, schedule_ids)
+                self.stdout.write(
+                    f'{name:<10} {len(results["read"]) / seconds:>9.0f} {len(results["write"]) / seconds:>9.0f} '
+                    f'{percentile(results["read"], 0.95):>7.1f}ms {percentile(results["write"], 0.95):>8.1f}ms '
+                    f'{results["errors"]:>7}'
+                )
+        source.close()
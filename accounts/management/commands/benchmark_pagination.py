@@ -0,0 +1,75 @@
+import time
+from statistics import median
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.core.paginator import Paginator
+from accounts.models import Booking, Payment, TourReview, CustomerMessage
+from accounts.pagination import KeysetPaginator
+
+# The admin lists served by KeysetPaginator, with the querysets their views build
+LISTS = {
+    'bookings': lambda: Booking.objects.select_related('customer__user', 'tour', 'schedule'),
+    'payments': lambda: Payment.objects.select_related('booking', 'booking__customer', 'booking__tour'),
+    'tour-reviews': lambda: TourReview.objects.select_related('tour', 'customer__user'),
+    'messages': lambda: CustomerMessage.objects.filter(parent_message__isnull=True).select_related(
+        'customer__user', 'sender_admin'
+    ),
+}
+
+
+class Command(BaseCommand):
+    help = 'Compares offset (Paginator) and keyset (KeysetPaginator) page latency on an admin list'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--list', choices=sorted(LISTS), default='bookings')
+        parser.add_argument('--pages', type=int, nargs='+', default=[1, 100, 1000])
+        parser.add_argument('--per-page', type=int, default=10)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def timed(self, repeat, render):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            render()
+            timings.append((time.perf_counter() - started) * 1000)
+        return median(timings)
+
+    def handle(self, *args, **options):
+        per_page, repeat = options['per_page'], options['repeat']
+        if per_page < 1 or repeat < 1:
+            raise CommandError('--per-page and --repeat must be positive')
+
+        queryset = LISTS[options['list']]()
+        total = queryset.count()
+        self.stdout.write(f"{options['list']}: {total} rows, {per_page} per page, median of {repeat} runs (ms)")
+        self.stdout.write(f"{'page':>8} {'offset':>10} {'keyset':>10} {'keyset~':>10}")
+
+        for number in options['pages']:
+            offset = (number - 1) * per_page
+            if number < 1 or offset >= max(total, 1):
+                self.stdout.write(f'{number:>8} {"skipped (past the last page)":>32}')
+                continue
+
+            def offset_page():
+                page = Paginator(queryset.order_by('-created_at', '-pk'), per_page).get_page(number)
+                list(page)
+                return page.paginator.count
+
+            exact = KeysetPaginator(queryset, per_page, ordering=('-created_at',))
+            cursor = None
+            if offset:
+                previous_row = exact.queryset.order_by(*exact.ordering)[offset - 1]
+                cursor = exact.cursor_after(previous_row, offset)
+
+            def keyset_page(approximate):
+                paginator = KeysetPaginator(queryset, per_page, ordering=('-created_at',), approximate_count=approximate)
+                list(paginator.get_page(cursor))
+                return paginator.count
+
+            cache.clear()
+            offset_ms = self.timed(repeat, offset_page)
+            keyset_ms = self.timed(repeat, lambda: keyset_page(False))
+            approximate_ms = self.timed(repeat, lambda: keyset_page(True))
+            self.stdout.write(f'{number:>8} {offset_ms:>10.2f} {keyset_ms:>10.2f} {approximate_ms:>10.2f}')
+
+        self.stdout.write('keyset~ uses the capped, cached approximate count')
@@ -0,0 +1,124 @@
+import time
+from statistics import median
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count, Prefetch
+from accounts.models import Tour, FeatureSection, Wishlist
+from accounts.tour_cards import CARD_RELATIONS, card_fields, tour_cards
+
+RECOMMENDED = ('-is_featured', '-average_rating', '-created_at')
+
+
+def _tour_list(queryset, per_page):
+    return list(queryset.filter(status='active').order_by(*RECOMMENDED)[:per_page])
+
+
+def _feature_section(queryset, per_page, section):
+    return list(queryset.filter(
+        featuresectiontour__feature_section=section, status='active'
+    ).order_by('-created_at')[:per_page])
+
+
+def _home_sections(tour_queryset):
+    sections = FeatureSection.objects.filter(status='active').prefetch_related(
+        Prefetch('section_tours__tour', queryset=tour_queryset)
+    ).order_by('rank', '-created_at')
+    return [section_tour.tour for section in sections for section_tour in section.section_tours.all()]
+
+
+# Per surface, the queryset its view built before the card projection and the one it builds now
+SURFACES = {
+    'tour-list': (
+        lambda per_page, **kw: _tour_list(Tour.objects.select_related(
+            'supplier', 'category', 'destination_region', 'city'
+        ).prefetch_related('images', 'reviews'), per_page),
+        lambda per_page, **kw: _tour_list(tour_cards(), per_page),
+    ),
+    'feature-section': (
+        lambda per_page, section, **kw: _feature_section(Tour.objects.select_related(
+            'city', 'city__country', 'destination_region', 'category', 'supplier'
+        ).prefetch_related('images'), per_page, section),
+        lambda per_page, section, **kw: _feature_section(tour_cards(), per_page, section),
+    ),
+    'home-sections': (
+        lambda **kw: _home_sections(Tour.objects.select_related(
+            'supplier', 'city__country', 'destination_region'
+        ).prefetch_related('images')),
+        lambda **kw: _home_sections(tour_cards()),
+    ),
+    'wishlist': (
+        lambda customer_id, **kw: list(Wishlist.objects.filter(customer_id=customer_id).select_related(
+            'tour', 'tour__city', 'tour__destination_region'
+        )),
+        lambda customer_id, **kw: list(Wishlist.objects.filter(customer_id=customer_id).select_related(
+            *[f'tour__{relation}' for relation in CARD_RELATIONS]
+        ).only('created_at', 'tour', *card_fields('tour__'))),
+    ),
+}
+
+
+def value_size(value):
+    if value is None:
+        return 0
+    if isinstance(value, (str, bytes)):
+        return len(value.encode() if isinstance(value, str) else value)
+    return 8
+
+
+class Command(BaseCommand):
+    help = 'Compares rows and bytes fetched for one page of tour cards before and after the card projection'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--per-page', type=int, default=12)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def measure(self, load, repeat, **params):
+        statements = []
+
+        def record(execute, sql, sql_params, many, context):
+            statements.append((sql, sql_params))
+            return execute(sql, sql_params, many, context)
+
+        with connection.execute_wrapper(record):
+            load(**params)
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            load(**params)
+            timings.append((time.perf_counter() - started) * 1000)
+
+        rows = size = 0
+        with connection.cursor() as cursor:
+            for sql, sql_params in statements:
+                cursor.execute(sql, sql_params)
+                for row in cursor.fetchall():
+                    rows += 1
+                    size += sum(value_size(value) for value in row)
+        return len(statements), rows, size, median(timings)
+
+    def handle(self, *args, **options):
+        per_page, repeat = options['per_page'], options['repeat']
+        if per_page < 1 or repeat < 1:
+            raise CommandError('--per-page and --repeat must be positive')
+        if not Tour.objects.filter(status='active').exists():
+            raise CommandError('No active tours; run generate_load_data first')
+
+        section = FeatureSection.objects.filter(status='active').annotate(
+            tours=Count('section_tours')
+        ).order_by('-tours').first()
+        wishlist = Wishlist.objects.values('customer_id').annotate(items=Count('id')).order_by('-items').first()
+        params = {
+            'per_page': per_page,
+            'section': section,
+            'customer_id': wishlist['customer_id'] if wishlist else None,
+        }
+
+        self.stdout.write(f'{per_page} cards per page, median of {repeat} runs')
+        self.stdout.write(f'{"surface":<16} {"":<7} {"queries":>7} {"rows":>7} {"KB":>9} {"ms":>8}')
+        for name, (before, after) in SURFACES.items():
+            if (name == 'feature-section' and section is None) or (name == 'wishlist' and wishlist is None):
+                self.stdout.write(f'{name:<16} skipped (no data)')
+                continue
+            for label, load in (('before', before), ('after', after)):
+                queries, rows, size, ms = self.measure(load, repeat, **params)
+                self.stdout.write(f'{name:<16} {label:<7} {queries:>7} {rows:>7} {size / 1024:>9.1f} {ms:>8.1f}')
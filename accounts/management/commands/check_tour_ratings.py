@@ -0,0 +1,36 @@
+import time
+from django.core.management.base import BaseCommand
+from accounts.ratings import find_rating_drift, apply_rating_fixes
+
+
+class Command(BaseCommand):
+    help = 'Checks Tour.average_rating / total_reviews against approved reviews and optionally fixes drift'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--fix', action='store_true', help='Write the recomputed values for drifted tours')
+        parser.add_argument('--interval', type=int, default=0,
+                            help='Keep running, re-checking every N seconds (for a background worker)')
+        parser.add_argument('--chunk-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        while True:
+            self.check_ratings(options['fix'], options['chunk_size'])
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
+
+    def check_ratings(self, fix, chunk_size):
+        drift = list(find_rating_drift(chunk_size=chunk_size))
+        for tour, average, total in drift:
+            self.stdout.write(
+                f'Tour {tour.pk} "{tour.title}": stored {tour.average_rating}/{tour.total_reviews}, '
+                f'expected {average}/{total}'
+            )
+
+        if not drift:
+            self.stdout.write(self.style.SUCCESS('All tour ratings are consistent'))
+        elif fix:
+            count = apply_rating_fixes(drift)
+            self.stdout.write(self.style.SUCCESS(f'Fixed ratings for {count} tours'))
+        else:
+            self.stdout.write(self.style.WARNING(f'{len(drift)} tours have drifted ratings (run with --fix to repair)'))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+from accounts.query_plans import check_plans
+
+
+class Command(BaseCommand):
+    help = 'Runs EXPLAIN over the hot view queries and flags full table scans and whole-result sorts'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--strict', action='store_true', help='Exit with an error when any query is flagged')
+        parser.add_argument('--plans', action='store_true', help='Print every plan, not only the flagged ones')
+
+    def handle(self, *args, **options):
+        flagged = 0
+        for report in check_plans():
+            if report.problems:
+                flagged += 1
+                self.stdout.write(self.style.WARNING(f"{report.name}: {', '.join(report.problems)}"))
+            else:
+                self.stdout.write(f'{report.name}: ok')
+            if report.problems or options['plans']:
+                for line in report.plan:
+                    self.stdout.write(f'    {line}')
+
+        if flagged and options['strict']:
+            raise CommandError(f'{flagged} hot queries scan or sort whole tables')
+        self.stdout.write(self.style.SUCCESS(f'{flagged} flagged'))
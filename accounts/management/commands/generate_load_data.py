@@ -0,0 +1,54 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+from accounts.load_data import BATCH_SIZE, LoadDataGenerator
+
+
+class Command(BaseCommand):
+    help = 'Fills every model with deterministic synthetic data for load testing and benchmarks'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tours', type=int, default=1000)
+        parser.add_argument('--customers', type=int, default=5000)
+        parser.add_argument('--bookings', type=int, default=20000)
+        parser.add_argument('--reviews', type=int, help='Defaults to a third of --bookings')
+        parser.add_argument('--views', type=int, help='TourView rows. Defaults to twice --bookings')
+        parser.add_argument('--searches', type=int, help='SearchLog rows. Defaults to a quarter of --views')
+        parser.add_argument('--threads', type=int, help='Message threads. Defaults to a fifth of --customers')
+        parser.add_argument('--schedules-per-tour', type=int, default=12,
+                            help='Average departures per tour; popular tours get up to twice as many')
+        parser.add_argument('--blog-posts', type=int, default=30)
+        parser.add_argument('--seed', type=int, default=1,
+                            help='Same seed, same rows. Different seeds can be loaded side by side.')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help='Rows per bulk INSERT')
+        parser.add_argument('--password', help='Password for the generated customers and suppliers '
+                                               '(default: unusable)')
+
+    def handle(self, *args, **options):
+        counts = {name: options[name] for name in ('tours', 'customers', 'bookings', 'schedules_per_tour', 'batch_size')}
+        if any(value < 1 for value in counts.values()):
+            raise CommandError('--tours, --customers, --bookings, --schedules-per-tour and --batch-size must be positive')
+        reviews = options['reviews'] if options['reviews'] is not None else options['bookings'] // 3
+
+        started = time.monotonic()
+        verbose = options['verbosity'] > 1
+        generator = LoadDataGenerator(
+            seed=options['seed'], batch_size=options['batch_size'], password=options['password'],
+            log=lambda message: self.stdout.write(f'{time.monotonic() - started:>8.1f}s  {message}') if verbose else None,
+        )
+        try:
+            created = generator.generate(
+                tours=options['tours'], customers=options['customers'], bookings=options['bookings'],
+                reviews=reviews, schedules_per_tour=options['schedules_per_tour'], threads=options['threads'],
+                blog_posts=options['blog_posts'], views=options['views'], searches=options['searches'],
+            )
+        except IntegrityError as exc:
+            raise CommandError(f'Seed {options["seed"]} looks loaded already, pick another --seed ({exc})')
+
+        for model, count in sorted(created.items()):
+            self.stdout.write(f'{model:>22} {count:>10}')
+        elapsed = time.monotonic() - started
+        total = sum(created.values())
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {total} rows in {elapsed:.1f}s ({total / max(elapsed, 0.001):.0f} rows/s)'
+        ))
@@ -0,0 +1,77 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+from accounts import renditions
+from accounts.models import Tour
+from accounts.tour_cards import refresh_card_images
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp', '.avif', '.gif', '.bmp', '.tif', '.tiff'}
+
+
+def walk(storage, directory):
+    directories, files = storage.listdir(directory)
+    for name in files:
+        yield f'{directory}/{name}'
+    for child in directories:
+        yield from walk(storage, f'{directory}/{child}')
+
+
+class Command(BaseCommand):
+    help = 'Generates the resized renditions of the images already in media/'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 2, help='Images resized in parallel')
+        parser.add_argument('--force', action='store_true', help='Regenerate images that already have renditions')
+
+    def originals(self):
+        directories = set()
+        for model, fields in renditions.image_fields():
+            for name in fields:
+                directories.add(model._meta.get_field(name).upload_to.strip('/'))
+
+        names = set()
+        for directory in sorted(directories):
+            if not default_storage.exists(directory):
+                continue
+            for name in walk(default_storage, directory):
+                if os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS and not renditions.is_rendition(name):
+                    names.add(name)
+        return sorted(names)
+
+    def handle(self, *args, **options):
+        if options['workers'] < 1:
+            raise CommandError('--workers must be positive')
+
+        started = time.monotonic()
+        names = self.originals()
+        if not options['force']:
+            names = [
+                name for name in names
+                if not default_storage.exists(renditions.rendition_name(name, renditions.WIDTHS[0]))
+            ]
+        self.stdout.write(f'{len(names)} images to process with {options["workers"]} workers')
+
+        done = files = failed = 0
+        with ThreadPoolExecutor(max_workers=options['workers']) as pool:
+            futures = {pool.submit(renditions.generate, name): name for name in names}
+            for future in as_completed(futures):
+                try:
+                    widths = future.result()
+                except Exception as exc:
+                    failed += 1
+                    self.stderr.write(f'{futures[future]}: {exc}')
+                    continue
+                done += 1
+                files += len(widths) * len(renditions.FORMATS)
+                if options['verbosity'] > 1:
+                    self.stdout.write(f'{futures[future]}: {", ".join(map(str, widths)) or "too small"}')
+
+        # Tour cards point at the thumbnails that now exist
+        cards = len(refresh_card_images(Tour.objects.exclude(card_image=''))) if done else 0
+        self.stdout.write(self.style.SUCCESS(
+            f'Processed {done} images ({files} renditions, {failed} failed) in {time.monotonic() - started:.1f}s'
+        ))
+        if cards:
+            self.stdout.write(f'Updated the card thumbnail of {cards} tours')
@@ -0,0 +1,47 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Min
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from accounts.models import Booking, Payment, Customer, TourReview
+from accounts.stats import rebuild_daily_stats
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the DailyStats rollup used by the admin dashboard charts'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start', help='First day to rebuild (YYYY-MM-DD). Defaults to the oldest record.')
+        parser.add_argument('--end', help='Last day to rebuild (YYYY-MM-DD). Defaults to today.')
+        parser.add_argument('--days', type=int, help='Rebuild only the last N days')
+
+    def parse_day(self, value, name):
+        day = parse_date(value)
+        if day is None:
+            raise CommandError(f'Invalid --{name} value "{value}". Use YYYY-MM-DD.')
+        return day
+
+    def oldest_day(self):
+        oldest = [
+            model.objects.aggregate(oldest=Min('created_at'))['oldest']
+            for model in (Booking, Payment, Customer, TourReview)
+        ]
+        oldest = [value for value in oldest if value]
+        return timezone.localdate(min(oldest)) if oldest else None
+
+    def handle(self, *args, **options):
+        end = self.parse_day(options['end'], 'end') if options['end'] else timezone.localdate()
+        if options['days']:
+            start = end - timedelta(days=options['days'] - 1)
+        elif options['start']:
+            start = self.parse_day(options['start'], 'start')
+        else:
+            start = self.oldest_day()
+            if start is None:
+                self.stdout.write(self.style.SUCCESS('Nothing to roll up'))
+                return
+        if start > end:
+            raise CommandError('--start must not be after --end')
+
+        days = rebuild_daily_stats(start, end)
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt daily stats for {days} days ({start} to {end})'))
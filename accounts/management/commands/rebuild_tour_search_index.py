@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from accounts import search
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the full-text search index for all tours'
+
+    def handle(self, *args, **kwargs):
+        if not search.is_supported():
+            self.stdout.write(self.style.WARNING('Tour search index is not supported on this database backend'))
+            return
+
+        count = search.rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f'Successfully indexed {count} tours'))
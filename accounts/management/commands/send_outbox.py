@@ -0,0 +1,36 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+from accounts import outbox
+
+
+class Command(BaseCommand):
+    help = 'Sends queued notification emails in batches, retrying failures with backoff'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=outbox.BATCH_SIZE, help='Messages per SMTP connection')
+        parser.add_argument('--max-attempts', type=int, default=outbox.MAX_ATTEMPTS,
+                            help='Give up on a message after this many failures')
+        parser.add_argument('--loop', action='store_true', help='Keep polling instead of exiting once the queue is empty')
+        parser.add_argument('--interval', type=float, default=10, help='Seconds between polls with --loop')
+
+    def handle(self, *args, **options):
+        batch_size, max_attempts = options['batch_size'], options['max_attempts']
+        if batch_size < 1 or max_attempts < 1:
+            raise CommandError('--batch-size and --max-attempts must be positive')
+
+        total_sent = total_failed = 0
+        while True:
+            sent, failed = outbox.send_pending(batch_size, max_attempts)
+            total_sent += sent
+            total_failed += failed
+            if sent or failed:
+                self.stdout.write(f'Sent {sent}, failed {failed}')
+            if sent + failed == batch_size:
+                continue
+            if not options['loop']:
+                break
+            close_old_connections()
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS(f'Done: {total_sent} sent, {total_failed} failed'))
@@ -0,0 +1,91 @@
+import os
+import re
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management.base import BaseCommand, CommandError
+from django.template import engines
+from accounts.static_storage import BUNDLE_BLOCK, BUNDLE_DIR, STATIC_REFERENCE, compressed_size
+
+EXTENDS = re.compile(r'{%\s*extends\s+["\']([^"\']+)["\']')
+INCLUDE = re.compile(r'{%\s*include\s+["\']([^"\']+)["\']')
+ASSET_EXTENSIONS = ('.css', '.js')
+
+
+def parse_templates():
+    """``{template name: (parents and includes, loose assets, bundles)}`` for every template on disk"""
+    templates = {}
+    for engine in engines.all():
+        for directory in getattr(engine, 'template_dirs', ()):
+            for root, dirs, files in os.walk(directory):
+                for filename in files:
+                    if not filename.endswith('.html'):
+                        continue
+                    path = os.path.join(root, filename)
+                    name = os.path.relpath(path, directory).replace(os.sep, '/')
+                    with open(path, encoding='utf-8') as template:
+                        source = template.read()
+                    bundles = dict(BUNDLE_BLOCK.findall(source))
+                    loose = STATIC_REFERENCE.findall(BUNDLE_BLOCK.sub('', source))
+                    templates.setdefault(name, (
+                        EXTENDS.findall(source) + INCLUDE.findall(source),
+                        [asset for asset in loose if asset.endswith(ASSET_EXTENSIONS)],
+                        {bundle: STATIC_REFERENCE.findall(block) for bundle, block in bundles.items()},
+                    ))
+    return templates
+
+
+class Command(BaseCommand):
+    help = 'Shows, per page template, the CSS/JS requests and bytes saved by bundling, hashing and precompression'
+
+    def handle(self, *args, **options):
+        if not getattr(staticfiles_storage, 'hashed_files', None):
+            raise CommandError('No static manifest found; run collectstatic first')
+
+        templates = parse_templates()
+        referenced = {child for children, loose, bundles in templates.values() for child in children}
+
+        def closure(name, seen):
+            if name in seen or name not in templates:
+                return
+            seen.add(name)
+            for child in templates[name][0]:
+                closure(child, seen)
+
+        def raw_size(path):
+            found = finders.find(path)
+            return os.path.getsize(found) if found else None
+
+        def served_size(path):
+            return compressed_size(staticfiles_storage.path(staticfiles_storage.stored_name(path)))
+
+        self.stdout.write(f'{"template":<60} {"requests":>10} {"before KB":>10} {"after KB":>10} {"saved":>6}')
+        total_before = total_after = 0
+        for name in sorted(set(templates) - referenced):
+            seen = set()
+            closure(name, seen)
+            loose, bundles = [], {}
+            for template in seen:
+                loose.extend(templates[template][1])
+                bundles.update(templates[template][2])
+
+            bundled = {asset for assets in bundles.values() for asset in assets}
+            before = {asset: raw_size(asset) for asset in set(loose) | bundled}
+            before = {asset: size for asset, size in before.items() if size is not None}
+            if not before:
+                continue
+            after = [served_size(asset) for asset in set(loose) - bundled if asset in before]
+            after += [served_size(f'{BUNDLE_DIR}/{bundle}') for bundle in bundles]
+
+            before_bytes, after_bytes = sum(before.values()), sum(after)
+            total_before += before_bytes
+            total_after += after_bytes
+            self.stdout.write(
+                f'{name:<60} {len(before):>4} -> {len(after):<3} {before_bytes / 1024:>10.0f} '
+                f'{after_bytes / 1024:>10.0f} {100 - after_bytes * 100 / before_bytes:>5.0f}%'
+            )
+
+        if total_before:
+            self.stdout.write(self.style.SUCCESS(
+                f'All pages: {total_before / 1024:.0f} KB -> {total_after / 1024:.0f} KB '
+                f'({100 - total_after * 100 / total_before:.0f}% saved)'
+            ))
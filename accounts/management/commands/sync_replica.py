@@ -0,0 +1,41 @@
+import sqlite3
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from accounts.db_router import REPLICA
+
+
+class Command(BaseCommand):
+    help = 'Copies the primary SQLite database into the read replica with the online backup API'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true', help='Keep syncing instead of exiting after one copy')
+        parser.add_argument('--interval', type=float, default=30,
+                            help='Seconds between copies with --loop; keep it under READ_REPLICA_PIN_SECONDS')
+
+    def sync(self, source_path, replica_path):
+        started = time.monotonic()
+        source = sqlite3.connect(source_path, timeout=20)
+        replica = sqlite3.connect(replica_path, timeout=20)
+        try:
+            # Copied in place under the replica's write lock, so open readers see the old or the new snapshot
+            source.backup(replica)
+        finally:
+            replica.close()
+            source.close()
+        return time.monotonic() - started
+
+    def handle(self, *args, **options):
+        if REPLICA not in settings.DATABASES:
+            raise CommandError(f'No {REPLICA!r} database is configured')
+        primary, replica = connections['default'].settings_dict, connections[REPLICA].settings_dict
+        if primary['ENGINE'] != 'django.db.backends.sqlite3' or replica['ENGINE'] != primary['ENGINE']:
+            raise CommandError('sync_replica only copies SQLite databases; use the database server\'s replication')
+
+        while True:
+            elapsed = self.sync(str(primary['NAME']), str(replica['NAME']))
+            self.stdout.write(f'Replica synced in {elapsed:.2f}s')
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
@@ -1,23 +1,75 @@
-from django.core.management.base import BaseCommand
-from django.db.models import Avg, Count
-from accounts.models import Tour
+import re
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime, parse_date
+from accounts.models import TourReview
+from accounts.ratings import find_rating_drift, apply_rating_fixes
+
+RELATIVE_SINCE_RE = re.compile(r'^(\d+)([mhd])$')
+RELATIVE_UNITS = {'m': 'minutes', 'h': 'hours', 'd': 'days'}
+
+
+def parse_since(value):
+    """Accept an ISO date/datetime or a relative window such as 15m, 2h or 1d"""
+    match = RELATIVE_SINCE_RE.match(value)
+    if match:
+        return timezone.now() - timedelta(**{RELATIVE_UNITS[match.group(2)]: int(match.group(1))})
+
+    since = parse_datetime(value)
+    if since is None:
+        day = parse_date(value)
+        if day is None:
+            raise CommandError(f'Invalid --since value "{value}". Use an ISO date/datetime or e.g. 15m, 2h, 1d.')
+        since = timezone.datetime(day.year, day.month, day.day)
+    if timezone.is_naive(since):
+        since = timezone.make_aware(since)
+    return since
+
 
 class Command(BaseCommand):
     help = 'Updates average rating and total reviews for all tours'
 
-    def handle(self, *args, **kwargs):
-        tours = Tour.objects.all()
-        count = 0
-        for tour in tours:
-            reviews = tour.reviews.filter(status='approved')
-            stats = reviews.aggregate(
-                avg_rating=Avg('overall_rating'),
-                review_count=Count('id')
+    def add_arguments(self, parser):
+        parser.add_argument('--since', help='Only recompute tours whose reviews changed after this watermark '
+                                            '(ISO date/datetime, or relative like 15m, 2h, 1d). Deleted reviews '
+                                            'are handled by the review signal, not by this mode.')
+        parser.add_argument('--dry-run', action='store_true', help='Report the changes without writing them')
+        parser.add_argument('--batch-size', type=int, default=500, help='Rows per bulk UPDATE')
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+
+        tour_ids = None
+        if options['since']:
+            since = parse_since(options['since'])
+            tour_ids = list(
+                TourReview.objects.filter(updated_at__gte=since)
+                .values_list('tour_id', flat=True).distinct().order_by()
             )
-            
-            tour.average_rating = stats['avg_rating'] or 0
-            tour.total_reviews = stats['review_count'] or 0
-            tour.save(update_fields=['average_rating', 'total_reviews'])
-            count += 1
-            
-        self.stdout.write(self.style.SUCCESS(f'Successfully updated ratings for {count} tours'))
+            self.stdout.write(f'{len(tour_ids)} tours with reviews changed since {since.isoformat()}')
+            if not tour_ids:
+                self.stdout.write(self.style.SUCCESS('Nothing to update'))
+                return
+
+        changes = list(find_rating_drift(tour_ids, chunk_size=options['batch_size']))
+        scanned = time.monotonic()
+
+        if options['dry_run']:
+            for tour, average, total in changes:
+                self.stdout.write(
+                    f'Tour {tour.pk}: average_rating {tour.average_rating} -> {average}, '
+                    f'total_reviews {tour.total_reviews} -> {total}'
+                )
+            self.stdout.write(self.style.WARNING(
+                f'Dry run: {len(changes)} tours would be updated (scan {scanned - started:.2f}s)'
+            ))
+            return
+
+        count = apply_rating_fixes(changes, batch_size=options['batch_size'])
+        finished = time.monotonic()
+        self.stdout.write(self.style.SUCCESS(
+            f'Successfully updated ratings for {count} tours '
+            f'(scan {scanned - started:.2f}s, write {finished - scanned:.2f}s, total {finished - started:.2f}s)'
+        ))
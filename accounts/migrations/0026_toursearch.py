@@ -0,0 +1,78 @@
+from django.db import migrations
+
+
+SQLITE_CREATE = """
+CREATE VIRTUAL TABLE IF NOT EXISTS accounts_toursearch USING fts5(
+    title, title_dk,
+    short_description, short_description_dk,
+    description, description_dk,
+    location,
+    tokenize = 'unicode61 remove_diacritics 2'
+)
+"""
+
+SQLITE_POPULATE = """
+INSERT INTO accounts_toursearch (
+    rowid, title, title_dk, short_description, short_description_dk,
+    description, description_dk, location
+)
+SELECT t.id, t.title, t.title_dk, t.short_description, t.short_description_dk,
+       t.description, t.description_dk,
+       TRIM(COALESCE(c.name, '') || ' ' || COALESCE(c.name_dk, '') || ' ' ||
+            COALESCE(r.name, '') || ' ' || COALESCE(r.name_dk, ''))
+FROM accounts_tour t
+LEFT JOIN accounts_city c ON c.id = t.city_id
+LEFT JOIN accounts_destinationregion r ON r.id = t.destination_region_id
+"""
+
+POSTGRES_CREATE = """
+CREATE TABLE IF NOT EXISTS accounts_toursearch (
+    tour_id bigint PRIMARY KEY REFERENCES accounts_tour (id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED,
+    document tsvector NOT NULL
+);
+CREATE INDEX IF NOT EXISTS accounts_toursearch_document_gin ON accounts_toursearch USING GIN (document);
+"""
+
+POSTGRES_POPULATE = """
+INSERT INTO accounts_toursearch (tour_id, document)
+SELECT t.id,
+       setweight(to_tsvector('english', t.title), 'A') ||
+       setweight(to_tsvector('danish', t.title_dk), 'A') ||
+       setweight(to_tsvector('english', t.short_description), 'B') ||
+       setweight(to_tsvector('danish', t.short_description_dk), 'B') ||
+       setweight(to_tsvector('english', t.description), 'C') ||
+       setweight(to_tsvector('danish', t.description_dk), 'C') ||
+       setweight(to_tsvector('simple',
+           COALESCE(c.name, '') || ' ' || COALESCE(c.name_dk, '') || ' ' ||
+           COALESCE(r.name, '') || ' ' || COALESCE(r.name_dk, '')), 'A')
+FROM accounts_tour t
+LEFT JOIN accounts_city c ON c.id = t.city_id
+LEFT JOIN accounts_destinationregion r ON r.id = t.destination_region_id
+ON CONFLICT (tour_id) DO NOTHING
+"""
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute(SQLITE_CREATE)
+        schema_editor.execute(SQLITE_POPULATE)
+    elif vendor == 'postgresql':
+        schema_editor.execute(POSTGRES_CREATE)
+        schema_editor.execute(POSTGRES_POPULATE)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor in ('sqlite', 'postgresql'):
+        schema_editor.execute('DROP TABLE IF EXISTS accounts_toursearch')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0025_sitesetting_site_logo_dark_toursupplier_password'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,40 @@
+from django.db import migrations, models
+
+
+def add_site_logo_dark(apps, schema_editor):
+    # 0024/0025 were named for this field but never added it; databases that
+    # got the column by hand already have it, fresh ones don't.
+    SiteSetting = apps.get_model('accounts', 'SiteSetting')
+    table = SiteSetting._meta.db_table
+    with schema_editor.connection.cursor() as cursor:
+        columns = {
+            column.name for column in
+            schema_editor.connection.introspection.get_table_description(cursor, table)
+        }
+    if 'site_logo_dark' not in columns:
+        schema_editor.add_field(SiteSetting, SiteSetting._meta.get_field('site_logo_dark'))
+
+
+def remove_site_logo_dark(apps, schema_editor):
+    SiteSetting = apps.get_model('accounts', 'SiteSetting')
+    schema_editor.remove_field(SiteSetting, SiteSetting._meta.get_field('site_logo_dark'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0027_tour_rating_indexes'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddField(
+                    model_name='sitesetting',
+                    name='site_logo_dark',
+                    field=models.ImageField(blank=True, null=True, upload_to='settings/'),
+                ),
+            ],
+        ),
+        migrations.RunPython(add_site_logo_dark, remove_site_logo_dark),
+    ]
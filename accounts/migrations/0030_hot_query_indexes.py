@@ -0,0 +1,99 @@
+# Generated by Django 5.2.8 on 2026-10-18 01:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0029_dailystats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='tour',
+            name='tour_recommended_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='tour',
+            name='tour_rating_idx',
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['status', 'created_at'], name='blog_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['status', 'is_featured', 'created_at'], name='blog_featured_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['created_at'], name='booking_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['status', 'created_at'], name='booking_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['payment_status', 'created_at'], name='booking_payment_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customer',
+            index=models.Index(fields=['created_at'], name='customer_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customermessage',
+            index=models.Index(fields=['parent_message', 'created_at'], name='message_thread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customermessage',
+            index=models.Index(condition=models.Q(('is_read', False)), fields=['sender_type'], name='message_unread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customermessage',
+            index=models.Index(fields=['customer', 'created_at'], name='message_customer_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['created_at'], name='payment_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['status', 'created_at'], name='payment_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tour',
+            index=models.Index(fields=['status', 'is_featured', 'average_rating', 'created_at'], name='tour_recommended_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tour',
+            index=models.Index(fields=['status', 'average_rating'], name='tour_rating_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tour',
+            index=models.Index(fields=['status', 'base_price'], name='tour_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tour',
+            index=models.Index(fields=['status', 'created_at'], name='tour_newest_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tourreview',
+            index=models.Index(fields=['tour', 'status', 'created_at'], name='review_tour_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tourreview',
+            index=models.Index(fields=['status', 'created_at'], name='review_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tourreview',
+            index=models.Index(fields=['created_at'], name='review_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tourschedule',
+            index=models.Index(fields=['tour', 'status', 'date', 'start_time'], name='schedule_available_idx'),
+        ),
+    ]
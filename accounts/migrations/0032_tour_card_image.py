@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-18 02:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0031_notification_outbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tour',
+            name='card_image',
+            field=models.ImageField(blank=True, editable=False, upload_to='tours/'),
+        ),
+        migrations.AddField(
+            model_name='tour',
+            name='card_thumbnail',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+    ]
@@ -15,6 +15,9 @@ class Customer(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at'], name='customer_created_idx'),
+        ]
     
     def __str__(self):
         return self.user.username
@@ -338,6 +341,9 @@ class Tour(models.Model):
     description_dk = models.TextField(blank=True)
     
     main_image = models.ImageField(upload_to='tours/', blank=True, null=True)
+    # The image tour cards show and its 640px JPEG rendition, kept by accounts/tour_cards.py
+    card_image = models.ImageField(upload_to='tours/', blank=True, editable=False)
+    card_thumbnail = models.CharField(max_length=255, blank=True, editable=False)
     video_url = models.URLField(max_length=500, blank=True)
     
     duration_hours = models.DecimalField(max_digits=5, decimal_places=2, blank=True, null=True)
@@ -399,6 +405,14 @@ class Tour(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Listing sorts over active tours. Columns are ascending so a backward
+            # scan yields the descending sort with the id tie-breaker.
+            models.Index(fields=['status', 'is_featured', 'average_rating', 'created_at'], name='tour_recommended_idx'),
+            models.Index(fields=['status', 'average_rating'], name='tour_rating_idx'),
+            models.Index(fields=['status', 'base_price'], name='tour_price_idx'),
+            models.Index(fields=['status', 'created_at'], name='tour_newest_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -410,6 +424,12 @@ class Tour(models.Model):
             return self.base_price / (1 - self.discount_percentage / 100)
         return self.base_price
 
+    @property
+    def card_thumbnail_url(self):
+        if self.card_thumbnail:
+            return self.card_image.storage.url(self.card_thumbnail)
+        return self.card_image.url if self.card_image else ''
+
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
@@ -536,6 +556,10 @@ class TourSchedule(models.Model):
     
     class Meta:
         unique_together = ['tour', 'date', 'start_time']
+        indexes = [
+            # Upcoming departures of a tour on the detail page and booking forms
+            models.Index(fields=['tour', 'status', 'date', 'start_time'], name='schedule_available_idx'),
+        ]
 
 class TourBlackoutDate(models.Model):
     tour = models.ForeignKey(Tour, on_delete=models.CASCADE, related_name='blackout_dates')
@@ -602,6 +626,12 @@ class Booking(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Admin list (newest first, optionally by status) and the daily rollup
+            models.Index(fields=['created_at'], name='booking_created_idx'),
+            models.Index(fields=['status', 'created_at'], name='booking_status_idx'),
+            models.Index(fields=['payment_status', 'created_at'], name='booking_payment_status_idx'),
+        ]
 
 class BookingParticipant(models.Model):
     booking = models.ForeignKey(Booking, on_delete=models.CASCADE, related_name='participants')
@@ -650,6 +680,12 @@ class Payment(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at'], name='payment_created_idx'),
+            models.Index(fields=['status', 'created_at'], name='payment_status_idx'),
+        ]
+
 class TourReview(models.Model):
     tour = models.ForeignKey(Tour, on_delete=models.CASCADE, related_name='reviews')
     booking = models.OneToOneField(Booking, on_delete=models.SET_NULL, null=True, blank=True, related_name='review')
@@ -686,6 +722,12 @@ class TourReview(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Approved reviews of a tour, the admin list and the daily rollup
+            models.Index(fields=['tour', 'status', 'created_at'], name='review_tour_status_idx'),
+            models.Index(fields=['status', 'created_at'], name='review_status_idx'),
+            models.Index(fields=['created_at'], name='review_created_idx'),
+        ]
 
 class ReviewHelpful(models.Model):
     review = models.ForeignKey(TourReview, on_delete=models.CASCADE, related_name='helpful_votes')
@@ -757,10 +799,20 @@ class Notification(models.Model):
     send_sms = models.BooleanField(default=False)
     send_push = models.BooleanField(default=False)
     
+    # Email outbox, see accounts/outbox.py
+    recipient = models.EmailField(blank=True)
+    from_email = models.CharField(max_length=254, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True)
+    
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['is_sent', 'next_attempt_at'], name='notification_outbox_idx'),
+        ]
 
 class BlogPost(models.Model):
     author = models.ForeignKey(User, on_delete=models.CASCADE, related_name='blog_posts')
@@ -795,6 +847,10 @@ class BlogPost(models.Model):
 
     class Meta:
         ordering = ['-published_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='blog_status_idx'),
+            models.Index(fields=['status', 'is_featured', 'created_at'], name='blog_featured_idx'),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.slug:
@@ -838,6 +894,12 @@ class CustomerMessage(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Customer Message'
         verbose_name_plural = 'Customer Messages'
+        indexes = [
+            # Admin inbox: conversation threads newest first, unread count
+            models.Index(fields=['parent_message', 'created_at'], name='message_thread_idx'),
+            models.Index(fields=['sender_type'], condition=models.Q(is_read=False), name='message_unread_idx'),
+            models.Index(fields=['customer', 'created_at'], name='message_customer_idx'),
+        ]
     
     def __str__(self):
         return f"{self.customer.user.username} - {self.subject}"
@@ -969,3 +1031,20 @@ class FAQ(models.Model):
 
     def __str__(self):
         return self.qus_en[:50]
+
+class DailyStats(models.Model):
+    """Per-day rollup read by the admin dashboard charts (see accounts/stats.py)"""
+    date = models.DateField(unique=True)
+    bookings = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    new_customers = models.IntegerField(default=0)
+    reviews = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['date']
+        verbose_name = "Daily Stats"
+        verbose_name_plural = "Daily Stats"
+
+    def __str__(self):
+        return str(self.date)
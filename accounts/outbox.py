@@ -0,0 +1,112 @@
+"""
+Outgoing email queue on the Notification table.
+
+Views call ``enqueue`` instead of ``send_mail``, so a slow or unreachable SMTP
+server never holds up a request. ``send_pending`` (run by the ``send_outbox``
+management command) sends due messages in batches over one connection of the
+configured EMAIL_BACKEND, marks them ``is_sent`` and reschedules failures with
+exponential backoff.
+
+A notification is queued while ``next_attempt_at`` is set and it is not sent.
+In-app notifications never get a ``next_attempt_at`` and are left alone, and
+a message that fails ``MAX_ATTEMPTS`` times has it cleared, keeping its
+``last_error`` for the admin.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+BATCH_SIZE = 100
+MAX_ATTEMPTS = 6
+
+# Retry after 1, 2, 4, 8... minutes, never waiting more than RETRY_MAX
+RETRY_BASE = timedelta(minutes=1)
+RETRY_MAX = timedelta(hours=6)
+
+# How long a worker holds a batch before another worker may pick it up
+LEASE = timedelta(minutes=5)
+
+
+def enqueue(subject, message, to, from_email=None, notification_type='email', **fields):
+    """Queue an email and return its Notification; extra ``fields`` (customer, booking, tour) are stored as given"""
+    from .models import Notification
+    return Notification.objects.create(
+        notification_type=notification_type, title=subject[:300], message=message, recipient=to,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL, send_email=True, next_attempt_at=timezone.now(),
+        **fields,
+    )
+
+
+def pending():
+    from .models import Notification
+    return Notification.objects.filter(is_sent=False, send_email=True, next_attempt_at__lte=timezone.now())
+
+
+def retry_delay(attempts):
+    return min(RETRY_BASE * 2 ** (attempts - 1), RETRY_MAX)
+
+
+def _claim(batch_size):
+    """Lease a batch so concurrent workers don't send the same rows"""
+    from .models import Notification
+    ids = list(pending().order_by('next_attempt_at', 'pk').values_list('pk', flat=True)[:batch_size])
+    if not ids:
+        return []
+    lease_until = timezone.now() + LEASE
+    pending().filter(pk__in=ids).update(next_attempt_at=lease_until)
+    return list(Notification.objects.filter(pk__in=ids, next_attempt_at=lease_until).order_by('pk'))
+
+
+def _failed(notification, error, max_attempts):
+    from .models import Notification
+    attempts = notification.attempts + 1
+    retry_at = timezone.now() + retry_delay(attempts) if attempts < max_attempts else None
+    Notification.objects.filter(pk=notification.pk).update(
+        attempts=attempts, next_attempt_at=retry_at, last_error=f'{type(error).__name__}: {error}',
+    )
+
+
+def send_pending(batch_size=BATCH_SIZE, max_attempts=MAX_ATTEMPTS):
+    """Send one batch of due messages, returning ``(sent, failed)``"""
+    from .models import Notification
+    batch = _claim(batch_size)
+    if not batch:
+        return 0, 0
+
+    sent, failed = [], []
+    connection = get_connection()
+    try:
+        connection.open()
+        for notification in batch:
+            email = EmailMessage(
+                notification.title, notification.message, notification.from_email or settings.DEFAULT_FROM_EMAIL,
+                [notification.recipient], connection=connection,
+            )
+            try:
+                email.send()
+            except Exception as exc:
+                failed.append(notification.pk)
+                _failed(notification, exc, max_attempts)
+                # The server may have dropped us; carry on with a fresh connection
+                connection.close()
+                connection.open()
+            else:
+                sent.append(notification.pk)
+    except Exception as exc:
+        # Could not (re)connect: whatever is left of the batch backs off
+        with transaction.atomic():
+            for notification in batch:
+                if notification.pk not in sent and notification.pk not in failed:
+                    failed.append(notification.pk)
+                    _failed(notification, exc, max_attempts)
+    finally:
+        connection.close()
+        if sent:
+            Notification.objects.filter(pk__in=sent).update(
+                is_sent=True, sent_at=timezone.now(), next_attempt_at=None, last_error='', attempts=F('attempts') + 1,
+            )
+    return len(sent), len(failed)
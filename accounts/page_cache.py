@@ -0,0 +1,87 @@
+"""
+Cached renders of public pages.
+
+Anonymous visitors get the home page and the tour list pages from the
+tiered payload cache (accounts/tiered_cache.py), one copy per language and
+per value of the query parameters the page reads (the search form's fields,
+the tour list's filters); other parameters are ignored. The copy is rendered with a placeholder
+instead of a CSRF token, and the visitor's own token is substituted when it
+is served. Everyone else (signed in customers, suppliers, requests carrying
+messages) gets a fresh render; on the home page its section fragments are
+still cached by ``{% cache %}`` blocks keyed on the ``home`` tag version.
+
+Both pages declare the models they render in the cache dependency registry
+(accounts/cache_deps.py), which invalidates them when any of those change.
+"""
+import hashlib
+
+from django.contrib.messages import get_messages
+from django.http import HttpResponse, QueryDict
+from django.middleware.csrf import get_token
+
+from .cache_deps import dependencies
+from .tiered_cache import payload_cache
+
+# Everything rendered on the home page, chrome included
+home_page = dependencies.declare('home', models=(
+    'accounts.SiteSetting', 'accounts.WebsiteMenu', 'accounts.WebsiteSubMenu', 'accounts.Slider',
+    'accounts.Country', 'accounts.DestinationRegion', 'accounts.City', 'accounts.TourSupplier',
+    'accounts.Category', 'accounts.FeatureSection', 'accounts.FeatureSectionTour', 'accounts.Tour',
+    'accounts.TourImage', 'accounts.CustomerReviewStatic', 'accounts.FAQ', 'accounts.BlogPost',
+))
+
+# The chrome, the tour cards and the filter sidebar
+tour_list_page = dependencies.declare('tour_list', models=(
+    'accounts.SiteSetting', 'accounts.WebsiteMenu', 'accounts.WebsiteSubMenu', 'accounts.Country',
+    'accounts.DestinationRegion', 'accounts.City', 'accounts.TourSupplier', 'accounts.Category',
+    'accounts.Tour', 'accounts.TourImage',
+))
+
+CACHE_TIMEOUT = 60 * 60
+
+CSRF_PLACEHOLDER = 'csrf-token-placeholder-0f3c9a'
+
+
+def home_version():
+    return payload_cache.tag_versions(home_page.tags())[0]
+
+
+def is_cacheable(request):
+    """Whether the response would be identical for every visitor in this language (and cached query)"""
+    if request.method != 'GET':
+        return False
+    if request.user.is_authenticated or request.session.get('supplier_id'):
+        return False
+    return not len(get_messages(request))
+
+
+def cache_query(request, params):
+    """The non-empty values of ``params`` in ``request.GET`` (the last one of each), in ``params`` order"""
+    query = QueryDict(mutable=True)
+    for name in params:
+        value = request.GET.get(name)
+        if value:
+            query[name] = value
+    return query
+
+
+def page_key(name, lang, query):
+    return f'{name}:{lang}:{hashlib.sha1(query.urlencode().encode()).hexdigest()}'
+
+
+def cached_page(request, name, render_page, tags, params=()):
+    """
+    Serve the copy cached for ``name``, the visitor's language and the GET ``params`` the page reads,
+    rendering it with ``render_page(csrf_token=CSRF_PLACEHOLDER)`` in one worker when it is missing or
+    stale, and personalise it for this visitor. Any other query parameters are dropped from the request
+    first, so they neither make new entries nor end up in the cached copy.
+    """
+    request.GET = cache_query(request, params)
+    key = page_key(name, request.session.get('lang', 'en'), request.GET)
+
+    def build():
+        response = render_page(csrf_token=CSRF_PLACEHOLDER)
+        return response.content.decode(response.charset)
+
+    content = payload_cache.get_or_set(key, build, CACHE_TIMEOUT, tags=tags)
+    return HttpResponse(content.replace(CSRF_PLACEHOLDER, get_token(request)))
@@ -0,0 +1,258 @@
+"""
+Keyset (cursor) pagination for list views.
+
+``Paginator`` pages with ``COUNT(*)`` plus ``OFFSET``, so page N reads and
+throws away every row before it. KeysetPaginator instead remembers the sort
+key of the last (or first) row shown in an opaque ``cursor`` query parameter
+and asks for the rows after (or before) it, which the ordering indexes answer
+directly however deep the visitor goes.
+
+The page object keeps the parts of the Page API the list templates use
+(iteration, ``has_next`` / ``has_previous``, ``start_index`` / ``end_index``,
+``paginator.count``) and adds ``next_cursor`` / ``previous_cursor`` for the
+links. Page numbers are not available; templates link with
+``{% querystring cursor=page_obj.next_cursor %}``.
+
+``count`` is exact by default. With ``approximate_count=True`` it stops
+counting at ``count_limit`` rows (``count_is_exact`` is then False) and the
+result is cached briefly per query, for "N results" headers over large
+tables.
+"""
+import base64
+import hashlib
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db.models import DecimalField, FloatField, Q, Value
+from django.db.models.functions import Cast
+from django.utils.functional import cached_property
+
+COUNT_LIMIT = 1000
+
+COUNT_CACHE_TIMEOUT = 60
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def encode_cursor(values, direction, position):
+    payload = json.dumps(
+        {'v': [_encode_value(value) for value in values], 'd': direction, 'p': position},
+        separators=(',', ':')
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """``(values, direction, position)`` or None for a missing or malformed cursor"""
+    if not cursor:
+        return None
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        values, direction, position = payload['v'], payload['d'], int(payload['p'])
+    except (ValueError, TypeError, KeyError):
+        return None
+    if direction not in ('next', 'prev') or not isinstance(values, list) or position < 0:
+        return None
+    return values, direction, position
+
+
+def approximate_count(queryset, limit=COUNT_LIMIT, timeout=COUNT_CACHE_TIMEOUT):
+    """
+    ``(count, exact)`` for ``queryset``, counting at most ``limit`` rows and
+    caching the answer per SQL statement for ``timeout`` seconds.
+    """
+    queryset = queryset.order_by()
+    sql, params = queryset.query.sql_with_params()
+    key = 'approx_count:' + hashlib.md5(f'{sql}|{params!r}'.encode()).hexdigest()
+    result = cache.get(key)
+    if result is None:
+        count = queryset[:limit + 1].count()
+        result = (min(count, limit), count <= limit)
+        cache.set(key, result, timeout)
+    return result
+
+
+def _reads_raw(field):
+    return isinstance(field, DecimalField)
+
+
+class KeysetPage:
+    def __init__(self, object_list, paginator, position, has_next, has_previous, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.position = position
+        self._has_next = has_next
+        self._has_previous = has_previous
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __repr__(self):
+        return f'<KeysetPage at {self.position} ({len(self.object_list)} items)>'
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self._has_next or self._has_previous
+
+    def start_index(self):
+        """1-based index of the first row, as counted when the visitor paged here"""
+        return self.position + 1 if self.object_list else 0
+
+    def end_index(self):
+        return self.position + len(self.object_list)
+
+
+class KeysetPaginator:
+    """
+    Page ``queryset`` by ``ordering`` (field names, ``-`` for descending).
+    The primary key is appended as a tie-breaker when missing, so rows with
+    equal sort values are neither skipped nor repeated. Ordering fields must
+    be non-null columns or annotations on ``queryset``.
+    """
+
+    def __init__(self, queryset, per_page, ordering=('-created_at',), approximate_count=False,
+                 count_limit=COUNT_LIMIT):
+        self.per_page = int(per_page)
+        self.approximate_count = approximate_count
+        self.count_limit = count_limit
+
+        pk_name = queryset.model._meta.pk.name
+        ordering = list(ordering)
+        if not any(field.lstrip('-') in ('pk', pk_name) for field in ordering):
+            ordering.append('-pk' if ordering and ordering[-1].startswith('-') else 'pk')
+        self.ordering = ordering
+        self.keys = [(field.lstrip('-'), field.startswith('-')) for field in ordering]
+
+        # Decimal columns can hold more precision than the field rounds to on
+        # read (e.g. averages written with update()), so their cursor values
+        # are the stored number, read and compared as a float.
+        self._fields = [self._field(queryset, name) for name, descending in self.keys]
+        raw_values = {
+            f'keyset_{name}': Cast(name, FloatField())
+            for (name, descending), field in zip(self.keys, self._fields)
+            if _reads_raw(field)
+        }
+        self.queryset = queryset.annotate(**raw_values) if raw_values else queryset
+
+    @staticmethod
+    def _field(queryset, name):
+        annotation = queryset.query.annotations.get(name)
+        if annotation is not None:
+            return annotation.output_field
+        if name == 'pk':
+            return queryset.model._meta.pk
+        return queryset.model._meta.get_field(name)
+
+    def _row_key(self, obj):
+        return [
+            getattr(obj, f'keyset_{name}' if _reads_raw(field) else name)
+            for (name, descending), field in zip(self.keys, self._fields)
+        ]
+
+    def _value(self, index, value):
+        if _reads_raw(self._fields[index]):
+            return Value(value, output_field=FloatField())
+        return value
+
+    def _after(self, values, reverse=False):
+        """Rows strictly after ``values`` in the page ordering (before it when ``reverse``)"""
+        condition = Q()
+        for index, (name, descending) in enumerate(self.keys):
+            lookup = 'lt' if descending != reverse else 'gt'
+            step = Q(**{f'{name}__{lookup}': self._value(index, values[index])})
+            for previous, (previous_name, previous_descending) in enumerate(self.keys[:index]):
+                step &= Q(**{previous_name: self._value(previous, values[previous])})
+            condition |= step
+        return condition
+
+    def _reversed_ordering(self):
+        return [field[1:] if field.startswith('-') else f'-{field}' for field in self.ordering]
+
+    def _decode(self, cursor):
+        decoded = decode_cursor(cursor)
+        if decoded is None:
+            return None
+        values, direction, position = decoded
+        if len(values) != len(self.keys):
+            return None
+        try:
+            values = [
+                float(value) if _reads_raw(field) else field.to_python(value)
+                for field, value in zip(self._fields, values)
+            ]
+        except (ValidationError, TypeError, ValueError):
+            return None
+        return values, direction, position
+
+    def cursor_after(self, obj, position):
+        """Cursor for the page that follows ``obj``, the row shown at 1-based index ``position``"""
+        return encode_cursor(self._row_key(obj), 'next', position)
+
+    def first_page_query(self):
+        """The query ``get_page()`` runs without a cursor (one row more than a page, to see if there is a next)"""
+        return self.queryset.order_by(*self.ordering)[:self.per_page + 1]
+
+    def get_page(self, cursor=None):
+        """The page after / before ``cursor``; the first page for a missing or invalid cursor"""
+        decoded = self._decode(cursor)
+        if decoded is None:
+            rows = list(self.first_page_query())
+            has_next, has_previous, position = len(rows) > self.per_page, False, 0
+            rows = rows[:self.per_page]
+        else:
+            values, direction, position = decoded
+            if direction == 'next':
+                rows = list(self.queryset.filter(self._after(values)).order_by(*self.ordering)[:self.per_page + 1])
+                has_next, has_previous = len(rows) > self.per_page, True
+                rows = rows[:self.per_page]
+            else:
+                rows = list(
+                    self.queryset.filter(self._after(values, reverse=True))
+                    .order_by(*self._reversed_ordering())[:self.per_page + 1]
+                )
+                has_next, has_previous = True, len(rows) > self.per_page
+                rows = rows[:self.per_page][::-1]
+                position = max(position - len(rows), 0) if has_previous else 0
+
+        next_cursor = previous_cursor = None
+        if rows and has_next:
+            next_cursor = self.cursor_after(rows[-1], position + len(rows))
+        if rows and has_previous:
+            previous_cursor = encode_cursor(self._row_key(rows[0]), 'prev', position)
+        return KeysetPage(rows, self, position, has_next, has_previous, next_cursor, previous_cursor)
+
+    @cached_property
+    def _count(self):
+        if self.approximate_count:
+            return approximate_count(self.queryset, self.count_limit)
+        return self.queryset.order_by().count(), True
+
+    @property
+    def count(self):
+        return self._count[0]
+
+    @property
+    def count_is_exact(self):
+        return self._count[1]
@@ -0,0 +1,361 @@
+"""
+Query-count and latency budgets for every named URL.
+
+``view_cases()`` walks the project URLconf (the Django admin and static
+routes excepted), fills each route's arguments from sample rows and picks
+the role that can open it: anonymous for the public site, the sample
+customer for the customer dashboard, the sample tour's supplier for the
+supplier panel and a superuser for the admin panel.
+
+``measure()`` requests each URL once with an empty cache, counting its
+queries, then ``repeat`` more times for the wall-clock p95. Every request
+runs inside a rolled-back transaction, so routes that change data on GET
+leave the dataset as it was. ``budget_failures()`` compares the results
+with ``QUERY_BUDGETS`` / ``LATENCY_BUDGETS_MS`` and ``write_report()``
+saves them as JSON (the test suite does when ``PERF_REPORT`` names a file).
+The test suite always enforces the query budgets. Latency depends on the
+host, so it enforces the latency budgets only when ``PERF_LATENCY`` is set.
+"""
+import json
+import math
+import re
+import time
+from collections import Counter, namedtuple
+from contextlib import nullcontext
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import Client
+from django.urls import URLPattern, URLResolver, get_resolver
+
+ViewCase = namedtuple('ViewCase', 'name url role')
+
+Measurement = namedtuple('Measurement', 'name url role status queries repeated_query p95_ms')
+
+# Routes that are never requested: they log the client out, call an external
+# service or send mail, so a GET tells nothing about the page budget
+SKIPPED = {
+    'logout': 'ends the session',
+    'logout_tour_supplier': 'ends the session',
+    'ai_chat_proxy': 'calls the external AI service',
+    'booking_send_invoice': 'sends mail',
+    'message_send': 'sends a message',
+    'customer_chat_send': 'sends a message',
+    'supplier_tour_edit': 'its template does not exist',
+    'supplier_tour_delete': 'its template does not exist',
+}
+
+ROLE_PREFIXES = (
+    ('/accounts/admin/', 'admin'),
+    ('/accounts/dashboard/admin/', 'admin'),
+    ('/accounts/dashboard/customer/', 'customer'),
+    ('/accounts/dashboard/supplier/', 'supplier'),
+    ('/todo/', 'admin'),
+)
+
+ROLES = {
+    'booking_confirmation': 'customer',
+}
+
+DEFAULT_QUERY_BUDGET = 20
+
+# Views that legitimately need more queries (one per section or per
+# prefetched relation), measured on the load-data set with some headroom
+QUERY_BUDGETS = {
+    'tour_view': 25,
+    # Cascades over the customer's rows; each deleted review recomputes its tour's rating
+    'customer_delete': 80,
+}
+
+DEFAULT_LATENCY_BUDGET_MS = 500
+
+LATENCY_BUDGETS_MS = {
+    # Its selects list every customer, tour and bookable departure
+    'booking_create': 5000,
+}
+
+# A statement repeated more often than this in one request is reported as an N+1
+REPEATED_QUERY_LIMIT = 5
+
+# Write paths whose per-row work is the point of the request
+REPEATED_QUERY_LIMITS = {
+    'customer_delete': 20,
+}
+
+_ARGUMENT = re.compile(r'<(?:(?P<converter>\w+):)?(?P<name>\w+)>')
+
+# Route arguments whose name says which sample row they take
+ARGUMENT_SAMPLES = {
+    'tour_id': 'tour',
+    'booking_id': 'booking',
+    'blog_id': 'blog_post',
+    'page_id': 'page',
+    'feature_id': 'feature_section',
+    'image_id': 'tour_image',
+    'highlight_id': 'tour_highlight',
+    'step_id': 'tour_itinerary',
+    'req_id': 'tour_requirement',
+    'faq_id': 'tour_faq',
+    'pricing_id': 'tour_pricing',
+    'schedule_id': 'tour_schedule',
+    'blackout_id': 'tour_blackout',
+    'customer_id': 'message_customer',
+    'message_id': 'message',
+    'menu_id': 'website_menu',
+    'review_id': 'tour_review',
+    'todo_id': 'todo',
+}
+
+# ``pk`` and ``item_id`` arguments take the row named by the route segment before them
+SEGMENT_SAMPLES = {
+    'destination-regions': 'region',
+    'countries': 'country',
+    'customers': 'customer',
+    'tour-suppliers': 'supplier',
+    'categories': 'category',
+    'sliders': 'slider',
+    'newsletters': 'newsletter',
+    'contactus': 'contact',
+    'groups': 'group',
+    'admins': 'admin',
+    'reviews': 'static_review',
+    'pages': 'page',
+    'tours': 'tour',
+    'included': 'tour_included',
+    'excluded': 'tour_excluded',
+    'bookings': 'booking',
+    'payments': 'payment',
+    'tour-reviews': 'tour_review',
+    'coupons': 'coupon',
+    'cities': 'city',
+    'blog': 'blog_post',
+    'feature-sections': 'feature_section',
+    'website-menus': 'website_menu',
+    'website-submenus': 'website_submenu',
+    'faqs': 'faq',
+}
+
+
+def sample_objects(admin):
+    """
+    One row per kind for the route arguments, chosen to make the pages do
+    the most work: the most booked active tour (with its child rows), the
+    customer with the most bookings and the longest message thread.
+    """
+    from django.contrib.auth.models import Group
+    from todo.models import Todo
+    from .models import (
+        Tour, Customer, Booking, Payment, TourReview, CustomerMessage, Country, DestinationRegion, City,
+        Category, Slider, Newsletter, ContactUs, CustomerReviewStatic, Page, Coupon, BlogPost, FeatureSection,
+        WebsiteMenu, WebsiteSubMenu, FAQ,
+    )
+
+    tour = Tour.objects.filter(
+        status='active', blackout_dates__isnull=False, reviews__status='approved'
+    ).order_by('-total_bookings', 'pk').first()
+    customer = Customer.objects.select_related('user').annotate(
+        booking_count=Count('bookings')
+    ).order_by('-booking_count', 'pk').first()
+    thread = CustomerMessage.objects.filter(parent_message__isnull=True).annotate(
+        reply_count=Count('replies')
+    ).order_by('-reply_count', 'pk').first()
+    samples = {
+        'admin': admin,
+        'tour': tour,
+        'supplier': tour and tour.supplier,
+        'customer': customer,
+        'booking': customer and customer.bookings.order_by('-total_participants', 'pk').first(),
+        'payment': Payment.objects.order_by('pk').first(),
+        'tour_review': TourReview.objects.order_by('pk').first(),
+        'message': thread,
+        'message_customer': thread and thread.customer,
+        'country': Country.objects.order_by('pk').first(),
+        'region': DestinationRegion.objects.order_by('pk').first(),
+        'city': City.objects.order_by('pk').first(),
+        'category': Category.objects.order_by('pk').first(),
+        'slider': Slider.objects.order_by('pk').first(),
+        'newsletter': Newsletter.objects.order_by('pk').first(),
+        'contact': ContactUs.objects.order_by('pk').first(),
+        'group': Group.objects.order_by('pk').first(),
+        'static_review': CustomerReviewStatic.objects.order_by('pk').first(),
+        'page': Page.objects.filter(is_active=True).order_by('pk').first(),
+        'coupon': Coupon.objects.order_by('pk').first(),
+        'blog_post': BlogPost.objects.filter(status='published').order_by('pk').first(),
+        'feature_section': FeatureSection.objects.order_by('pk').first(),
+        'website_menu': WebsiteMenu.objects.order_by('pk').first(),
+        'website_submenu': WebsiteSubMenu.objects.order_by('pk').first(),
+        'faq': FAQ.objects.order_by('pk').first(),
+        'todo': Todo.objects.order_by('pk').first(),
+    }
+    children = {
+        'tour_image': 'images', 'tour_highlight': 'highlights', 'tour_included': 'included_items',
+        'tour_excluded': 'excluded_items', 'tour_itinerary': 'itinerary_steps', 'tour_requirement': 'requirements',
+        'tour_faq': 'faqs', 'tour_pricing': 'pricing_options', 'tour_schedule': 'schedules',
+        'tour_blackout': 'blackout_dates',
+    }
+    for key, relation in children.items():
+        samples[key] = tour and getattr(tour, relation).order_by('pk').first()
+    return samples
+
+
+def _named_routes(patterns=None, prefix='/'):
+    """``(name, route)`` for every named URL pattern, Django admin excepted"""
+    for pattern in patterns if patterns is not None else get_resolver().url_patterns:
+        route = prefix + str(pattern.pattern)
+        if isinstance(pattern, URLResolver):
+            if pattern.app_name == 'admin':
+                continue
+            yield from _named_routes(pattern.url_patterns, route)
+        elif isinstance(pattern, URLPattern) and pattern.name and '(?P' not in route:
+            yield pattern.name, route
+
+
+def _role(name, url):
+    if name in ROLES:
+        return ROLES[name]
+    for prefix, role in ROLE_PREFIXES:
+        if url.startswith(prefix):
+            return role
+    return 'anonymous'
+
+
+def view_cases(samples):
+    """``(cases, skipped)``; ``skipped`` maps URL names to the reason they are not requested"""
+    cases, skipped = [], {}
+    for name, route in _named_routes():
+        if name in SKIPPED:
+            skipped[name] = SKIPPED[name]
+            continue
+
+        missing = []
+
+        def argument(match):
+            if match.group('name') == 'lang_code':
+                return 'en'
+            if match.group('name') == 'page_slug':
+                return samples['page'].slug if samples['page'] else ''
+            segment = route[:match.start()].rstrip('/').rsplit('/', 1)[-1]
+            key = SEGMENT_SAMPLES.get(segment) if match.group('name') in ('pk', 'item_id') else None
+            key = key or ARGUMENT_SAMPLES.get(match.group('name'))
+            obj = samples.get(key)
+            if obj is None:
+                missing.append(match.group('name'))
+                return '0'
+            return str(obj.pk)
+
+        url = _ARGUMENT.sub(argument, route)
+        if missing:
+            skipped[name] = f"no sample row for {', '.join(missing)}"
+            continue
+        cases.append(ViewCase(name, url, _role(name, url)))
+    return cases, skipped
+
+
+def role_clients(samples):
+    clients = {'anonymous': Client(raise_request_exception=False)}
+    clients['admin'] = Client(raise_request_exception=False)
+    clients['admin'].force_login(samples['admin'], backend='django.contrib.auth.backends.ModelBackend')
+    if samples['customer'] is not None:
+        clients['customer'] = Client(raise_request_exception=False)
+        clients['customer'].force_login(samples['customer'].user, backend='django.contrib.auth.backends.ModelBackend')
+    if samples['supplier'] is not None:
+        clients['supplier'] = Client(raise_request_exception=False)
+        session = clients['supplier'].session
+        session['supplier_id'] = samples['supplier'].pk
+        session.save()
+    return clients
+
+
+def _request(client, url, wrapper=None):
+    with transaction.atomic():
+        with connection.execute_wrapper(wrapper) if wrapper else nullcontext():
+            started = time.perf_counter()
+            response = client.get(url)
+            elapsed = (time.perf_counter() - started) * 1000
+        transaction.set_rollback(True)
+    return response, elapsed
+
+
+def p95(timings):
+    ordered = sorted(timings)
+    return ordered[max(math.ceil(len(ordered) * 0.95) - 1, 0)]
+
+
+def measure(case, client, repeat=5):
+    """Query count with a cold cache, p95 latency over the cold request and ``repeat`` warm ones"""
+    statements = Counter()
+
+    def record(execute, sql, params, many, context):
+        statements[sql] += 1
+        return execute(sql, params, many, context)
+
+    cache.clear()
+    response, elapsed = _request(client, case.url, record)
+    timings = [elapsed]
+    for _ in range(repeat):
+        timings.append(_request(client, case.url)[1])
+
+    repeated = statements.most_common(1)[0][1] if statements else 0
+    return Measurement(
+        case.name, case.url, case.role, response.status_code, sum(statements.values()), repeated,
+        round(p95(timings), 2),
+    )
+
+
+def run(admin, repeat=5):
+    """``(measurements, skipped)`` for every URL, with ``admin`` as the superuser"""
+    samples = sample_objects(admin)
+    cases, skipped = view_cases(samples)
+    clients = role_clients(samples)
+    measurements = []
+    for case in cases:
+        if case.role not in clients:
+            skipped[case.name] = f'no sample {case.role}'
+            continue
+        measurements.append(measure(case, clients[case.role], repeat))
+    return measurements, skipped
+
+
+def query_budget(name):
+    return QUERY_BUDGETS.get(name, DEFAULT_QUERY_BUDGET)
+
+
+def latency_budget(name):
+    return LATENCY_BUDGETS_MS.get(name, DEFAULT_LATENCY_BUDGET_MS)
+
+
+def repeated_query_limit(name):
+    return REPEATED_QUERY_LIMITS.get(name, REPEATED_QUERY_LIMIT)
+
+
+def budget_failures(measurements, latency=True):
+    """Budget overruns in ``measurements``; wall-clock budgets are only checked when ``latency`` is true"""
+    failures = []
+    for result in measurements:
+        if result.status >= 500:
+            failures.append(f'{result.name} ({result.url}): HTTP {result.status}')
+        if result.queries > query_budget(result.name):
+            failures.append(
+                f'{result.name} ({result.url}): {result.queries} queries, budget {query_budget(result.name)}'
+            )
+        if result.repeated_query > repeated_query_limit(result.name):
+            failures.append(f'{result.name} ({result.url}): one statement ran {result.repeated_query} times')
+        if latency and result.p95_ms > latency_budget(result.name):
+            failures.append(
+                f'{result.name} ({result.url}): p95 {result.p95_ms} ms, budget {latency_budget(result.name)} ms'
+            )
+    return failures
+
+
+def write_report(measurements, skipped, path):
+    report = {
+        'views': [
+            dict(result._asdict(), query_budget=query_budget(result.name), latency_budget_ms=latency_budget(result.name))
+            for result in measurements
+        ],
+        'skipped': skipped,
+        'failures': budget_failures(measurements),
+    }
+    with open(path, 'w') as report_file:
+        json.dump(report, report_file, indent=2)
@@ -0,0 +1,119 @@
+"""
+Per-participant price lookup for a tour.
+
+A PricingTable is built once from a tour's active TourPricing rows (the
+prefetched ``pricing_options`` when available) and answers every
+participant of a booking from memory: an age-range match first, then the
+participant type, then the tour's base price. Tables are cached per tour
+and dropped by the TourPricing / Tour signals in accounts/signals.py.
+
+The same rules are mirrored by the booking form JavaScript, which reads the
+rows from ``PricingTable.as_json()``.
+"""
+from bisect import bisect_right
+from decimal import Decimal
+
+from django.core.cache import cache
+
+CACHE_TIMEOUT = 60 * 60
+
+
+def _parse_age(value):
+    if value in (None, ''):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class PricingTable:
+    def __init__(self, options, base_price, currency='DKK'):
+        # Overlapping rows resolve to the oldest one, like .first() on the table
+        options = sorted((option for option in options if option.is_active), key=lambda option: option.pk)
+        self.base_price = base_price or Decimal('0')
+        self.currency = currency
+        self.rows = [
+            {
+                'participant_type': option.participant_type,
+                'min_age': option.min_age,
+                'max_age': option.max_age,
+                'price': option.price,
+                'currency': option.currency,
+            }
+            for option in options
+        ]
+
+        # Age ranges sorted by lower bound: (min_age, max_age, rank, price)
+        self._ranges = sorted(
+            (row['min_age'], row['max_age'], rank, row['price'])
+            for rank, row in enumerate(self.rows)
+            if row['min_age'] is not None and row['max_age'] is not None
+        )
+        self._range_starts = [start for start, *rest in self._ranges]
+
+        self._by_type = {}
+        for row in self.rows:
+            self._by_type.setdefault(row['participant_type'], row['price'])
+
+    @classmethod
+    def for_tour(cls, tour):
+        return cls(tour.pricing_options.all(), tour.base_price, tour.currency)
+
+    def price_for(self, participant_type='adult', age=None):
+        age = _parse_age(age)
+        if age is not None:
+            candidates = self._ranges[:bisect_right(self._range_starts, age)]
+            matches = [(rank, price) for start, end, rank, price in candidates if age <= end]
+            if matches:
+                return min(matches)[1]
+        if participant_type in self._by_type:
+            return self._by_type[participant_type]
+        return self.base_price
+
+    def price_participants(self, participants):
+        """
+        Set ``participant['price']`` (as a string) on each participant dict
+        posted by a booking form and return the subtotal.
+        """
+        subtotal = Decimal('0.00')
+        for participant in participants:
+            price = self.price_for(participant.get('type', 'adult'), participant.get('age'))
+            participant['price'] = str(price)
+            subtotal += price
+        return subtotal
+
+    def as_json(self):
+        """Rows for the booking form JavaScript (prices as floats)"""
+        return [dict(row, price=float(row['price']) if row['price'] else 0.0) for row in self.rows]
+
+    def as_dict(self):
+        """``as_json()`` rows plus the base price fallback, for the admin booking forms"""
+        return {
+            'base_price': float(self.base_price),
+            'currency': self.currency,
+            'options': self.as_json(),
+        }
+
+
+def _cache_key(tour_id):
+    return f'pricing_table:{tour_id}'
+
+
+def get_pricing_table(tour):
+    """Cached PricingTable for ``tour``; built from its prefetched pricing options on a miss"""
+    table = cache.get(_cache_key(tour.pk))
+    if table is None:
+        table = PricingTable.for_tour(tour)
+        cache.set(_cache_key(tour.pk), table, CACHE_TIMEOUT)
+    return table
+
+
+def reprice_booking(booking, participants):
+    """Price participants from the booking's tour and recompute subtotal and total"""
+    booking.subtotal = get_pricing_table(booking.tour).price_participants(participants)
+    booking.total_amount = booking.subtotal - (booking.discount_amount or 0) + (booking.tax_amount or 0)
+
+
+def invalidate_pricing_table(tour_id):
+    cache.delete(_cache_key(tour_id))
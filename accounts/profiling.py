@@ -0,0 +1,235 @@
+"""
+Opt-in request profiling.
+
+ProfilingMiddleware records, per profiled request, the wall time, the SQL
+statements (count, cumulative time and the most repeated ones, which is how
+an N+1 shows up), the time spent in the site_settings / current_language
+context processors and in template rendering. Template time is measured
+around the outermost template by the ProfilingTemplates backend (set as the
+TEMPLATES backend in settings) and so includes queries run lazily from it.
+
+Requests are profiled when ``settings.REQUEST_PROFILING`` is true, or when a
+staff user sends an ``X-Profile: 1`` header. Profiled responses carry a
+Server-Timing header. Results are aggregated per URL name over the last
+``WINDOW`` requests, in process memory (every worker keeps its own), and are
+shown on the admin panel's request profiles page and its JSON endpoint.
+"""
+import re
+import threading
+import time
+from collections import Counter, deque, namedtuple
+from contextlib import ExitStack
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.db import connections
+from django.template.backends.django import DjangoTemplates, Template as BackendTemplate
+
+PROFILE_HEADER = 'HTTP_X_PROFILE'
+
+# Requests kept per URL name
+WINDOW = 500
+
+# Upper bounds of the latency histogram buckets; the last bucket is open ended
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500)
+
+# Repeated statements kept per request and shown per URL name
+TOP_STATEMENTS = 5
+
+_IN_LIST = re.compile(r'\((?:%s, )+%s\)')
+
+_current = ContextVar('request_profile', default=None)
+
+Sample = namedtuple('Sample', 'total_ms sql_count sql_ms template_ms context_processors_ms statements')
+
+
+def normalize_sql(sql):
+    """Collapse ``IN (%s, %s, ...)`` lists so the same query with more ids counts as one statement"""
+    return _IN_LIST.sub('(...)', sql)
+
+
+class RequestProfile:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.sql_count = 0
+        self.sql_ms = 0.0
+        self.statements = Counter()
+        self.template_ms = 0.0
+        self.context_processors_ms = Counter()
+        self.rendering = False
+
+    def execute(self, execute, sql, params, many, context):
+        """``connection.execute_wrapper`` hook"""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_ms += (time.perf_counter() - started) * 1000
+            self.sql_count += 1
+            self.statements[normalize_sql(sql)] += 1
+
+    def sample(self):
+        repeated = [(sql, count) for sql, count in self.statements.most_common(TOP_STATEMENTS) if count > 1]
+        return Sample(
+            round((time.perf_counter() - self.started) * 1000, 2), self.sql_count, round(self.sql_ms, 2),
+            round(self.template_ms, 2), dict(self.context_processors_ms), repeated,
+        )
+
+
+def profiled_context_processor(func):
+    """Record the time ``func`` takes on profiled requests"""
+    @wraps(func)
+    def wrapper(request):
+        profile = _current.get()
+        if profile is None:
+            return func(request)
+        started = time.perf_counter()
+        try:
+            return func(request)
+        finally:
+            profile.context_processors_ms[func.__name__] += (time.perf_counter() - started) * 1000
+    return wrapper
+
+
+class ProfiledTemplate(BackendTemplate):
+    def render(self, context=None, request=None):
+        profile = _current.get()
+        if profile is None or profile.rendering:
+            return super().render(context, request)
+        profile.rendering = True
+        processors_ms = sum(profile.context_processors_ms.values())
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            profile.rendering = False
+            # Context processors run inside render() and are reported on their own
+            processors_ms = sum(profile.context_processors_ms.values()) - processors_ms
+            profile.template_ms += (time.perf_counter() - started) * 1000 - processors_ms
+
+
+class ProfilingTemplates(DjangoTemplates):
+    """The Django template backend, timing the outermost render of profiled requests"""
+
+    def from_string(self, template_code):
+        return ProfiledTemplate(super().from_string(template_code).template, self)
+
+    def get_template(self, template_name):
+        return ProfiledTemplate(super().get_template(template_name).template, self)
+
+
+class ProfileStore:
+    """Rolling window of request samples per URL name"""
+
+    def __init__(self, window=WINDOW):
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples = {}
+
+    def add(self, name, sample):
+        with self._lock:
+            if name not in self._samples:
+                self._samples[name] = deque(maxlen=self.window)
+            self._samples[name].append(sample)
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+
+    def summary(self):
+        """One dict per URL name, slowest p95 first"""
+        with self._lock:
+            samples = {name: list(window) for name, window in self._samples.items()}
+        rows = [_summarize(name, window) for name, window in samples.items()]
+        return sorted(rows, key=lambda row: row['total_ms']['p95'], reverse=True)
+
+
+def _percentile(ordered, fraction):
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def _mean(values):
+    return round(sum(values) / len(values), 2)
+
+
+def _summarize(name, samples):
+    totals = sorted(sample.total_ms for sample in samples)
+    histogram = Counter()
+    for value in totals:
+        histogram[next((bound for bound in LATENCY_BUCKETS_MS if value <= bound), None)] += 1
+
+    processors = Counter()
+    for sample in samples:
+        processors.update(sample.context_processors_ms)
+
+    repeated, worst = Counter(), Counter()
+    for sample in samples:
+        for sql, count in sample.statements:
+            repeated[sql] += count
+            worst[sql] = max(worst[sql], count)
+
+    return {
+        'url_name': name,
+        'requests': len(samples),
+        'total_ms': {
+            'mean': _mean(totals), 'p50': _percentile(totals, 0.5), 'p95': _percentile(totals, 0.95),
+            'max': totals[-1],
+        },
+        'histogram': [
+            {'le_ms': bound, 'count': histogram[bound]} for bound in LATENCY_BUCKETS_MS + (None,)
+        ],
+        'sql': {
+            'mean_count': _mean([sample.sql_count for sample in samples]),
+            'max_count': max(sample.sql_count for sample in samples),
+            'mean_ms': _mean([sample.sql_ms for sample in samples]),
+        },
+        'template_ms': _mean([sample.template_ms for sample in samples]),
+        'context_processors_ms': {
+            processor: round(total / len(samples), 2) for processor, total in sorted(processors.items())
+        },
+        'repeated_statements': [
+            {'sql': sql, 'count': count, 'max_per_request': worst[sql]}
+            for sql, count in repeated.most_common(TOP_STATEMENTS)
+        ],
+    }
+
+
+store = ProfileStore()
+
+
+def should_profile(request):
+    if getattr(settings, 'REQUEST_PROFILING', False):
+        return True
+    return request.META.get(PROFILE_HEADER) == '1' and request.user.is_staff
+
+
+class ProfilingMiddleware:
+    """Goes after AuthenticationMiddleware, which the staff header check needs"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not should_profile(request):
+            return self.get_response(request)
+
+        profile = RequestProfile()
+        token = _current.set(profile)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(profile.execute))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+
+        sample = profile.sample()
+        match = request.resolver_match
+        store.add(match.view_name if match else '<unresolved>', sample)
+        response['Server-Timing'] = ', '.join([
+            f'total;dur={sample.total_ms}',
+            f'sql;dur={sample.sql_ms};desc="{sample.sql_count} queries"',
+            f'template;dur={sample.template_ms}',
+        ] + [f'{name};dur={ms:.2f}' for name, ms in sample.context_processors_ms.items()])
+        return response
@@ -0,0 +1,117 @@
+"""
+Query plans for the hot view queries.
+
+``hot_queries()`` catalogues the querysets the busiest views run, built by
+the helpers the views themselves call (the tour list's paginator, the
+``tour_cards`` projection, the dashboard rollup queries), and
+``check_plans()`` runs EXPLAIN over each one, flagging full table scans and
+whole-result sorts. The explain_hot_queries
+command prints the report; the test suite runs it with ``--strict`` so a
+dropped index or a rewritten query that stops using one fails the build.
+
+On PostgreSQL sequential scans are disabled for the EXPLAIN, so the planner
+only falls back to one when no index can answer the query (small test
+tables would otherwise always be scanned).
+"""
+from collections import namedtuple
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .pagination import KeysetPaginator
+from .tour_cards import TOUR_LIST_SORTS, listed_tours, tour_list_paginator
+
+HotQuery = namedtuple('HotQuery', 'name queryset')
+
+PlanReport = namedtuple('PlanReport', 'name plan problems')
+
+
+def _first_page(queryset, per_page):
+    # The admin and blog lists page newest first
+    return KeysetPaginator(queryset, per_page, ordering=('-created_at',)).first_page_query()
+
+
+def hot_queries():
+    """The queries the busiest views run, built by the same helpers the views use"""
+    from .models import TourSchedule, TourReview, Booking, Payment, CustomerMessage, BlogPost
+    from .stats import MAX_SPAN_DAYS, rollup_queries, stored_stats
+
+    end = timezone.localdate()
+    start = end - timedelta(days=MAX_SPAN_DAYS - 1)
+    bookings = Booking.objects.select_related('customer__user', 'tour', 'schedule')
+    payments = Payment.objects.select_related('booking', 'booking__customer', 'booking__tour')
+    reviews = TourReview.objects.select_related('tour', 'customer__user', 'booking')
+    threads = CustomerMessage.objects.filter(parent_message__isnull=True).select_related('customer__user', 'sender_admin')
+
+    queries = [
+        HotQuery(f'tour list: {sort}', tour_list_paginator(listed_tours(), sort).first_page_query())
+        for sort in TOUR_LIST_SORTS
+    ]
+    queries += [
+        HotQuery('tour detail: related tours', listed_tours().exclude(pk=1).filter(category_id=1)[:4]),
+        HotQuery('tour detail: approved reviews',
+                 TourReview.objects.filter(tour_id__in=[1], status='approved')
+                 .select_related('customer__user__customer_profile').order_by('-created_at')),
+        HotQuery('tour detail: available departures',
+                 TourSchedule.objects.filter(tour_id__in=[1], status='available').order_by('date', 'start_time')),
+        HotQuery('admin bookings', _first_page(bookings, 10)),
+        HotQuery('admin bookings: by status', _first_page(bookings.filter(status='pending'), 10)),
+        HotQuery('admin bookings: by payment status', _first_page(bookings.filter(payment_status='paid'), 10)),
+        HotQuery('admin payments', _first_page(payments, 10)),
+        HotQuery('admin payments: by status', _first_page(payments.filter(status='pending'), 10)),
+        HotQuery('admin tour reviews: by status', _first_page(reviews.filter(status='pending'), 10)),
+        HotQuery('admin inbox: threads', _first_page(threads, 20)),
+        HotQuery('admin inbox: unread count',
+                 CustomerMessage.objects.filter(is_read=False, sender_type='customer').order_by()),
+        HotQuery('customer inbox: thread',
+                 CustomerMessage.objects.filter(customer_id=1).order_by('created_at')),
+        HotQuery('blog list',
+                 _first_page(BlogPost.objects.filter(status='published').select_related('author', 'category'), 12)),
+        HotQuery('home: featured posts',
+                 BlogPost.objects.filter(status='published', is_featured=True).select_related('author')
+                 .order_by('-created_at')),
+        HotQuery('dashboard: stored daily stats', stored_stats(start, end)),
+        HotQuery('dashboard: pending reviews',
+                 TourReview.objects.filter(status='pending').order_by()),
+    ]
+    queries += [
+        HotQuery(f'daily rollup: {field}', queryset) for field, queryset in rollup_queries(start, end).items()
+    ]
+    return queries
+
+
+def explain(queryset):
+    """Plan lines for ``queryset`` on the default database"""
+    sql, params = queryset.query.sql_with_params()
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            return [row[-1] for row in cursor.fetchall()]
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute('SET LOCAL enable_seqscan = off')
+        cursor.execute(f'EXPLAIN {sql}', params)
+        return [row[0] for row in cursor.fetchall()]
+
+
+def plan_problems(plan):
+    """Full table scans and whole-result sorts in an EXPLAIN plan"""
+    problems = []
+    for line in plan:
+        detail = line.strip()
+        if connection.vendor == 'sqlite':
+            if detail.startswith('SCAN ') and ' USING ' not in detail:
+                problems.append(f'full scan of {detail.split()[1]}')
+            elif detail.startswith('USE TEMP B-TREE FOR ORDER BY'):
+                problems.append('sorts the whole result')
+        elif 'Seq Scan on ' in detail:
+            problems.append(f"full scan of {detail.split('Seq Scan on ')[1].split()[0]}")
+    return problems
+
+
+def check_plans():
+    reports = []
+    for query in hot_queries():
+        plan = explain(query.queryset)
+        reports.append(PlanReport(query.name, plan, plan_problems(plan)))
+    return reports
@@ -0,0 +1,74 @@
+"""
+Helpers for the denormalised Tour.average_rating / Tour.total_reviews columns.
+
+Listing pages sort and filter on these columns instead of aggregating
+TourReview per request. The TourReview signal keeps them current for single
+saves; the functions here recompute them in bulk (only approved reviews
+count) for the check_tour_ratings and update_tour_ratings commands.
+"""
+from decimal import Decimal, ROUND_HALF_UP
+
+from django.db.models import Avg, Count
+
+from .cache_deps import dependencies
+
+RATING_PLACES = Decimal('0.01')
+
+
+def quantize_rating(value):
+    return Decimal(str(value or 0)).quantize(RATING_PLACES, rounding=ROUND_HALF_UP)
+
+
+def approved_review_stats(tour_ids=None):
+    """
+    ``{tour_id: (average_rating, total_reviews)}`` for tours with approved
+    reviews, from a single grouped aggregate.
+    """
+    from .models import TourReview
+
+    reviews = TourReview.objects.filter(status='approved')
+    if tour_ids is not None:
+        reviews = reviews.filter(tour_id__in=tour_ids)
+    rows = reviews.values('tour_id').annotate(
+        avg_rating=Avg('overall_rating'),
+        review_count=Count('id')
+    ).order_by()
+    return {
+        row['tour_id']: (quantize_rating(row['avg_rating']), row['review_count'])
+        for row in rows
+    }
+
+
+def find_rating_drift(tour_ids=None, chunk_size=2000):
+    """
+    Yield ``(tour, expected_average, expected_total)`` for every tour whose
+    stored columns disagree with its approved reviews. Uses one grouped
+    aggregate plus a chunked scan of the tour table.
+    """
+    from .models import Tour
+
+    stats = approved_review_stats(tour_ids)
+    tours = Tour.objects.only('id', 'title', 'average_rating', 'total_reviews').order_by('pk')
+    if tour_ids is not None:
+        tours = tours.filter(pk__in=tour_ids)
+
+    no_reviews = (quantize_rating(0), 0)
+    for tour in tours.iterator(chunk_size=chunk_size):
+        average, total = stats.get(tour.pk, no_reviews)
+        if quantize_rating(tour.average_rating) != average or tour.total_reviews != total:
+            yield tour, average, total
+
+
+def apply_rating_fixes(fixes, batch_size=500):
+    """Write ``(tour, average, total)`` triples back with bulk_update. Returns the row count."""
+    from .models import Tour
+
+    tours = []
+    for tour, average, total in fixes:
+        tour.average_rating = average
+        tour.total_reviews = total
+        tours.append(tour)
+    Tour.objects.bulk_update(tours, ['average_rating', 'total_reviews'], batch_size=batch_size)
+    # bulk_update sends no signals
+    dependencies.changed(Tour, pk=[tour.pk for tour in tours])
+    return len(tours)
@@ -0,0 +1,109 @@
+"""
+Cached read models for public pages.
+
+TourDetailReadModel holds everything the tour detail page renders: the tour
+with its ordered child rows, the approved reviews, the rating histogram,
+the next available departures and the pricing table. Building one costs a
+fixed number of queries (the tour, one per prefetched relation, one review
+aggregate). Both languages' fields are loaded, so a read model is cached
+once per tour in the tiered payload cache and shared by every language. It
+is invalidated through the ``tour_detail`` cache dependency: per tour when
+the tour or one of its child rows changes, as a whole when a shared row
+(supplier, category, city, region) does.
+"""
+from django.db.models import Avg, Count, Prefetch, Q
+
+from .cache_deps import dependencies
+from .tiered_cache import payload_cache
+
+CACHE_TIMEOUT = 60 * 60
+
+UPCOMING_SCHEDULES = 10
+
+tour_detail = dependencies.declare(
+    'tour_detail',
+    models=('accounts.TourSupplier', 'accounts.Category', 'accounts.City', 'accounts.DestinationRegion'),
+    keyed={
+        'accounts.Tour': 'pk',
+        **{f'accounts.{model}': 'tour_id' for model in (
+            'TourImage', 'TourHighlight', 'TourIncluded', 'TourExcluded', 'TourItinerary', 'TourRequirement',
+            'TourFAQ', 'TourPricing', 'TourSchedule', 'TourReview',
+        )},
+    },
+)
+
+
+class TourDetailReadModel:
+    def __init__(self, tour, reviews, review_stats, schedules):
+        from .pricing import PricingTable
+
+        self.tour = tour
+        self.images = list(tour.images.all())
+        self.highlights = list(tour.highlights.all())
+        self.included_items = list(tour.included_items.all())
+        self.excluded_items = list(tour.excluded_items.all())
+        self.itinerary_steps = list(tour.itinerary_steps.all())
+        self.requirements = list(tour.requirements.all())
+        self.faqs = list(tour.faqs.all())
+        self.pricing_options = [option for option in tour.pricing_options.all() if option.is_active]
+        self.pricing_table = PricingTable.for_tour(tour)
+        self.schedules = schedules
+        self.reviews = reviews
+
+        self.total_reviews = review_stats['total']
+        self.avg_rating = review_stats['avg_rating'] or 0.0
+        self.rating_stats = {}
+        for star in range(5, 0, -1):
+            count = review_stats[f'stars_{star}']
+            self.rating_stats[star] = {
+                'count': count,
+                'percentage': (count / self.total_reviews) * 100 if self.total_reviews else 0,
+            }
+
+    @classmethod
+    def build(cls, tour_id):
+        """Load the page payload for an active tour; raises Tour.DoesNotExist otherwise"""
+        from .models import (
+            Tour, TourImage, TourHighlight, TourIncluded, TourExcluded, TourItinerary,
+            TourRequirement, TourFAQ, TourSchedule, TourReview,
+        )
+
+        tour = Tour.objects.select_related(
+            'supplier', 'category', 'destination_region', 'city'
+        ).prefetch_related(
+            Prefetch('images', queryset=TourImage.objects.order_by('display_order')),
+            Prefetch('highlights', queryset=TourHighlight.objects.order_by('display_order')),
+            Prefetch('included_items', queryset=TourIncluded.objects.order_by('display_order')),
+            Prefetch('excluded_items', queryset=TourExcluded.objects.order_by('display_order')),
+            Prefetch('itinerary_steps', queryset=TourItinerary.objects.order_by('step_number')),
+            Prefetch('requirements', queryset=TourRequirement.objects.order_by('display_order')),
+            Prefetch('faqs', queryset=TourFAQ.objects.order_by('display_order')),
+            'pricing_options',
+            Prefetch(
+                'schedules',
+                queryset=TourSchedule.objects.filter(status='available').order_by('date', 'start_time'),
+                to_attr='available_schedules'
+            ),
+            Prefetch(
+                'reviews',
+                queryset=TourReview.objects.filter(status='approved').select_related(
+                    'customer__user__customer_profile'
+                ).order_by('-created_at'),
+                to_attr='approved_reviews'
+            ),
+        ).get(pk=tour_id, status='active')
+
+        review_stats = TourReview.objects.filter(tour_id=tour_id, status='approved').aggregate(
+            total=Count('id'),
+            avg_rating=Avg('overall_rating'),
+            **{f'stars_{star}': Count('id', filter=Q(overall_rating=star)) for star in range(1, 6)}
+        )
+        return cls(tour, tour.approved_reviews, review_stats, tour.available_schedules[:UPCOMING_SCHEDULES])
+
+    @classmethod
+    def get(cls, tour_id):
+        """Cached read model for ``tour_id``; raises Tour.DoesNotExist for missing or inactive tours"""
+        return payload_cache.get_or_set(
+            f'tour_detail:{tour_id}', lambda: cls.build(tour_id), CACHE_TIMEOUT,
+            tags=tour_detail.tags(tour_id)
+        )
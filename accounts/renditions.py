@@ -0,0 +1,171 @@
+"""
+Resized copies of uploaded images.
+
+Every image in ``IMAGE_FIELDS`` gets WebP and JPEG renditions at each of
+``WIDTHS`` narrower than the original, saved next to it in the same storage:
+``tours/canal.jpg`` gets ``tours/canal.w640.webp`` and ``tours/canal.w640.jpg``.
+Nothing is upscaled, so small originals have fewer or no renditions and
+templates fall back to the original.
+
+Uploads are processed after commit on a thread pool of
+``settings.IMAGE_RENDITION_WORKERS`` threads (0 renders inline). Existing
+media is processed with the ``generate_renditions`` command. Templates read
+renditions through the ``srcset`` tag and ``rendition`` filter in
+``image_tags``. Which widths exist for an image is cached, so rendering a
+card list does not stat the storage for every image. Once an upload is
+rendered, tours using it as their card image get its thumbnail
+(accounts/tour_cards.py).
+"""
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connection, transaction
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+WIDTHS = (320, 640, 960, 1280, 1920)
+
+# Pillow format, file extension, save options
+FORMATS = {
+    'webp': ('WEBP', 'webp', {'quality': 80, 'method': 4}),
+    'jpeg': ('JPEG', 'jpg', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+# accounts models and their image fields that get renditions
+IMAGE_FIELDS = {
+    'Tour': ('main_image',),
+    'TourImage': ('image',),
+    'Slider': ('image',),
+    'City': ('image',),
+    'Country': ('flag_image', 'image'),
+    'DestinationRegion': ('image', 'cover_image'),
+    'Category': ('image',),
+    'TourSupplier': ('logo',),
+    'BlogPost': ('featured_image',),
+    'FeatureSection': ('banner',),
+}
+
+RENDITION_NAME = re.compile(r'\.w\d+\.(?:webp|jpg)$')
+
+CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def image_fields():
+    """``(model, field names)`` for every model in IMAGE_FIELDS"""
+    return [(apps.get_model('accounts', model), fields) for model, fields in IMAGE_FIELDS.items()]
+
+
+def rendition_name(name, width, format='webp'):
+    return f'{os.path.splitext(name)[0]}.w{width}.{FORMATS[format][1]}'
+
+
+def is_rendition(name):
+    return bool(RENDITION_NAME.search(name))
+
+
+def _cache_key(name):
+    return f'renditions:{name}'
+
+
+def available_widths(name, storage=default_storage):
+    """Widths that have renditions, smallest first"""
+    widths = cache.get(_cache_key(name))
+    if widths is None:
+        widths = tuple(width for width in WIDTHS if storage.exists(rendition_name(name, width)))
+        cache.set(_cache_key(name), widths, CACHE_TIMEOUT)
+    return widths
+
+
+def _prepare(image, format):
+    if format == 'jpeg':
+        if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+            image = image.convert('RGBA')
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel('A'))
+            return background
+        return image.convert('RGB')
+    if image.mode not in ('RGB', 'RGBA'):
+        return image.convert('RGBA' if 'transparency' in image.info or image.mode in ('LA', 'PA') else 'RGB')
+    return image
+
+
+def generate(name, storage=default_storage):
+    """Write the renditions of ``name`` and return their widths"""
+    with storage.open(name, 'rb') as source:
+        image = Image.open(source)
+        image.load()
+    image = ImageOps.exif_transpose(image)
+
+    widths = []
+    for width in WIDTHS:
+        if width >= image.width:
+            break
+        resized = image.resize((width, max(round(image.height * width / image.width), 1)), Image.Resampling.LANCZOS,
+                               reducing_gap=3.0)
+        for format, (pillow_format, extension, options) in FORMATS.items():
+            output = BytesIO()
+            _prepare(resized, format).save(output, pillow_format, **options)
+            target = rendition_name(name, width, format)
+            if storage.exists(target):
+                storage.delete(target)
+            storage.save(target, ContentFile(output.getvalue()))
+        widths.append(width)
+
+    cache.set(_cache_key(name), tuple(widths), CACHE_TIMEOUT)
+    return widths
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _executor():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=settings.IMAGE_RENDITION_WORKERS, thread_name_prefix='renditions')
+        return _pool
+
+
+def _generate_quietly(name, storage):
+    from .models import Tour
+    from .tour_cards import refresh_card_images
+
+    try:
+        generate(name, storage)
+        # Tours showing this image on their card can now point at its thumbnail
+        refresh_card_images(Tour.objects.filter(card_image=name))
+    except Exception:
+        # A broken upload must not take the worker down; the backfill command reports these
+        logger.exception('Rendition error for %s', name)
+
+
+def _generate_in_worker(name, storage):
+    try:
+        _generate_quietly(name, storage)
+    finally:
+        # Pool threads outlive requests, so nothing else closes the connection refresh_card_images opened
+        connection.close()
+
+
+def schedule(name, storage=default_storage):
+    """Render ``name`` once the current transaction commits"""
+    if settings.IMAGE_RENDITION_WORKERS == 0:
+        transaction.on_commit(lambda: _generate_quietly(name, storage))
+    else:
+        transaction.on_commit(lambda: _executor().submit(_generate_in_worker, name, storage))
+
+
+def needs_renditions(file):
+    """Whether an ImageField value has none of its renditions yet"""
+    return bool(file) and not file.storage.exists(rendition_name(file.name, WIDTHS[0]))
@@ -0,0 +1,227 @@
+"""
+Full-text search index over Tour.
+
+SQLite keeps an FTS5 virtual table, PostgreSQL a tsvector column with a GIN
+index. Both live in the ``accounts_toursearch`` table (created by migration
+0026), are keyed by tour id and are kept current by the Tour, City and
+DestinationRegion signals in accounts/signals.py.
+
+Listing views filter and rank inside their own query with ``matching()``
+and ``rank()``, so every other filter applies to the full set of matches.
+``search_tour_ids()`` returns a capped, ranked id list on its own.
+"""
+import re
+
+from django.db import connection
+from django.db.models import FloatField, Q
+from django.db.models.expressions import RawSQL
+
+SEARCH_TABLE = 'accounts_toursearch'
+
+# Upper bound on the ids search_tour_ids() returns
+MAX_RESULTS = 1000
+
+# Indexed columns, in the order used by the FTS5 table and bm25() weights
+COLUMNS = (
+    'title', 'title_dk',
+    'short_description', 'short_description_dk',
+    'description', 'description_dk',
+    'location',
+)
+BM25_WEIGHTS = (10.0, 10.0, 4.0, 4.0, 1.0, 1.0, 6.0)
+
+# tsvector weight and text search configuration per column on PostgreSQL
+PG_COLUMN_CONFIG = {
+    'title': ('A', 'english'),
+    'title_dk': ('A', 'danish'),
+    'short_description': ('B', 'english'),
+    'short_description_dk': ('B', 'danish'),
+    'description': ('C', 'english'),
+    'description_dk': ('C', 'danish'),
+    'location': ('A', 'simple'),
+}
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def is_supported():
+    return connection.vendor in ('sqlite', 'postgresql')
+
+
+def tokenize(query):
+    """Split a raw search box value into lower-cased word tokens"""
+    return [token.lower() for token in TOKEN_RE.findall(query or '')][:10]
+
+
+def tour_document(tour):
+    """Column values indexed for a single tour"""
+    location_parts = []
+    if tour.city_id:
+        location_parts += [tour.city.name, tour.city.name_dk]
+    if tour.destination_region_id:
+        location_parts += [tour.destination_region.name, tour.destination_region.name_dk]
+
+    return {
+        'title': tour.title or '',
+        'title_dk': tour.title_dk or '',
+        'short_description': tour.short_description or '',
+        'short_description_dk': tour.short_description_dk or '',
+        'description': tour.description or '',
+        'description_dk': tour.description_dk or '',
+        'location': ' '.join(part for part in location_parts if part),
+    }
+
+
+def _pg_document_sql():
+    parts = []
+    for column in COLUMNS:
+        weight, config = PG_COLUMN_CONFIG[column]
+        parts.append(f"setweight(to_tsvector('{config}', %s), '{weight}')")
+    return ' || '.join(parts)
+
+
+def index_tour(tour):
+    """Insert or replace the index row for a tour"""
+    index_tours([tour])
+
+
+def index_tours(tours):
+    """Insert or replace the index rows for ``tours``, one batched statement per step"""
+    if not is_supported():
+        return
+    rows = []
+    for tour in tours:
+        document = tour_document(tour)
+        rows.append([tour.pk] + [document[column] for column in COLUMNS])
+    if not rows:
+        return
+
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.executemany(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [row[:1] for row in rows])
+            cursor.executemany(
+                f"INSERT INTO {SEARCH_TABLE} (rowid, {', '.join(COLUMNS)}) "
+                f"VALUES (%s, {', '.join(['%s'] * len(COLUMNS))})",
+                rows
+            )
+        else:
+            cursor.executemany(
+                f'INSERT INTO {SEARCH_TABLE} (tour_id, document) VALUES (%s, {_pg_document_sql()}) '
+                f'ON CONFLICT (tour_id) DO UPDATE SET document = EXCLUDED.document',
+                rows
+            )
+
+
+def remove_tour(tour_id):
+    if not is_supported():
+        return
+    key = 'rowid' if connection.vendor == 'sqlite' else 'tour_id'
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE {key} = %s', [tour_id])
+
+
+def rebuild_index():
+    """Drop every index row and re-index all tours. Returns the tour count."""
+    from .models import Tour
+
+    if not is_supported():
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE}')
+
+    count, batch = 0, []
+    tours = Tour.objects.select_related('city', 'destination_region').order_by('pk')
+    for tour in tours.iterator(chunk_size=500):
+        batch.append(tour)
+        if len(batch) == 500:
+            index_tours(batch)
+            count, batch = count + len(batch), []
+    index_tours(batch)
+    return count + len(batch)
+
+
+def search_tour_ids(query, limit=MAX_RESULTS):
+    """
+    Return tour ids matching ``query``, best match first.
+
+    Every token must match (as a prefix) in at least one indexed column of
+    either language. Returns ``None`` when the database has no search index,
+    so callers can fall back to plain ``icontains`` filtering.
+    """
+    if not is_supported():
+        return None
+    tokens = tokenize(query)
+    if not tokens:
+        return []
+
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            match = _sqlite_match(tokens)
+            weights = ', '.join(str(weight) for weight in BM25_WEIGHTS)
+            cursor.execute(
+                f'SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s '
+                f'ORDER BY bm25({SEARCH_TABLE}, {weights}) LIMIT %s',
+                [match, limit]
+            )
+        else:
+            tsquery = ' & '.join("'%s':*" % token.replace("'", '') for token in tokens)
+            cursor.execute(
+                f"SELECT tour_id FROM {SEARCH_TABLE}, "
+                f"(SELECT to_tsquery('english', %s) || to_tsquery('danish', %s) "
+                f"|| to_tsquery('simple', %s) AS q) query "
+                f"WHERE document @@ query.q "
+                f"ORDER BY ts_rank(document, query.q) DESC LIMIT %s",
+                [tsquery, tsquery, tsquery, limit]
+            )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def _sqlite_match(tokens):
+    return ' '.join('"%s"*' % token for token in tokens)
+
+
+def _pg_tsquery_sql(tokens):
+    tsquery = ' & '.join("'%s':*" % token.replace("'", '') for token in tokens)
+    sql = "(to_tsquery('english', %s) || to_tsquery('danish', %s) || to_tsquery('simple', %s))"
+    return sql, [tsquery, tsquery, tsquery]
+
+
+def matching(query):
+    """
+    A filter for the tours matching ``query``, as a subquery on the index,
+    or ``None`` when the database has no search index.
+    """
+    if not is_supported():
+        return None
+    tokens = tokenize(query)
+    if not tokens:
+        return Q(pk__in=[])
+    if connection.vendor == 'sqlite':
+        ids = RawSQL(f'SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s', [_sqlite_match(tokens)])
+    else:
+        tsquery, params = _pg_tsquery_sql(tokens)
+        ids = RawSQL(f'SELECT tour_id FROM {SEARCH_TABLE} WHERE document @@ {tsquery}', params)
+    return Q(pk__in=ids)
+
+
+def rank(query):
+    """
+    Relevance of each tour to ``query``, lower is better, looked up in the
+    index by tour id. Only meaningful on a queryset filtered by ``matching()``.
+    """
+    from .models import Tour
+
+    tokens = tokenize(query)
+    tour_id = f'{connection.ops.quote_name(Tour._meta.db_table)}.{connection.ops.quote_name(Tour._meta.pk.column)}'
+    if connection.vendor == 'sqlite':
+        weights = ', '.join(str(weight) for weight in BM25_WEIGHTS)
+        return RawSQL(
+            f'SELECT bm25({SEARCH_TABLE}, {weights}) FROM {SEARCH_TABLE} '
+            f'WHERE {SEARCH_TABLE} MATCH %s AND rowid = {tour_id}',
+            [_sqlite_match(tokens)], output_field=FloatField()
+        )
+    tsquery, params = _pg_tsquery_sql(tokens)
+    return RawSQL(
+        f'SELECT -ts_rank(document, {tsquery}) FROM {SEARCH_TABLE} WHERE tour_id = {tour_id}',
+        params, output_field=FloatField()
+    )
@@ -1,7 +1,21 @@
+from django.db import transaction
+from django.utils import timezone
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.db.models import Avg, Count
-from .models import TourReview, Tour
+from .models import (
+    TourReview, Tour, City, DestinationRegion,
+    Booking, Payment, Customer, TourPricing, TourImage,
+)
+from . import search
+from .facets import tour_facets
+from .cache_deps import dependencies
+# Imported for the cache dependencies they declare
+from . import page_cache, read_models, site_chrome
+from .stats import refresh_day
+from .pricing import invalidate_pricing_table
+from . import renditions
+from .tour_cards import refresh_card_images
 
 @receiver(post_save, sender=TourReview)
 @receiver(post_delete, sender=TourReview)
@@ -17,3 +31,127 @@ def update_tour_rating(sender, instance, **kwargs):
     tour.average_rating = stats['avg_rating'] or 0
     tour.total_reviews = stats['count'] or 0
     tour.save(update_fields=['average_rating', 'total_reviews'])
+
+
+SEARCH_INDEXED_FIELDS = {
+    'title', 'title_dk', 'short_description', 'short_description_dk',
+    'description', 'description_dk', 'city', 'destination_region',
+}
+
+@receiver(post_save, sender=Tour)
+def index_tour_for_search(sender, instance, update_fields=None, raw=False, **kwargs):
+    if raw:
+        return
+    # Rating/booking counter updates don't touch indexed text
+    if update_fields and not SEARCH_INDEXED_FIELDS.intersection(update_fields):
+        return
+    search.index_tour(instance)
+
+@receiver(post_delete, sender=Tour)
+def remove_tour_from_search(sender, instance, **kwargs):
+    search.remove_tour(instance.pk)
+
+@receiver(post_save, sender=City)
+def reindex_city_tours(sender, instance, created=False, raw=False, **kwargs):
+    if created or raw:
+        return
+    search.index_tours(instance.tours.select_related('city', 'destination_region'))
+
+@receiver(post_save, sender=DestinationRegion)
+def reindex_region_tours(sender, instance, created=False, raw=False, **kwargs):
+    if created or raw:
+        return
+    search.index_tours(instance.tours.select_related('city', 'destination_region'))
+
+
+FACET_FIELDS = {'status', 'category', 'destination_region', 'city', 'supplier'}
+
+@receiver(post_save, sender=Tour)
+def update_tour_facets(sender, instance, update_fields=None, raw=False, **kwargs):
+    if raw:
+        return
+    if update_fields and not FACET_FIELDS.intersection(update_fields):
+        return
+    transaction.on_commit(lambda: tour_facets.update_tour(instance))
+
+@receiver(post_delete, sender=Tour)
+def remove_tour_facets(sender, instance, **kwargs):
+    tour_id = instance.pk
+    transaction.on_commit(lambda: tour_facets.remove_tour(tour_id))
+
+@receiver(post_save, sender=City)
+def invalidate_city_facets(sender, instance, created=False, raw=False, **kwargs):
+    # Tours inherit their country facet from the city
+    if created or raw:
+        return
+    transaction.on_commit(tour_facets.invalidate)
+
+
+# Cached pages, read models and the site chrome declare the models they read (accounts/cache_deps.py);
+# one receiver for every model invalidates them when the transaction commits
+dependencies.connect()
+
+
+@receiver(post_save, sender=Booking)
+@receiver(post_delete, sender=Booking)
+@receiver(post_save, sender=Payment)
+@receiver(post_delete, sender=Payment)
+@receiver(post_save, sender=Customer)
+@receiver(post_delete, sender=Customer)
+@receiver(post_save, sender=TourReview)
+@receiver(post_delete, sender=TourReview)
+def update_daily_stats(sender, instance, raw=False, **kwargs):
+    if raw or not instance.created_at:
+        return
+    day = timezone.localdate(instance.created_at)
+    # The record is already committed; a failed rollup must not fail the request
+    transaction.on_commit(lambda: refresh_day(day), robust=True)
+
+
+@receiver(post_save, sender=TourPricing)
+@receiver(post_delete, sender=TourPricing)
+def invalidate_tour_pricing(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    tour_id = instance.tour_id
+    transaction.on_commit(lambda: invalidate_pricing_table(tour_id))
+
+@receiver(post_save, sender=Tour)
+@receiver(post_delete, sender=Tour)
+def invalidate_tour_base_price(sender, instance, update_fields=None, raw=False, **kwargs):
+    # The table falls back to the tour's base price and currency
+    if raw or (update_fields and not {'base_price', 'currency'}.intersection(update_fields)):
+        return
+    tour_id = instance.pk
+    transaction.on_commit(lambda: invalidate_pricing_table(tour_id))
+
+
+@receiver(post_save, sender=TourImage)
+@receiver(post_delete, sender=TourImage)
+def refresh_tour_card_image(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    tour_id = instance.tour_id
+    transaction.on_commit(lambda: refresh_card_images(Tour.objects.filter(pk=tour_id)))
+
+@receiver(post_save, sender=Tour)
+def refresh_own_card_image(sender, instance, update_fields=None, raw=False, **kwargs):
+    # The card falls back to the main image
+    if raw or (update_fields and 'main_image' not in update_fields):
+        return
+    tour_id = instance.pk
+    transaction.on_commit(lambda: refresh_card_images(Tour.objects.filter(pk=tour_id)))
+
+
+def schedule_image_renditions(sender, instance, update_fields=None, raw=False, **kwargs):
+    if raw:
+        return
+    for name in renditions.IMAGE_FIELDS[sender.__name__]:
+        if update_fields and name not in update_fields:
+            continue
+        file = getattr(instance, name)
+        if renditions.needs_renditions(file):
+            renditions.schedule(file.name, file.storage)
+
+for model, fields in renditions.image_fields():
+    post_save.connect(schedule_image_renditions, sender=model, dispatch_uid=f'renditions_{model.__name__}')
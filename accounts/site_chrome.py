@@ -0,0 +1,42 @@
+"""
+Cached site chrome for the site_settings context processor.
+
+Every public page renders the header and footer from SiteSetting and the
+active WebsiteMenu rows (with their submenus). The payload doesn't depend on
+the visitor's language (templates pick the translated fields), so one copy is
+built and kept in the tiered payload cache (accounts/tiered_cache.py). It
+declares the models it reads in the cache dependency registry
+(accounts/cache_deps.py), which invalidates it when any of them change. In
+steady state rendering the chrome costs no queries.
+"""
+from .cache_deps import dependencies
+from .tiered_cache import payload_cache
+
+chrome = dependencies.declare('site_chrome', models=(
+    'accounts.SiteSetting', 'accounts.WebsiteMenu', 'accounts.WebsiteSubMenu',
+))
+
+CACHE_KEY = 'site_chrome'
+
+CACHE_TIMEOUT = 60 * 60 * 6
+
+
+def build_chrome():
+    """Load settings and both menu sections with their submenus prefetched"""
+    from .models import SiteSetting, WebsiteMenu
+
+    menus = list(
+        WebsiteMenu.objects.filter(status='active', section_type__in=['header', 'footer'])
+        .prefetch_related('submenus')
+        .order_by('rank', '-created_at')
+    )
+    return {
+        'site_settings': SiteSetting.get_settings(),
+        'website_menus': [menu for menu in menus if menu.section_type == 'header'],
+        'website_menus_footer': [menu for menu in menus if menu.section_type == 'footer'],
+    }
+
+
+def site_chrome():
+    """The cached chrome payload"""
+    return payload_cache.get_or_set(CACHE_KEY, build_chrome, CACHE_TIMEOUT, tags=chrome.tags())
@@ -0,0 +1,226 @@
+"""
+Static files storage for production: content-hashed names, per-layout bundles
+and precompressed siblings.
+
+``CompressedManifestStaticFilesStorage`` is ManifestStaticFilesStorage plus
+two steps at ``collectstatic`` time:
+
+* Before hashing it builds the bundles declared in templates with
+  ``{% bundle "name.css" %}...{% endbundle %}`` (bundle_tags). The files that
+  the block's ``{% static %}`` tags reference are concatenated in order into
+  ``bundles/<name>``. CSS is minified, its relative ``url()`` references are
+  rewritten for the new location and ``@import`` rules are hoisted to the top.
+  JS is minified only when rjsmin is installed.
+* After hashing it writes ``.gz`` (and ``.br`` when brotli is installed)
+  next to every compressible hashed file, on a thread pool. The web server
+  serves those as-is (nginx ``gzip_static``/``brotli_static``) and can mark
+  the hashed names immutable.
+
+Until collectstatic has written a manifest (development, tests), URLs stay
+unhashed and bundle blocks render their original tags.
+"""
+import gzip
+import os
+import posixpath
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+from django.template import engines
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+BUNDLE_DIR = 'bundles'
+
+COMPRESSIBLE_EXTENSIONS = {'.css', '.js', '.mjs', '.map', '.json', '.svg', '.html', '.txt', '.xml', '.ico', '.ttf', '.otf', '.eot'}
+
+# Below this, compressing saves less than the Content-Encoding header costs
+COMPRESS_MIN_SIZE = 256
+
+BUNDLE_BLOCK = re.compile(r'{%\s*bundle\s+["\']([^"\']+)["\']\s*%}(.*?){%\s*endbundle\s*%}', re.S)
+STATIC_REFERENCE = re.compile(r'{%\s*static\s+["\']([^"\']+)["\']\s*%}')
+
+_CSS_STRING = r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\''
+_CSS_COMMENTS = re.compile(rf'({_CSS_STRING})|/\*.*?\*/', re.S)
+_CSS_STRINGS = re.compile(rf'({_CSS_STRING})', re.S)
+_CSS_URL = re.compile(r'url\(\s*(["\']?)([^"\')]+)\1\s*\)')
+_CSS_PUNCTUATION = re.compile(r'\s*([{};,>])\s*')
+_CSS_IMPORT = re.compile(r'@import\s*(?:url\([^)]*\)|"[^"]*"|\'[^\']*\')[^;]*;')
+_CSS_CHARSET = re.compile(r'@charset\s[^;]*;')
+_SOURCE_MAP = re.compile(r'^\s*(?://|/\*)# sourceMappingURL=.*$', re.M)
+
+
+def template_files():
+    for engine in engines.all():
+        for directory in getattr(engine, 'template_dirs', ()):
+            for root, dirs, files in os.walk(directory):
+                for name in files:
+                    if name.endswith('.html'):
+                        yield os.path.join(root, name)
+
+
+def find_bundles():
+    """``{bundle name: [static paths in order]}`` declared across the templates"""
+    bundles = {}
+    for path in template_files():
+        with open(path, encoding='utf-8') as template:
+            source = template.read()
+        for name, block in BUNDLE_BLOCK.findall(source):
+            paths = STATIC_REFERENCE.findall(block)
+            if bundles.setdefault(name, paths) != paths:
+                raise ValueError(f'Bundle {name!r} is declared with different files in {path}')
+    return bundles
+
+
+def _read(path):
+    with open(path, 'rb') as source:
+        data = source.read()
+    try:
+        return data.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        return data.decode('latin-1')
+
+
+def rebase_css_urls(css, source_path, target_dir=BUNDLE_DIR):
+    """Rewrite relative ``url()`` references in ``source_path`` so they resolve from ``target_dir``"""
+    source_dir = posixpath.dirname(source_path)
+
+    def rebase(match):
+        quote, url = match.groups()
+        if url.startswith(('data:', 'http:', 'https:', '//', '/', '#')):
+            return match.group(0)
+        path, suffix = re.match(r'([^?#]*)(.*)', url).groups()
+        resolved = posixpath.normpath(posixpath.join(source_dir, path))
+        return f'url({quote}{posixpath.relpath(resolved, target_dir)}{suffix}{quote})'
+
+    return _CSS_URL.sub(rebase, css)
+
+
+def minify_css(css):
+    """Drop comments and redundant whitespace, leaving strings untouched"""
+    css = _CSS_COMMENTS.sub(lambda match: match.group(1) or '', css)
+    # With comments gone, every other piece is a string literal
+    pieces = _CSS_STRINGS.split(css)
+    return ''.join(
+        piece if index % 2 else _minify_css_code(piece) for index, piece in enumerate(pieces)
+    ).strip()
+
+
+def _minify_css_code(code):
+    code = re.sub(r'\s+', ' ', code)
+    code = _CSS_PUNCTUATION.sub(r'\1', code)
+    return code.replace(';}', '}')
+
+
+def build_css_bundle(paths, files):
+    imports, rules, charset = [], [], False
+    for path in paths:
+        css = _SOURCE_MAP.sub('', _read(files[path]))
+        css = minify_css(rebase_css_urls(css, path))
+        if _CSS_CHARSET.search(css):
+            charset = True
+            css = _CSS_CHARSET.sub('', css)
+        # @import is only valid before every other rule
+        imports.extend(_CSS_IMPORT.findall(css))
+        rules.append(_CSS_IMPORT.sub('', css))
+    return ('@charset "UTF-8";' if charset else '') + ''.join(imports) + '\n'.join(rules) + '\n'
+
+
+def build_js_bundle(paths, files):
+    scripts = []
+    for path in paths:
+        js = _SOURCE_MAP.sub('', _read(files[path]))
+        scripts.append(rjsmin.jsmin(js) if rjsmin else js.strip())
+    # A file without a trailing semicolon must not run into the next one
+    return '\n;\n'.join(scripts) + '\n'
+
+
+def build_bundle(name, paths):
+    files = {path: finders.find(path) for path in paths}
+    # A reference to a missing file was a 404 before bundling; leave it out
+    paths = [path for path in paths if files[path]]
+    if name.endswith('.css'):
+        return build_css_bundle(paths, files)
+    if name.endswith('.js'):
+        return build_js_bundle(paths, files)
+    raise ValueError(f'Bundle {name!r} must end in .css or .js')
+
+
+def compress_file(path):
+    """Write ``.gz``/``.br`` siblings of ``path`` where they are smaller; returns the bytes saved by the smallest"""
+    with open(path, 'rb') as source:
+        data = source.read()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return 0
+
+    variants = [('.gz', gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli:
+        variants.append(('.br', brotli.compress(data)))
+    smallest = len(data)
+    for extension, compressed in variants:
+        if len(compressed) < len(data) * 0.95:
+            with open(path + extension, 'wb') as target:
+                target.write(compressed)
+            smallest = min(smallest, len(compressed))
+    return len(data) - smallest
+
+
+def compressed_size(path):
+    """Size the server sends for ``path``: its smallest precompressed sibling, or the file itself"""
+    sizes = [os.path.getsize(path + extension) for extension in ('.br', '.gz') if os.path.exists(path + extension)]
+    return min(sizes) if sizes else os.path.getsize(path)
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    keep_intermediate_files = False
+
+    def stored_name(self, name):
+        if not self.hashed_files:
+            return name
+        try:
+            return super().stored_name(name)
+        except ValueError:
+            # Referenced by a template but not shipped; keep the plain URL rather than failing the page
+            return name
+
+    def url_converter(self, name, hashed_files, template=None):
+        convert = super().url_converter(name, hashed_files, template)
+
+        def converter(matchobj):
+            try:
+                return convert(matchobj)
+            except ValueError:
+                # Vendor CSS pointing at files that aren't shipped; leave the reference as written
+                return matchobj.groupdict()['matched']
+
+        return converter
+
+    def post_process(self, paths, dry_run=False, **options):
+        if dry_run:
+            return
+
+        for name, sources in find_bundles().items():
+            target = f'{BUNDLE_DIR}/{name}'
+            if self.exists(target):
+                self.delete(target)
+            self._save(target, ContentFile(build_bundle(name, sources).encode('utf-8')))
+            paths[target] = (self, target)
+
+        yield from super().post_process(paths, dry_run, **options)
+
+        names = [
+            name for name in set(self.hashed_files.values())
+            if os.path.splitext(name)[1].lower() in COMPRESSIBLE_EXTENSIONS and self.exists(name)
+        ]
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 2) as pool:
+            list(pool.map(compress_file, (self.path(name) for name in names)))
@@ -0,0 +1,141 @@
+"""
+Daily rollups for the admin dashboard.
+
+DailyStats keeps one row per day with the number of bookings, completed
+payment revenue, new customers and reviews created that day. Days are
+recomputed from the source tables (never incremented), so edits such as a
+payment moving to ``completed`` are picked up by re-rolling its day. The
+signals in accounts/signals.py re-roll the affected day on commit and the
+rebuild_daily_stats command backfills arbitrary ranges.
+"""
+from bisect import bisect_right
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+ROLLUP_FIELDS = ('bookings', 'revenue', 'new_customers', 'reviews')
+
+# Longest range a dashboard request may chart (and so roll up); older history is rebuild_daily_stats' job
+MAX_SPAN_DAYS = 366
+
+
+def _day_start(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def _daily_counts(queryset, start, end, value=None):
+    # A plain range on created_at (not created_at__date) so the created_at indexes apply
+    return queryset.filter(
+        created_at__gte=_day_start(start), created_at__lt=_day_start(end + timedelta(days=1))
+    ).annotate(day=TruncDate('created_at')).values('day').annotate(
+        value=value or Count('id')
+    ).order_by()
+
+
+def rollup_queries(start, end):
+    """The grouped ``{field: queryset}`` queries ``rollup`` reads for ``start..end``"""
+    from .models import Booking, Payment, Customer, TourReview
+
+    return {
+        'bookings': _daily_counts(Booking.objects.all(), start, end),
+        'revenue': _daily_counts(Payment.objects.filter(status='completed'), start, end, Sum('amount')),
+        'new_customers': _daily_counts(Customer.objects.all(), start, end),
+        'reviews': _daily_counts(TourReview.objects.all(), start, end),
+    }
+
+
+def stored_stats(start, end):
+    """The stored DailyStats values for ``start..end``"""
+    from .models import DailyStats
+
+    return DailyStats.objects.filter(date__gte=start, date__lte=end).values('date', *ROLLUP_FIELDS)
+
+
+def rollup(start, end):
+    """``{date: {field: value}}`` for every day in ``start..end`` (inclusive), from four grouped queries"""
+    sources = {
+        field: {row['day']: row['value'] for row in queryset}
+        for field, queryset in rollup_queries(start, end).items()
+    }
+    days = {}
+    day = start
+    while day <= end:
+        days[day] = {
+            field: sources[field].get(day) or (Decimal('0') if field == 'revenue' else 0)
+            for field in ROLLUP_FIELDS
+        }
+        day += timedelta(days=1)
+    return days
+
+
+def rebuild_daily_stats(start, end):
+    """Recompute and upsert the rows for ``start..end``. Returns the number of days written."""
+    from .db_router import primary_reads
+    from .models import DailyStats
+
+    # Aggregates from a lagging replica would overwrite fresher rows on the primary
+    with primary_reads():
+        days = rollup(start, end)
+    DailyStats.objects.bulk_create(
+        [DailyStats(date=day, **values) for day, values in days.items()],
+        update_conflicts=True,
+        unique_fields=['date'],
+        update_fields=list(ROLLUP_FIELDS) + ['updated_at'],
+        batch_size=500,
+    )
+    return len(days)
+
+
+def refresh_day(day):
+    rebuild_daily_stats(day, day)
+
+
+def clamp_start(start, end):
+    """``start``, moved forward so ``start..end`` spans at most MAX_SPAN_DAYS"""
+    return max(start, end - timedelta(days=MAX_SPAN_DAYS - 1))
+
+
+def stats_series(start, end, buckets):
+    """
+    Split ``start..end`` into ``buckets`` consecutive windows and return
+    ``[(window_start, window_end, {field: total})]``, read from the stored
+    rows. Days up to today that have no row yet (history before the table
+    existed, quiet days) are rolled up first. ``start`` is clamped to
+    MAX_SPAN_DAYS before ``end``.
+    """
+    from .db_router import primary_reads
+
+    start = clamp_start(start, end)
+    span = (end - start).days + 1
+    buckets = max(1, min(buckets, span))
+    offsets = [round(index * span / buckets) for index in range(buckets + 1)]
+    windows = [
+        (start + timedelta(days=offsets[index]), start + timedelta(days=offsets[index + 1] - 1),
+         {field: 0 for field in ROLLUP_FIELDS})
+        for index in range(buckets)
+    ]
+
+    def stored():
+        return list(stored_stats(start, end))
+
+    def missing_days(rows):
+        return last_day >= start and sum(row['date'] <= last_day for row in rows) < (last_day - start).days + 1
+
+    rows = stored()
+    last_day = min(end, timezone.localdate())
+    if missing_days(rows):
+        # The replica may just lag behind; only the primary decides what needs a rollup
+        with primary_reads():
+            rows = stored()
+            if missing_days(rows):
+                rebuild_daily_stats(start, last_day)
+                rows = stored()
+
+    for row in rows:
+        totals = windows[bisect_right(offsets, (row['date'] - start).days) - 1][2]
+        for field in ROLLUP_FIELDS:
+            totals[field] += row[field]
+    return windows
@@ -46,7 +46,7 @@ def supplier_tours(request):
     else:
         form = SupplierTourForm()
 
-    tours_list = Tour.objects.filter(supplier=supplier).order_by('-created_at')
+    tours_list = Tour.objects.filter(supplier=supplier).select_related('city').order_by('-created_at')
     
     paginator = Paginator(tours_list, 10) # Show 10 tours per page
     page_number = request.GET.get('page')
@@ -108,8 +108,8 @@ def supplier_tour_view(request, tour_id):
     else:
         form = SupplierTourForm(instance=tour)
     
-    bookings = Booking.objects.filter(tour=tour).order_by('-created_at')
-    payments = Payment.objects.filter(booking__tour=tour).order_by('-created_at')
+    bookings = Booking.objects.filter(tour=tour).select_related('tour__supplier').prefetch_related('payments').order_by('-created_at')
+    payments = Payment.objects.filter(booking__tour=tour).select_related('booking').order_by('-created_at')
     
     context = {
         'tour': tour,
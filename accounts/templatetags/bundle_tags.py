@@ -0,0 +1,35 @@
+from django import template
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.utils.html import format_html
+from accounts.static_storage import BUNDLE_DIR
+
+register = template.Library()
+
+
+class BundleNode(template.Node):
+    def __init__(self, name, nodelist):
+        self.name = name
+        self.nodelist = nodelist
+
+    def render(self, context):
+        path = f'{BUNDLE_DIR}/{self.name}'
+        if settings.DEBUG or path not in getattr(staticfiles_storage, 'hashed_files', {}):
+            return self.nodelist.render(context)
+        if self.name.endswith('.css'):
+            return format_html('<link rel="stylesheet" href="{}">', staticfiles_storage.url(path))
+        return format_html('<script src="{}"></script>', staticfiles_storage.url(path))
+
+
+@register.tag
+def bundle(parser, token):
+    """
+    Serve the wrapped <link>/<script> tags as one file once collectstatic has built it
+    Usage: {% bundle "frontend.css" %}<link rel="stylesheet" href="{% static '...' %}">...{% endbundle %}
+    """
+    bits = token.split_contents()
+    if len(bits) != 2 or bits[1][0] not in '"\'' or bits[1][0] != bits[1][-1]:
+        raise template.TemplateSyntaxError(f'{bits[0]} takes one quoted bundle name')
+    nodelist = parser.parse(('endbundle',))
+    parser.delete_first_token()
+    return BundleNode(bits[1][1:-1], nodelist)
@@ -0,0 +1,32 @@
+from django import template
+from accounts import renditions
+
+register = template.Library()
+
+
+@register.simple_tag
+def srcset(image, format='webp'):
+    """
+    srcset of an ImageField's renditions, empty when it has none
+    Usage: <img src="{{ tour.main_image|rendition:640 }}" srcset="{% srcset tour.main_image %}" sizes="...">
+    """
+    if not image:
+        return ''
+    return ', '.join(
+        f'{image.storage.url(renditions.rendition_name(image.name, width, format))} {width}w'
+        for width in renditions.available_widths(image.name, image.storage)
+    )
+
+
+@register.filter
+def rendition(image, width):
+    """
+    URL of the smallest JPEG rendition at least ``width`` wide, or of the original
+    Usage: {{ tour.main_image|rendition:640 }}
+    """
+    if not image:
+        return ''
+    for available in renditions.available_widths(image.name, image.storage):
+        if available >= int(width):
+            return image.storage.url(renditions.rendition_name(image.name, available, 'jpeg'))
+    return image.url
@@ -0,0 +1,28 @@
+"""
+Test runner that keeps the suite off the on-disk cache.
+
+Settings point the ``default`` cache at ``BASE_DIR/cache``, which the
+running site shares. Tests clear the cache freely and must not see entries a
+previous run or the dev server left behind, so the whole run uses an
+in-memory cache instead.
+"""
+from django.test import override_settings
+from django.test.runner import DiscoverRunner
+
+TEST_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'tests',
+    }
+}
+
+
+class LocalCacheTestRunner(DiscoverRunner):
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._caches = override_settings(CACHES=TEST_CACHES)
+        self._caches.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self._caches.disable()
+        super().teardown_test_environment(**kwargs)
@@ -0,0 +1,53 @@
+"""
+The public testimonial feed: active CustomerReviewStatic rows and approved
+TourReview rows, newest first across both sources.
+
+The merge happens in SQL. Both sources are projected to ``(kind, id,
+created_at)`` and combined with UNION ALL, so counting and slicing a page
+only touch that narrow projection; the rows on the requested page are then
+loaded with one query per source.
+"""
+from django.db.models import CharField, Value
+
+STATIC = 'static'
+TOUR = 'tour'
+
+
+class TestimonialFeed:
+    """Sliceable, countable feed for ``django.core.paginator.Paginator``"""
+
+    def _entries(self):
+        from .models import CustomerReviewStatic, TourReview
+
+        static_reviews = CustomerReviewStatic.objects.filter(is_active=True).order_by().annotate(
+            kind=Value(STATIC, output_field=CharField())
+        ).values_list('kind', 'pk', 'created_at')
+        tour_reviews = TourReview.objects.filter(status='approved').order_by().annotate(
+            kind=Value(TOUR, output_field=CharField())
+        ).values_list('kind', 'pk', 'created_at')
+        return static_reviews.union(tour_reviews, all=True).order_by('-created_at', 'kind', '-pk')
+
+    def count(self):
+        return self._entries().count()
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, index):
+        from .models import CustomerReviewStatic, TourReview
+
+        if not isinstance(index, slice):
+            return self[index:index + 1][0]
+
+        entries = list(self._entries()[index])
+        ids = {STATIC: [], TOUR: []}
+        for kind, pk, created_at in entries:
+            ids[kind].append(pk)
+        rows = {
+            STATIC: CustomerReviewStatic.objects.in_bulk(ids[STATIC]) if ids[STATIC] else {},
+            TOUR: TourReview.objects.select_related(
+                'customer__user', 'tour__city', 'tour__destination_region'
+            ).in_bulk(ids[TOUR]) if ids[TOUR] else {},
+        }
+        # A row deleted between the two queries is simply left out
+        return [rows[kind][pk] for kind, pk, created_at in entries if pk in rows[kind]]
@@ -1,4 +1,4 @@
-from django.test import TestCase, Client
+from django.test import TestCase, TransactionTestCase, Client, override_settings
 from django.urls import reverse
 from django.contrib.auth.models import User
 from .models import Customer
@@ -93,3 +93,1396 @@ class AuthTests(TestCase):
         self.assertTrue(form.errors)
         self.assertIn('username', form.errors)
         self.assertEqual(form.errors['username'], ['Username already exists.'])
+
+
+class TourSearchIndexTests(TestCase):
+    def setUp(self):
+        from .models import Country, City, TourSupplier, Tour
+        country = Country.objects.create(name='Denmark')
+        self.city = City.objects.create(name='Copenhagen', name_dk='København', country=country)
+        supplier = TourSupplier.objects.create(company_name='Supplier', email='s@e.com', phone='1', address='a')
+        self.canal = Tour.objects.create(
+            supplier=supplier, city=self.city, title='Grand Canal Tour', title_dk='Kanaltur',
+            description='Boat trip through the harbour', base_price=100, status='active'
+        )
+        self.bike = Tour.objects.create(
+            supplier=supplier, title='City Bike Ride', description='Cycle past the canal houses',
+            base_price=100, status='active'
+        )
+
+    def test_title_match_ranks_above_description_match(self):
+        from .search import search_tour_ids
+        self.assertEqual(search_tour_ids('canal'), [self.canal.pk, self.bike.pk])
+
+    def test_danish_text_and_prefix_match(self):
+        from .search import search_tour_ids
+        self.assertEqual(search_tour_ids('kanal'), [self.canal.pk])
+        self.assertEqual(search_tour_ids('københ'), [self.canal.pk])
+
+    def test_index_follows_save_and_delete(self):
+        from .search import search_tour_ids
+        self.bike.title = 'Harbour Bike Ride'
+        self.bike.save()
+        self.assertIn(self.bike.pk, search_tour_ids('harbour'))
+
+        self.city.name = 'Aarhus'
+        self.city.save()
+        self.assertEqual(search_tour_ids('aarhus'), [self.canal.pk])
+
+        self.canal.delete()
+        self.assertEqual(search_tour_ids('kanaltur'), [])
+
+    def test_listing_filters_and_ranks_every_match(self):
+        from .models import SiteSetting, Tour
+        SiteSetting.objects.create(pk=1, site_logo='settings/logo.png', site_logo_dark='settings/logo-dark.png')
+        dinner = Tour.objects.create(
+            supplier=self.bike.supplier, title='Canal Dinner Cruise', description='-', base_price=300, status='active'
+        )
+        response = self.client.get(reverse('find_tour'), {'search': 'canal'})
+        self.assertEqual(response.context['page_obj'].paginator.count, 3)
+        self.assertEqual([tour.pk for tour in response.context['page_obj']][-1], self.bike.pk)
+
+        # The price filter runs in the same query as the match, not over a capped id list
+        response = self.client.get(reverse('find_tour'), {'search': 'canal', 'min_price': 200})
+        self.assertEqual([tour.pk for tour in response.context['page_obj']], [dinner.pk])
+        response = self.client.get(reverse('find_tour'), {'search': '!!'})
+        self.assertEqual(response.context['page_obj'].paginator.count, 0)
+
+
+class TourFacetIndexTests(TestCase):
+    def setUp(self):
+        from .models import Country, City, Category, TourSupplier, Tour
+        self.denmark = Country.objects.create(name='Denmark')
+        self.sweden = Country.objects.create(name='Sweden')
+        self.copenhagen = City.objects.create(name='Copenhagen', country=self.denmark)
+        self.malmo = City.objects.create(name='Malmo', country=self.sweden)
+        self.boat = Category.objects.create(name='Boat')
+        self.walk = Category.objects.create(name='Walk')
+        self.supplier = TourSupplier.objects.create(company_name='Supplier', email='s@e.com', phone='1', address='a')
+
+        def tour(title, city, category, status='active'):
+            return Tour.objects.create(
+                supplier=self.supplier, city=city, category=category, title=title,
+                description='-', base_price=100, status=status
+            )
+        self.tours = [
+            tour('Canal', self.copenhagen, self.boat),
+            tour('Old Town', self.copenhagen, self.walk),
+            tour('Harbour', self.malmo, self.boat),
+            tour('Draft', self.malmo, self.walk, status='draft'),
+        ]
+
+    def test_counts_are_conditioned_on_other_facets(self):
+        from .facets import TourFacetIndex
+        index = TourFacetIndex()
+
+        counts = index.counts()
+        self.assertEqual(counts['category'], {self.boat.pk: 2, self.walk.pk: 1})
+        self.assertEqual(counts['country'], {self.denmark.pk: 2, self.sweden.pk: 1})
+
+        counts = index.counts(selected={'category': str(self.boat.pk)})
+        self.assertEqual(counts['city'], {self.copenhagen.pk: 1, self.malmo.pk: 1})
+        # A facet is not narrowed by its own selection
+        self.assertEqual(counts['category'], {self.boat.pk: 2, self.walk.pk: 1})
+
+    def test_base_bitmap_and_incremental_update(self):
+        from .facets import TourFacetIndex, ids_to_bitmap
+        index = TourFacetIndex()
+        canal, old_town, harbour, draft = self.tours
+
+        counts = index.counts(base=ids_to_bitmap([canal.pk, harbour.pk]))
+        self.assertEqual(counts['category'], {self.boat.pk: 2})
+
+        draft.status = 'active'
+        draft.save()
+        index.update_tour(draft)
+        canal.status = 'inactive'
+        canal.save()
+        index.update_tour(canal)
+        self.assertEqual(index.counts()['city'], {self.copenhagen.pk: 1, self.malmo.pk: 2})
+
+    def test_changes_rebuild_without_an_atomic_cache_incr(self):
+        from unittest import mock
+        from .facets import TourFacetIndex
+        from .tiered_cache import TieredCache
+        index = TourFacetIndex()
+        index.counts()
+        canal = self.tours[0]
+        canal.status = 'inactive'
+        canal.save()
+        with mock.patch.object(TieredCache, 'atomic_bumps', new_callable=mock.PropertyMock, return_value=False):
+            index.update_tour(canal)
+            self.assertFalse(index._built)
+            self.assertEqual(index.counts()['city'], {self.copenhagen.pk: 1, self.malmo.pk: 1})
+
+
+class TourRatingConsistencyTests(TestCase):
+    def setUp(self):
+        from .models import TourSupplier, Tour
+        supplier = TourSupplier.objects.create(company_name='Supplier', email='s@e.com', phone='1', address='a')
+        self.tour = Tour.objects.create(supplier=supplier, title='Canal', description='-', base_price=100, status='active')
+        customer_user = User.objects.create_user('reviewer', 'r@e.com', 'pw')
+        self.customer = Customer.objects.create(user=customer_user)
+
+    def test_only_approved_reviews_count(self):
+        from .models import TourReview
+        TourReview.objects.create(tour=self.tour, customer=self.customer, overall_rating=5, review='-', status='approved')
+        TourReview.objects.create(tour=self.tour, customer=self.customer, overall_rating=1, review='-', status='pending')
+        self.tour.refresh_from_db()
+        self.assertEqual(float(self.tour.average_rating), 5.0)
+        self.assertEqual(self.tour.total_reviews, 1)
+
+    def test_check_command_fixes_drift(self):
+        from io import StringIO
+        from django.core.management import call_command
+        from .models import Tour, TourReview
+        TourReview.objects.create(tour=self.tour, customer=self.customer, overall_rating=4, review='-', status='approved')
+        Tour.objects.filter(pk=self.tour.pk).update(average_rating=2, total_reviews=9)
+
+        out = StringIO()
+        call_command('check_tour_ratings', stdout=out)
+        self.assertIn('1 tours have drifted ratings', out.getvalue())
+
+        call_command('check_tour_ratings', '--fix', stdout=StringIO())
+        self.tour.refresh_from_db()
+        self.assertEqual(float(self.tour.average_rating), 4.0)
+        self.assertEqual(self.tour.total_reviews, 1)
+
+    def test_update_command_dry_run_and_since(self):
+        from io import StringIO
+        from django.core.management import call_command
+        from .models import Tour, TourReview
+        TourReview.objects.create(tour=self.tour, customer=self.customer, overall_rating=3, review='-', status='approved')
+        Tour.objects.filter(pk=self.tour.pk).update(average_rating=0, total_reviews=0)
+
+        out = StringIO()
+        call_command('update_tour_ratings', '--dry-run', stdout=out)
+        self.assertIn('total_reviews 0 -> 1', out.getvalue())
+        self.tour.refresh_from_db()
+        self.assertEqual(self.tour.total_reviews, 0)
+
+        call_command('update_tour_ratings', '--since', '1h', stdout=StringIO())
+        self.tour.refresh_from_db()
+        self.assertEqual(float(self.tour.average_rating), 3.0)
+        self.assertEqual(self.tour.total_reviews, 1)
+
+
+class SiteChromeCacheTests(TestCase):
+    def setUp(self):
+        from django.core.cache import cache
+        from .models import SiteSetting, WebsiteMenu
+        cache.clear()
+        SiteSetting.objects.create(pk=1, site_name='Copenhagen Memories')
+        self.menu = WebsiteMenu.objects.create(title='Tours', section_type='header', has_submenu=True)
+        self.menu.submenus.create(title='Canal')
+        WebsiteMenu.objects.create(title='About', section_type='footer')
+
+    def context(self, lang='en'):
+        from django.test import RequestFactory
+        from .context_processors import site_settings
+        request = RequestFactory().get('/')
+        request.session = {'lang': lang}
+        return site_settings(request)
+
+    def test_warm_chrome_costs_no_queries(self):
+        context = self.context()
+        self.assertEqual([menu.title for menu in context['website_menus']], ['Tours'])
+        self.assertEqual([menu.title for menu in context['website_menus_footer']], ['About'])
+
+        with self.assertNumQueries(0):
+            context = self.context()
+            self.assertEqual(context['site_settings'].site_name, 'Copenhagen Memories')
+            self.assertEqual([sub.title for sub in context['website_menus'][0].submenus.all()], ['Canal'])
+
+    def test_chrome_is_shared_between_languages(self):
+        self.context('en')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.context('dk')['site_settings'].site_name, 'Copenhagen Memories')
+
+    def test_saves_invalidate_chrome(self):
+        from .models import SiteSetting
+        self.context()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.menu.submenus.create(title='Harbour')
+        submenus = self.context()['website_menus'][0].submenus.all()
+        self.assertEqual(sorted(sub.title for sub in submenus), ['Canal', 'Harbour'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            settings = SiteSetting.objects.get(pk=1)
+            settings.site_name = 'Renamed'
+            settings.save()
+        self.assertEqual(self.context()['site_settings'].site_name, 'Renamed')
+
+
+class HomePageCacheTests(TestCase):
+    def setUp(self):
+        from django.core.cache import cache
+        from .models import SiteSetting, FAQ
+        cache.clear()
+        SiteSetting.objects.create(
+            pk=1, site_name='Copenhagen Memories',
+            site_logo='settings/logo.png', site_logo_dark='settings/logo-dark.png'
+        )
+        FAQ.objects.create(qus_en='Can I cancel?', ans_en='Yes', is_featured=True)
+
+    def test_anonymous_hits_are_served_from_cache(self):
+        client = Client(enforce_csrf_checks=True)
+        first = client.get(reverse('home'))
+        self.assertContains(first, 'Can I cancel?')
+
+        with self.assertNumQueries(0):
+            second = client.get(reverse('home'))
+        self.assertContains(second, 'Can I cancel?')
+        self.assertNotContains(second, 'csrf-token-placeholder')
+        self.assertContains(second, 'name="csrfmiddlewaretoken"')
+
+    def test_model_changes_invalidate_page(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from .models import FAQ
+        self.client.get(reverse('home'))
+        with self.assertNumQueries(0):
+            self.client.get(reverse('home'))
+        with self.captureOnCommitCallbacks(execute=True):
+            FAQ.objects.create(qus_en='Is lunch included?', ans_en='No', is_featured=True)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('home'))
+        self.assertGreater(len(queries), 0)
+        self.assertContains(response, 'Is lunch included?')
+
+    def test_signed_in_users_get_fresh_page_with_cached_sections(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        user = User.objects.create_user('visitor', 'v@e.com', 'pw')
+        Customer.objects.create(user=user)
+        self.client.force_login(user, backend='django.contrib.auth.backends.ModelBackend')
+        with CaptureQueriesContext(connection) as cold:
+            self.client.get(reverse('home'))
+        with CaptureQueriesContext(connection) as warm:
+            response = self.client.get(reverse('home'))
+        # The page itself is rendered again, its sections come from the fragment cache
+        self.assertGreater(len(warm), 0)
+        self.assertLess(len(warm), len(cold))
+        self.assertContains(response, 'Can I cancel?')
+
+
+class DailyStatsTests(TestCase):
+    def setUp(self):
+        from .models import TourSupplier, Tour
+        supplier = TourSupplier.objects.create(company_name='Supplier', email='s@e.com', phone='1', address='a')
+        self.tour = Tour.objects.create(supplier=supplier, title='Canal', description='-', base_price=100, status='active')
+
+    def test_signals_roll_up_the_day(self):
+        from django.utils import timezone
+        from .models import DailyStats, TourReview
+        with self.captureOnCommitCallbacks(execute=True):
+            customer = Customer.objects.create(user=User.objects.create_user('reviewer', 'r@e.com', 'pw'))
+            TourReview.objects.create(tour=self.tour, customer=customer, overall_rating=5, review='-')
+
+        row = DailyStats.objects.get(date=timezone.localdate())
+        self.assertEqual((row.new_customers, row.reviews, row.bookings), (1, 1, 0))
+
+    def test_series_backfills_and_buckets_range(self):
+        from datetime import timedelta
+        from django.utils import timezone
+        from .models import DailyStats
+        from .stats import stats_series
+        Customer.objects.create(user=User.objects.create_user('a', 'a@e.com', 'pw'))
+        DailyStats.objects.all().delete()
+        today = timezone.localdate()
+
+        windows = stats_series(today - timedelta(days=9), today, buckets=3)
+        self.assertEqual([(end - start).days + 1 for start, end, totals in windows], [3, 4, 3])
+        self.assertEqual([totals['new_customers'] for start, end, totals in windows], [0, 0, 1])
+        self.assertEqual(DailyStats.objects.count(), 10)
+
+        with self.assertNumQueries(1):
+            stats_series(today - timedelta(days=9), today, buckets=3)
+
+    def test_series_range_is_clamped(self):
+        from datetime import date, timedelta
+        from django.utils import timezone
+        from .models import DailyStats
+        from .stats import MAX_SPAN_DAYS, stats_series
+        today = timezone.localdate()
+        windows = stats_series(date(1900, 1, 1), today, buckets=6)
+        self.assertEqual(windows[0][0], today - timedelta(days=MAX_SPAN_DAYS - 1))
+        self.assertEqual(DailyStats.objects.count(), MAX_SPAN_DAYS)
+
+    def test_dashboard_falls_back_for_bad_ranges(self):
+        from datetime import timedelta
+        from django.utils import timezone
+        from .models import SiteSetting
+        from .stats import MAX_SPAN_DAYS
+        SiteSetting.objects.create(pk=1, site_logo='settings/logo.png', site_logo_dark='settings/logo-dark.png')
+        admin = User.objects.create_superuser('charts', 'c@e.com', 'pw')
+        self.client.force_login(admin, backend='django.contrib.auth.backends.ModelBackend')
+        today = timezone.localdate()
+        default = (today - timedelta(days=179), today)
+        for params in ({'end': '2024-02-30'}, {'start': '2024-13-01'}, {'start': '2024-05-01', 'end': '2024-01-01'}):
+            response = self.client.get(reverse('admin_dashboard'), params)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual((response.context['chart_start'], response.context['chart_end']), default)
+
+        response = self.client.get(reverse('admin_dashboard'), {'start': '1900-01-01', 'end': '9999-12-31'})
+        self.assertEqual(response.context['chart_end'], today)
+        self.assertEqual(response.context['chart_start'], today - timedelta(days=MAX_SPAN_DAYS - 1))
+
+
+class BookingSeatReservationTests(TransactionTestCase):
+    def setUp(self):
+        from datetime import date, time
+        from .models import TourSupplier, Tour, TourSchedule
+        supplier = TourSupplier.objects.create(company_name='Supplier', email='s@e.com', phone='1', address='a')
+        self.tour = Tour.objects.create(supplier=supplier, title='Canal', description='-', base_price=100, status='active')
+        self.schedule = TourSchedule.objects.create(
+            tour=self.tour, date=date(2030, 6, 1), start_time=time(10), available_slots=10
+        )
+        self.customer = Customer.objects.create(user=User.objects.create_user('booker', 'b@e.com', 'pw'))
+
+    def book(self, seats):
+        from .bookings import create_booking
+        from .models import Booking
+        booking = Booking(
+            customer=self.customer, tour=self.tour, schedule=self.schedule, tour_date=self.schedule.date,
+            subtotal=100, total_amount=100, contact_name='B', contact_email='b@e.com', contact_phone='1'
+        )
+        return create_booking(booking, [{'type': 'adult', 'first_name': 'P', 'price': '100'}] * seats)
+
+    def test_sold_out_departure_writes_nothing(self):
+        from .bookings import ScheduleSoldOut
+        from .models import Booking
+        booking = self.book(7)
+        self.assertRegex(booking.booking_number, r'^BK\d{6}\d{5,}$')
+        self.assertEqual(booking.participants.count(), 7)
+
+        with self.assertRaises(ScheduleSoldOut) as raised:
+            self.book(4)
+        self.assertEqual(raised.exception.seats_left, 3)
+        self.assertEqual(Booking.objects.count(), 1)
+
+        self.book(3)
+        self.schedule.refresh_from_db()
+        self.assertEqual((self.schedule.booked_slots, self.schedule.status), (10, 'full'))
+
+    def test_concurrent_bookings_never_oversell(self):
+        import threading
+        import time
+        from django.db import connection, OperationalError
+        from .bookings import ScheduleSoldOut
+        from .models import Booking
+
+        outcomes = []
+        start = threading.Barrier(8)
+
+        def attempt():
+            start.wait()
+            try:
+                for retry in range(200):
+                    try:
+                        self.book(2)
+                        outcomes.append('booked')
+                        return
+                    except ScheduleSoldOut:
+                        outcomes.append('sold out')
+                        return
+                    except OperationalError:
+                        # SQLite serialises writers; try again once the lock is released
+                        time.sleep(0.01)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=attempt) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.schedule.refresh_from_db()
+        self.assertEqual(outcomes.count('booked'), 5)
+        self.assertEqual(outcomes.count('sold out'), 3)
+        self.assertEqual(self.schedule.booked_slots, 10)
+        self.assertEqual(Booking.objects.count(), 5)
+        self.assertEqual(len(set(Booking.objects.values_list('booking_number', flat=True))), 5)
+
+    def test_status_update_moves_seats(self):
+        from django.contrib.messages import get_messages
+        from .models import Booking
+        booking = self.book(10)
+        self.client.force_login(User.objects.create_superuser('admin', 'a@e.com', 'pw'))
+        url = reverse('booking_status_update', args=[booking.pk])
+
+        self.client.post(url, {'status': 'cancelled'})
+        self.schedule.refresh_from_db()
+        self.assertEqual((self.schedule.booked_slots, self.schedule.status), (0, 'available'))
+
+        self.book(4)
+        response = self.client.post(url, {'status': 'confirmed'})
+        self.assertIn('Only 6 seat(s) left', [str(message) for message in get_messages(response.wsgi_request)][-1])
+        self.assertEqual(Booking.objects.get(pk=booking.pk).status, 'cancelled')
+        self.schedule.refresh_from_db()
+        self.assertEqual(self.schedule.booked_slots, 4)
+
+
+class PricingTableTests(TestCase):
+    def setUp(self):
+        from django.core.cache import cache
+        from .models import TourSupplier, Tour
+        cache.clear()
+        supplier = TourSupplier.objects.create(company_name='Supplier', email='s@e.com', phone='1', address='a')
+        self.tour = Tour.objects.create(supplier=supplier, title='Canal', description='-', base_price=300, status='active')
+        self.tour.pricing_options.create(participant_type='adult', price=250)
+        self.tour.pricing_options.create(participant_type='child', min_age=3, max_age=12, price=100)
+        self.tour.pricing_options.create(participant_type='infant', min_age=0, max_age=2, price=0)
+        self.tour.pricing_options.create(participant_type='senior', price=50, is_active=False)
+
+    def test_age_then_type_then_base_price(self):
+        from decimal import Decimal
+        from .pricing import get_pricing_table
+        from .models import Tour
+        tour = Tour.objects.prefetch_related('pricing_options').get(pk=self.tour.pk)
+
+        participants = [
+            {'type': 'adult', 'age': '40'},
+            {'type': 'adult', 'age': '8'},
+            {'type': 'child'},
+            {'type': 'infant', 'age': 1},
+            {'type': 'senior', 'age': ''},
+        ]
+        with self.assertNumQueries(0):
+            table = get_pricing_table(tour)
+            subtotal = table.price_participants(participants)
+        self.assertEqual([p['price'] for p in participants], ['250.00', '100.00', '100.00', '0.00', '300.00'])
+        self.assertEqual(subtotal, Decimal('750.00'))
+
+    def test_pricing_changes_invalidate_table(self):
+        from decimal import Decimal
+        from .pricing import get_pricing_table
+        self.assertEqual(get_pricing_table(self.tour).price_for('student'), Decimal('300'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tour.pricing_options.create(participant_type='student', price=120)
+        self.assertEqual(get_pricing_table(self.tour).price_for('student'), Decimal('120'))
+
+
+class TourDetailReadModelTests(TestCase):
+    def setUp(self):
+        from django.core.cache import cache
+        from .models import SiteSetting, TourSupplier, Tour
+        cache.clear()
+        SiteSetting.objects.create(pk=1, site_logo='settings/logo.png', site_logo_dark='settings/logo-dark.png')
+        supplier = TourSupplier.objects.create(company_name='Supplier', email='s@e.com', phone='1', address='a')
+        self.tour = Tour.objects.create(supplier=supplier, title='Canal', description='-', base_price=100, status='active')
+        self.tour.highlights.create(highlight='Harbour views', display_order=2)
+        self.tour.highlights.create(highlight='Little Mermaid', display_order=1)
+        customer = Customer.objects.create(user=User.objects.create_user('reviewer', 'r@e.com', 'pw'))
+        for rating in (5, 5, 3):
+            self.tour.reviews.create(customer=customer, overall_rating=rating, review='-', status='approved')
+
+    def test_read_model_orders_children_and_counts_reviews(self):
+        from .read_models import TourDetailReadModel
+        detail = TourDetailReadModel.build(self.tour.pk)
+        self.assertEqual([h.highlight for h in detail.highlights], ['Little Mermaid', 'Harbour views'])
+        self.assertEqual(detail.total_reviews, 3)
+        self.assertEqual(detail.rating_stats[5]['count'], 2)
+        self.assertAlmostEqual(detail.avg_rating, 13 / 3)
+
+    def test_read_model_is_shared_between_languages(self):
+        from unittest import mock
+        from .read_models import TourDetailReadModel
+        self.client.get(reverse('tour_detail', args=[self.tour.pk]))
+        self.client.get(reverse('set_language', args=['dk']))
+        with mock.patch.object(TourDetailReadModel, 'build', side_effect=AssertionError('rebuilt')):
+            response = self.client.get(reverse('tour_detail', args=[self.tour.pk]))
+        self.assertEqual(response.status_code, 200)
+
+    def test_warm_detail_page_and_invalidation(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        url = reverse('tour_detail', args=[self.tour.pk])
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertContains(self.client.get(url), 'Little Mermaid')
+        self.assertLessEqual(len(queries), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tour.highlights.create(highlight='Nyhavn', display_order=3)
+        self.assertContains(self.client.get(url), 'Nyhavn')
+
+    def test_sold_out_departure_leaves_the_cached_detail(self):
+        from datetime import date, time
+        from .bookings import create_booking
+        from .models import Booking, TourSchedule
+        from .read_models import TourDetailReadModel
+        with self.captureOnCommitCallbacks(execute=True):
+            schedule = TourSchedule.objects.create(
+                tour=self.tour, date=date(2030, 6, 1), start_time=time(10), available_slots=2
+            )
+        self.assertEqual([s.pk for s in TourDetailReadModel.get(self.tour.pk).schedules], [schedule.pk])
+
+        booking = Booking(
+            customer=Customer.objects.get(), tour=self.tour, schedule=schedule, tour_date=schedule.date,
+            subtotal=200, total_amount=200, contact_name='B', contact_email='b@e.com', contact_phone='1'
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            create_booking(booking, [{'type': 'adult', 'first_name': 'P', 'price': '100'}] * 2)
+        self.assertEqual(TourDetailReadModel.get(self.tour.pk).schedules, [])
+
+
+class KeysetPaginatorTests(TestCase):
+    def setUp(self):
+        from django.core.cache import cache
+        from .models import TourSupplier, Tour
+        cache.clear()
+        supplier = TourSupplier.objects.create(company_name='Supplier', email='s@e.com', phone='1', address='a')
+        for index, price in enumerate([300, 100, 200, 100, 300, 100, 250]):
+            Tour.objects.create(supplier=supplier, title=f'Tour {index}', description='-', base_price=price,
+                                average_rating=index % 3, status='active')
+
+    def test_walks_forward_and_back_without_gaps(self):
+        from .models import Tour
+        from .pagination import KeysetPaginator
+        for ordering in [('base_price',), ('-average_rating', '-created_at')]:
+            paginator = KeysetPaginator(Tour.objects.all(), 3, ordering=ordering)
+            expected = list(Tour.objects.order_by(*paginator.ordering).values_list('pk', flat=True))
+
+            page = paginator.get_page(None)
+            seen = [tour.pk for tour in page]
+            while page.has_next():
+                page = paginator.get_page(page.next_cursor)
+                seen += [tour.pk for tour in page]
+            self.assertEqual(seen, expected)
+            self.assertEqual((page.start_index(), page.end_index()), (7, 7))
+
+            back = [tour.pk for tour in page]
+            while page.has_previous():
+                page = paginator.get_page(page.previous_cursor)
+                back = [tour.pk for tour in page] + back
+            self.assertEqual(back, expected)
+            self.assertEqual(page.start_index(), 1)
+
+    def test_invalid_cursor_and_approximate_count(self):
+        from .models import Tour
+        from .pagination import KeysetPaginator
+        paginator = KeysetPaginator(Tour.objects.all(), 3, approximate_count=True, count_limit=5)
+        self.assertEqual(paginator.get_page('not-a-cursor').start_index(), 1)
+        self.assertEqual((paginator.count, paginator.count_is_exact), (5, False))
+
+    def test_find_tour_and_filtered_list_page_by_cursor(self):
+        from .models import SiteSetting, Tour, TourSupplier
+        SiteSetting.objects.create(pk=1, site_logo='settings/logo.png', site_logo_dark='settings/logo-dark.png')
+        supplier = TourSupplier.objects.get()
+        for index in range(7, 14):
+            Tour.objects.create(supplier=supplier, title=f'Tour {index}', description='-', base_price=50,
+                                status='active')
+        for name in ('find_tour', 'tour_list_type_filtered'):
+            first = self.client.get(reverse(name), {'sort': 'price_low'})
+            page = first.context['page_obj']
+            self.assertTrue(page.has_next())
+            self.assertContains(first, f'?sort=price_low&amp;cursor={page.next_cursor}')
+
+            second = self.client.get(reverse(name), {'sort': 'price_low', 'cursor': page.next_cursor})
+            self.assertEqual(second.status_code, 200)
+            next_page = second.context['page_obj']
+            self.assertEqual(len(next_page), 2)
+            self.assertTrue(next_page.has_previous())
+            self.assertFalse({tour.pk for tour in page} & {tour.pk for tour in next_page})
+            self.assertContains(second, f'cursor={next_page.previous_cursor}')
+
+
+class TestimonialFeedTests(TestCase):
+    def test_merges_sources_newest_first_and_loads_one_page(self):
+        from datetime import timedelta
+        from django.core.paginator import Paginator
+        from django.utils import timezone
+        from .models import CustomerReviewStatic, TourReview, TourSupplier, Tour
+        from .testimonials import TestimonialFeed
+        supplier = TourSupplier.objects.create(company_name='Supplier', email='s@e.com', phone='1', address='a')
+        tour = Tour.objects.create(supplier=supplier, title='Canal', description='-', base_price=100, status='active')
+        customer = Customer.objects.create(user=User.objects.create_user('reviewer', 'r@e.com', 'pw'))
+        now = timezone.now()
+        for hours, source in enumerate(['tour', 'static', 'tour', 'static', 'static']):
+            if source == 'static':
+                review = CustomerReviewStatic.objects.create(name=f'Guest {hours}', address='-', review='-')
+                CustomerReviewStatic.objects.filter(pk=review.pk).update(created_at=now - timedelta(hours=hours))
+            else:
+                review = tour.reviews.create(customer=customer, overall_rating=5, review='-', status='approved')
+                TourReview.objects.filter(pk=review.pk).update(created_at=now - timedelta(hours=hours))
+        CustomerReviewStatic.objects.create(name='Hidden', address='-', review='-', is_active=False)
+
+        paginator = Paginator(TestimonialFeed(), 2)
+        self.assertEqual(paginator.count, 5)
+        with self.assertNumQueries(3):
+            page = paginator.get_page(2)
+            rows = list(page)
+        self.assertEqual([type(row).__name__ for row in rows], ['TourReview', 'CustomerReviewStatic'])
+        self.assertEqual(rows[1].name, 'Guest 3')
+
+
+class HotQueryPlanTests(TestCase):
+    def test_hot_queries_use_indexes(self):
+        from io import StringIO
+        from django.core.management import call_command
+        out = StringIO()
+        call_command('explain_hot_queries', '--strict', stdout=out)
+        self.assertIn('0 flagged', out.getvalue())
+
+    def test_tour_list_entries_are_the_queries_the_view_runs(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from .models import SiteSetting
+        from .query_plans import TOUR_LIST_SORTS, hot_queries
+        SiteSetting.objects.create(pk=1, site_logo='settings/logo.png', site_logo_dark='settings/logo-dark.png')
+        catalogue = {query.name: query.queryset for query in hot_queries()}
+        for sort in TOUR_LIST_SORTS:
+            queryset = catalogue[f'tour list: {sort}']
+            with CaptureQueriesContext(connection) as queries:
+                self.client.get(reverse('find_tour'), {'sort': sort})
+            sql, params = queryset.query.sql_with_params()
+            expected = connection.ops.last_executed_query(connection.cursor(), sql, params)
+            self.assertIn(expected, [query['sql'] for query in queries.captured_queries])
+
+
+class PerformanceBudgetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        from .load_data import LoadDataGenerator
+        cls.admin = User.objects.create_superuser('perf-admin', 'perf@e.com', 'pw')
+        LoadDataGenerator(seed=14).generate(tours=1000, customers=300, bookings=2000, reviews=2000, schedules_per_tour=6)
+
+    def test_every_url_within_its_budgets(self):
+        import os
+        from . import perf
+        # Wall-clock budgets depend on the host; opt in with PERF_LATENCY=1
+        latency = bool(os.environ.get('PERF_LATENCY'))
+        measurements, skipped = perf.run(self.admin, repeat=3 if latency else 0)
+        if os.environ.get('PERF_REPORT'):
+            perf.write_report(measurements, skipped, os.environ['PERF_REPORT'])
+        self.assertGreater(len(measurements), 100)
+        self.assertEqual(set(skipped), set(perf.SKIPPED))
+        self.assertEqual(perf.budget_failures(measurements, latency=latency), [])
+
+
+class GenerateLoadDataTests(TestCase):
+    def test_generated_rows_are_consistent_and_seeded(self):
+        from io import StringIO
+        from django.core.management import call_command
+        from django.core.management.base import CommandError
+        from django.db.models import Count, Q, Sum
+        from .models import Booking, Coupon, ReviewHelpful, Tour, TourReview, TourSchedule
+        call_command('generate_load_data', tours=20, customers=40, bookings=300, stdout=StringIO())
+
+        self.assertEqual(Booking.objects.count(), 300)
+        for schedule in TourSchedule.objects.annotate(
+            seats=Sum('bookings__total_participants', filter=~Q(bookings__status='cancelled'))
+        ):
+            self.assertEqual(schedule.booked_slots, schedule.seats or 0)
+        for tour in Tour.objects.annotate(booking_count=Count('bookings')):
+            self.assertEqual(tour.total_bookings, tour.booking_count)
+        for coupon in Coupon.objects.annotate(uses=Count('usages')):
+            self.assertEqual(coupon.used_count, coupon.uses)
+        self.assertEqual(
+            TourReview.objects.aggregate(total=Sum('helpful_count'))['total'] or 0,
+            ReviewHelpful.objects.filter(is_helpful=True).count(),
+        )
+        with self.assertRaises(CommandError):
+            call_command('generate_load_data', tours=20, customers=40, bookings=300, stdout=StringIO())
+
+
+class ProfilingMiddlewareTests(TestCase):
+    def setUp(self):
+        from .models import SiteSetting
+        from .profiling import store
+        store.clear()
+        SiteSetting.objects.create(pk=1, site_logo='settings/logo.png', site_logo_dark='settings/logo-dark.png')
+        self.admin = User.objects.create_superuser('profiler', 'p@e.com', 'pw')
+
+    def test_staff_header_profiles_the_request(self):
+        from .profiling import store
+        self.client.get(reverse('faq_list'), HTTP_X_PROFILE='1')
+        self.assertEqual(store.summary(), [])
+
+        self.client.force_login(self.admin, backend='django.contrib.auth.backends.ModelBackend')
+        response = self.client.get(reverse('faq_list'), HTTP_X_PROFILE='1')
+        self.assertIn('sql;dur=', response['Server-Timing'])
+        self.client.get(reverse('faq_list'))
+
+        profiles = self.client.get(reverse('request_profiles_json')).json()['profiles']
+        self.assertEqual([profile['url_name'] for profile in profiles], ['faq_list'])
+        profile = profiles[0]
+        self.assertEqual(profile['requests'], 1)
+        self.assertGreater(profile['sql']['mean_count'], 0)
+        self.assertGreater(profile['template_ms'], 0)
+        self.assertEqual(set(profile['context_processors_ms']), {'site_settings', 'current_language'})
+
+    def test_rendering_is_not_patched(self):
+        from django.template.base import Template
+        from django.test.utils import instrumented_test_render
+        with self.settings(REQUEST_PROFILING=True):
+            response = self.client.get(reverse('faq_list'))
+        self.assertIn('template;dur=', response['Server-Timing'])
+        # Only the test runner's own instrumentation is in place
+        self.assertIs(Template._render, instrumented_test_render)
+
+
+class FlakyEmailBackend:
+    """locmem email backend that bounces fail@ addresses and counts connections"""
+    connections = 0
+
+    def __init__(self, **kwargs):
+        from django.core.mail.backends.locmem import EmailBackend
+        self.backend = EmailBackend(**kwargs)
+
+    def open(self):
+        FlakyEmailBackend.connections += 1
+
+    def close(self):
+        pass
+
+    def send_messages(self, messages):
+        if any(address.startswith('fail@') for message in messages for address in message.to):
+            raise ConnectionError('mailbox unavailable')
+        return self.backend.send_messages(messages)
+
+
+class EmailOutboxTests(TestCase):
+    def setUp(self):
+        from .models import TourSupplier, Tour, Booking
+        supplier = TourSupplier.objects.create(company_name='Supplier', email='s@e.com', phone='1', address='a')
+        tour = Tour.objects.create(supplier=supplier, title='Canal', description='-', base_price=100, status='active')
+        customer = Customer.objects.create(user=User.objects.create_user('booker', 'b@e.com', 'pw'))
+        self.booking = Booking.objects.create(
+            customer=customer, tour=tour, tour_date='2030-06-01', total_participants=1, subtotal=100, total_amount=100,
+            contact_name='B', contact_email='b@e.com', contact_phone='1',
+        )
+        FlakyEmailBackend.connections = 0
+
+    def send_outbox(self, **options):
+        from io import StringIO
+        from django.core.management import call_command
+        out = StringIO()
+        call_command('send_outbox', stdout=out, **options)
+        return out.getvalue()
+
+    def test_invoice_is_queued_not_sent_in_the_request(self):
+        from django.core import mail
+        from .models import Notification
+        admin = User.objects.create_superuser('admin', 'a@e.com', 'pw')
+        self.client.force_login(admin, backend='django.contrib.auth.backends.ModelBackend')
+        response = self.client.post(reverse('booking_send_invoice', args=[self.booking.pk]), {
+            'to_email': 'b@e.com', 'subject': 'Your invoice', 'message': 'Thanks',
+        })
+        self.assertTrue(response.json()['success'])
+        self.assertEqual(mail.outbox, [])
+        notification = Notification.objects.get(notification_type='invoice')
+        self.assertEqual((notification.booking, notification.recipient, notification.is_sent), (self.booking, 'b@e.com', False))
+
+        self.assertIn('1 sent', self.send_outbox())
+        self.assertEqual([(message.subject, message.to) for message in mail.outbox], [('Your invoice', ['b@e.com'])])
+        notification.refresh_from_db()
+        self.assertTrue(notification.is_sent)
+        self.assertIsNotNone(notification.sent_at)
+
+    def test_batch_shares_a_connection_and_failures_back_off(self):
+        from datetime import timedelta
+        from django.core import mail
+        from django.test import override_settings
+        from django.utils import timezone
+        from .models import Notification
+        from .outbox import enqueue, send_pending
+        Notification.objects.create(customer=self.booking.customer, title='In-app only', message='-')
+        for index in range(3):
+            enqueue(f'Message {index}', '-', f'ok{index}@e.com')
+        bounced = enqueue('Bounced', '-', 'fail@e.com')
+
+        with override_settings(EMAIL_BACKEND='accounts.tests.FlakyEmailBackend'):
+            self.assertEqual(send_pending(batch_size=10, max_attempts=2), (3, 1))
+            self.assertEqual(send_pending(batch_size=10, max_attempts=2), (0, 0))
+        self.assertEqual(len(mail.outbox), 3)
+        # One connection for the batch, plus a fresh one after the bounce
+        self.assertEqual(FlakyEmailBackend.connections, 2)
+
+        bounced.refresh_from_db()
+        self.assertEqual((bounced.is_sent, bounced.attempts), (False, 1))
+        self.assertIn('mailbox unavailable', bounced.last_error)
+        self.assertGreater(bounced.next_attempt_at, timezone.now() + timedelta(seconds=50))
+
+        Notification.objects.filter(pk=bounced.pk).update(next_attempt_at=timezone.now())
+        with override_settings(EMAIL_BACKEND='accounts.tests.FlakyEmailBackend'):
+            self.assertEqual(send_pending(batch_size=10, max_attempts=2), (0, 1))
+        bounced.refresh_from_db()
+        self.assertEqual((bounced.attempts, bounced.next_attempt_at), (2, None))
+        self.assertFalse(Notification.objects.get(title='In-app only').is_sent)
+
+
+class FakeChatBackend:
+    """Local stand-in for the Gradio model; holds each call until ``release`` is set"""
+    calls = []
+    started = None
+    release = None
+
+    def reply(self, message):
+        FakeChatBackend.calls.append(message)
+        if message == 'offline':
+            raise ConnectionError('model offline')
+        FakeChatBackend.started.set()
+        FakeChatBackend.release.wait(5)
+        return f'echo: {message}'
+
+
+@override_settings(AI_CHAT_BACKEND='accounts.tests.FakeChatBackend', AI_CHAT_MAX_CONCURRENT=1, AI_CHAT_TIMEOUT=5)
+class AIChatProxyTests(TestCase):
+    def setUp(self):
+        import threading
+        from django.core.cache import cache
+        cache.clear()
+        FakeChatBackend.calls = []
+        FakeChatBackend.started = threading.Event()
+        FakeChatBackend.release = threading.Event()
+
+    def ask(self, message):
+        import json
+        return self.client.post(reverse('ai_chat_proxy'), json.dumps({'message': message}), content_type='application/json')
+
+    def test_replies_are_cached_by_normalised_message(self):
+        FakeChatBackend.release.set()
+        self.assertEqual(self.ask('Where is the Little Mermaid?').json()['response'], 'echo: Where is the Little Mermaid?')
+        self.assertEqual(self.ask('  where is the little   mermaid ').json()['response'], 'echo: Where is the Little Mermaid?')
+        self.assertEqual(FakeChatBackend.calls, ['Where is the Little Mermaid?'])
+
+    def test_sheds_load_when_every_worker_is_busy(self):
+        import threading
+        responses = []
+        first = threading.Thread(target=lambda: responses.append(self.ask('first')))
+        first.start()
+        FakeChatBackend.started.wait(5)
+
+        busy = self.ask('second')
+        self.assertEqual((busy.status_code, busy.json()['status']), (429, 'busy'))
+        self.assertIn('Retry-After', busy)
+
+        FakeChatBackend.release.set()
+        first.join()
+        self.assertEqual(responses[0].json()['response'], 'echo: first')
+        self.assertEqual(self.ask('second').json()['response'], 'echo: second')
+        self.assertEqual(FakeChatBackend.calls, ['first', 'second'])
+
+    def test_backend_errors_are_logged(self):
+        with self.assertLogs('Yourtourguide.ai_views', 'WARNING') as logs:
+            response = self.ask('offline')
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(logs.records[0].levelname, 'WARNING')
+        self.assertIn('model offline', logs.output[0])
+
+    def test_non_string_message_is_a_bad_request(self):
+        import json
+        response = self.client.post(reverse('ai_chat_proxy'), json.dumps({'message': 5}), content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(FakeChatBackend.calls, [])
+
+
+class ImageRenditionTests(TestCase):
+    def setUp(self):
+        import shutil
+        import tempfile
+        from django.core.cache import cache
+        media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media)
+        overrides = override_settings(MEDIA_ROOT=media, IMAGE_RENDITION_WORKERS=0)
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        cache.clear()
+
+    def image(self, width, height, mode='RGB', format='JPEG'):
+        from io import BytesIO
+        from PIL import Image
+        output = BytesIO()
+        Image.new(mode, (width, height), (200, 80, 40, 128)[:len(mode)]).save(output, format)
+        return output.getvalue()
+
+    def test_upload_gets_renditions_and_srcset(self):
+        from django.core.files.storage import default_storage
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from django.template import Context, Template
+        from PIL import Image
+        from .models import Category
+        with self.captureOnCommitCallbacks(execute=True):
+            category = Category.objects.create(
+                name='Boats', image=SimpleUploadedFile('boats.jpg', self.image(1000, 500), 'image/jpeg')
+            )
+
+        name = category.image.name
+        with default_storage.open(name.replace('.jpg', '.w640.webp')) as rendition:
+            self.assertEqual(Image.open(rendition).size, (640, 320))
+        self.assertFalse(default_storage.exists(name.replace('.jpg', '.w1280.webp')))
+
+        html = Template(
+            '{% load image_tags %}<img src="{{ image|rendition:500 }}" srcset="{% srcset image %}">'
+        ).render(Context({'image': category.image}))
+        self.assertIn('src="/media/categories/boats.w640.jpg"', html)
+        self.assertIn('boats.w320.webp 320w, /media/categories/boats.w640.webp 640w, '
+                      '/media/categories/boats.w960.webp 960w', html)
+
+    def test_broken_upload_is_logged(self):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from .models import Category
+        with self.assertLogs('accounts.renditions', 'ERROR') as logs:
+            with self.captureOnCommitCallbacks(execute=True):
+                Category.objects.create(
+                    name='Broken', image=SimpleUploadedFile('broken.jpg', b'not an image', 'image/jpeg')
+                )
+        self.assertIn('Rendition error for categories/broken', logs.output[0])
+        self.assertIn('Traceback', logs.output[0])
+
+    def test_backfill_processes_existing_media(self):
+        from io import StringIO
+        from django.core.files.base import ContentFile
+        from django.core.files.storage import default_storage
+        from django.core.management import call_command
+        default_storage.save('cities/harbour.png', ContentFile(self.image(700, 700, 'RGBA', 'PNG')))
+        default_storage.save('tours/gallery/tiny.jpg', ContentFile(self.image(200, 100)))
+
+        out = StringIO()
+        call_command('generate_renditions', workers=2, stdout=out)
+        self.assertIn('Processed 2 images (4 renditions, 0 failed)', out.getvalue())
+        self.assertEqual(
+            sorted(default_storage.listdir('cities')[1]),
+            ['harbour.png', 'harbour.w320.jpg', 'harbour.w320.webp', 'harbour.w640.jpg', 'harbour.w640.webp'],
+        )
+
+        out = StringIO()
+        call_command('generate_renditions', stdout=out)
+        self.assertIn('1 images to process', out.getvalue())
+
+
+class StaticPipelineTests(TestCase):
+    def setUp(self):
+        import shutil
+        import tempfile
+        from pathlib import Path
+        root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, root)
+        (root / 'static/site/img').mkdir(parents=True)
+        (root / 'templates').mkdir()
+        (root / 'static/site/img/dot.png').write_bytes(b'png')
+        (root / 'static/site/a.css').write_text(
+            '/* layout */\n.a  {  background: url(img/dot.png) ;  }\n' + '.row { margin: 0 auto; }\n' * 50
+        )
+        (root / 'static/site/b.css').write_text('@import url("https://fonts.example/css?a=1;b=2");\n.b { color: red; }\n')
+        (root / 'static/site/c.js').write_text('window.c = 1\n')
+        (root / 'static/site/d.js').write_text('window.d = window.c + 1;\n')
+        (root / 'templates/page.html').write_text(
+            '{% load static bundle_tags %}'
+            '{% bundle "site.css" %}<link rel="stylesheet" href="{% static \'site/a.css\' %}">'
+            '<link rel="stylesheet" href="{% static \'site/b.css\' %}">{% endbundle %}'
+            '{% bundle "site.js" %}<script src="{% static \'site/c.js\' %}"></script>'
+            '<script src="{% static \'site/d.js\' %}"></script>'
+            '<script src="{% static \'site/missing.js\' %}"></script>{% endbundle %}'
+        )
+        overrides = override_settings(
+            STATICFILES_DIRS=[root / 'static'], STATIC_ROOT=root / 'collected',
+            TEMPLATES=[{'BACKEND': 'django.template.backends.django.DjangoTemplates', 'DIRS': [root / 'templates']}],
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+
+    def test_collectstatic_bundles_hashes_and_precompresses(self):
+        import os
+        from io import StringIO
+        from django.contrib.staticfiles.storage import staticfiles_storage
+        from django.core.management import call_command
+        from django.template.loader import render_to_string
+        self.assertIn('/static/site/a.css', render_to_string('page.html'))
+
+        call_command('collectstatic', interactive=False, verbosity=0)
+        html = render_to_string('page.html')
+        self.assertRegex(html, r'^<link rel="stylesheet" href="/static/bundles/site\.[0-9a-f]{12}\.css">'
+                               r'<script src="/static/bundles/site\.[0-9a-f]{12}\.js"></script>$')
+
+        css_path = staticfiles_storage.path(staticfiles_storage.stored_name('bundles/site.css'))
+        with open(css_path) as bundle:
+            css = bundle.read()
+        self.assertTrue(css.startswith('@import url("https://fonts.example/css?a=1;b=2");.a{background: url("../site/img/dot.'))
+        self.assertRegex(css, r'dot\.[0-9a-f]{12}\.png')
+        self.assertIn('.b{color: red}', css)
+        self.assertTrue(os.path.exists(css_path + '.gz'))
+        with open(staticfiles_storage.path(staticfiles_storage.stored_name('bundles/site.js'))) as bundle:
+            self.assertEqual(bundle.read(), 'window.c = 1\n;\nwindow.d = window.c + 1;\n')
+
+        out = StringIO()
+        call_command('static_report', stdout=out)
+        self.assertRegex(out.getvalue(), r'page\.html\s+4 -> 2 ')
+
+
+class DatabaseRouterTests(TestCase):
+    def setUp(self):
+        from django.test import RequestFactory
+        from .db_router import replica_reads
+        from .models import Booking
+        self.factory = RequestFactory()
+        self.view = replica_reads(lambda request: (Booking.objects.all().db, Booking.objects.db_manager().db))
+
+    def test_reads_in_decorated_views_use_the_replica(self):
+        from django.db import router
+        from .models import Booking
+        self.assertEqual(self.view(self.factory.get('/')), ('default', 'default'))
+        with self.settings(READ_REPLICA=True):
+            self.assertEqual(self.view(self.factory.get('/'))[0], 'replica')
+            self.assertEqual(self.view(self.factory.post('/'))[0], 'default')
+            pinned = self.factory.get('/')
+            pinned.COOKIES['primary_pin'] = '1'
+            self.assertEqual(self.view(pinned)[0], 'default')
+            self.assertEqual(router.db_for_write(Booking), 'default')
+            self.assertEqual(Booking.objects.all().db, 'default')
+
+    def test_stats_backfill_reads_the_primary(self):
+        from datetime import timedelta
+        from django.utils import timezone
+        from .db_router import primary_reads, replica_reads
+        from .models import Booking, DailyStats
+        from .stats import rebuild_daily_stats
+        today = timezone.localdate()
+
+        def backfill(request):
+            with primary_reads():
+                db = Booking.objects.all().db
+            # Replica reads here would fail: the test has no replica database
+            return db, rebuild_daily_stats(today - timedelta(days=2), today)
+
+        with self.settings(READ_REPLICA=True):
+            self.assertEqual(replica_reads(backfill)(self.factory.get('/')), ('default', 3))
+        self.assertEqual(DailyStats.objects.count(), 3)
+
+    def test_writes_pin_the_client_to_the_primary(self):
+        from .db_router import PinPrimaryAfterWriteMiddleware
+        from django.http import HttpResponse
+        middleware = PinPrimaryAfterWriteMiddleware(lambda request: HttpResponse())
+        self.assertNotIn('primary_pin', middleware(self.factory.post('/')).cookies)
+        with self.settings(READ_REPLICA=True, READ_REPLICA_PIN_SECONDS=30):
+            self.assertNotIn('primary_pin', middleware(self.factory.get('/')).cookies)
+            cookie = middleware(self.factory.post('/')).cookies['primary_pin']
+            self.assertEqual(cookie['max-age'], 30)
+
+    def test_connection_pragmas(self):
+        from django.db import connection
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA synchronous')
+            self.assertEqual(cursor.fetchone()[0], 1)
+            cursor.execute('PRAGMA temp_store')
+            self.assertEqual(cursor.fetchone()[0], 2)
+
+
+class TieredCacheTests(TestCase):
+    def setUp(self):
+        from django.core.cache import cache
+        from .tiered_cache import TieredCache, payload_cache
+        cache.clear()
+        payload_cache.clear()
+        self.cache = TieredCache(max_entries=2)
+        self.builds = []
+
+    def build(self, value='v1'):
+        def build():
+            self.builds.append(value)
+            return value
+        return build
+
+    def test_l1_l2_and_eviction_counters(self):
+        from .tiered_cache import TieredCache
+        self.assertEqual(self.cache.get_or_set('a', self.build()), 'v1')
+        self.assertEqual(self.cache.get_or_set('a', self.build()), 'v1')
+        other_worker = TieredCache()
+        self.assertEqual(other_worker.get_or_set('a', self.build()), 'v1')
+        self.cache.get_or_set('b', self.build())
+        self.cache.get_or_set('c', self.build())
+        self.assertEqual(self.builds, ['v1'] * 3)
+        stats = self.cache.stats()
+        self.assertEqual((stats['l1_hits'], stats['misses'], stats['evictions'], stats['l1_entries']), (1, 3, 1, 2))
+        self.assertEqual(other_worker.stats()['l2_hits'], 1)
+
+    def test_stale_entries_are_served_while_another_worker_rebuilds(self):
+        from django.core.cache import cache
+        self.cache.get_or_set('home', self.build('old'), timeout=0, stale=60)
+        cache.add('tiered_lock:home', 'other-worker', 30)
+        self.assertEqual(self.cache.get_or_set('home', self.build('new')), 'old')
+        self.assertEqual(self.cache.stats()['stale_hits'], 1)
+
+        cache.delete('tiered_lock:home')
+        self.assertEqual(self.cache.get_or_set('home', self.build('new')), 'new')
+        self.assertEqual(self.builds, ['old', 'new'])
+        self.assertIsNone(cache.get('tiered_lock:home'))
+
+    def test_concurrent_misses_build_once(self):
+        import threading
+        import time
+        from .tiered_cache import TieredCache
+        start = threading.Barrier(6)
+        results = []
+
+        def slow_build():
+            time.sleep(0.2)
+            self.builds.append('page')
+            return 'page'
+
+        def request(worker):
+            start.wait()
+            results.append(worker.get_or_set('tour_list', slow_build))
+
+        # Two "processes" with three threads each
+        workers = [TieredCache(), TieredCache()]
+        threads = [threading.Thread(target=request, args=(workers[n % 2],)) for n in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, ['page'] * 6)
+        self.assertEqual(self.builds, ['page'])
+
+    def test_tags_invalidate_every_level(self):
+        from .tiered_cache import TieredCache
+        other_worker = TieredCache()
+        self.cache.get_or_set('home', self.build('old'), tags=('home',))
+        other_worker.get_or_set('home', self.build('old'), tags=('home',))
+        other_worker.invalidate_tags('home')
+        self.assertEqual(self.cache.get_or_set('home', self.build('new'), tags=('home',)), 'new')
+        self.assertEqual(other_worker.get_or_set('home', self.build('newer'), tags=('home',)), 'new')
+        self.assertEqual(self.builds, ['old', 'new'])
+
+    def test_tour_list_pages_are_cached_per_query_and_invalidated_by_tours(self):
+        from .models import SiteSetting, TourSupplier, Tour
+        SiteSetting.objects.create(pk=1, site_logo='settings/logo.png', site_logo_dark='settings/logo-dark.png')
+        supplier = TourSupplier.objects.create(company_name='Supplier', email='s@e.com', phone='1', address='a')
+        Tour.objects.create(supplier=supplier, title='Canal cruise', description='-', base_price=100, status='active')
+        url = reverse('tour_list_fronted')
+        self.assertContains(self.client.get(url, {'sort': 'newest'}), 'Canal cruise')
+        with self.assertNumQueries(0):
+            self.assertContains(self.client.get(url, {'sort': 'newest'}), 'Canal cruise')
+        self.assertNotContains(self.client.get(url, {'sort': 'newest'}), 'csrf-token-placeholder')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Tour.objects.create(supplier=supplier, title='Castle walk', description='-', base_price=80, status='active')
+        self.assertContains(self.client.get(url, {'sort': 'newest'}), 'Castle walk')
+
+    def test_unread_query_parameters_share_the_cached_page(self):
+        from .models import SiteSetting, TourSupplier, Tour
+        SiteSetting.objects.create(pk=1, site_logo='settings/logo.png', site_logo_dark='settings/logo-dark.png')
+        supplier = TourSupplier.objects.create(company_name='Supplier', email='s@e.com', phone='1', address='a')
+        Tour.objects.create(supplier=supplier, title='Canal cruise', description='-', base_price=100, status='active')
+        url = reverse('tour_list_fronted')
+        self.client.get(url, {'sort': 'newest', 'utm_source': 'mail'})
+        with self.assertNumQueries(0):
+            response = self.client.get(url, {'utm_source': 'ads', 'x': 'random', 'sort': 'newest', 'search': ''})
+        self.assertContains(response, 'Canal cruise')
+        self.assertNotContains(response, 'utm_source')
+
+        self.client.get(reverse('home'), {'utm_source': 'mail'})
+        with self.assertNumQueries(0):
+            self.client.get(reverse('home'), {'fbclid': 'abc'})
+
+
+class CacheDependencyTests(TestCase):
+    def setUp(self):
+        from django.core.cache import cache
+        from .cache_deps import dependencies
+        from .models import TourSupplier
+        from .tiered_cache import payload_cache
+        cache.clear()
+        payload_cache.clear()
+        self.supplier = TourSupplier.objects.create(company_name='Supplier', email='s@e.com', phone='1', address='a')
+        # TestCase never commits; drop what the fixtures queued
+        dependencies.flush()
+        payload_cache.clear()
+
+    def create_tour(self, title='Canal'):
+        from .models import Tour
+        return Tour.objects.create(supplier=self.supplier, title=title, description='-', base_price=100, status='active')
+
+    def test_changes_in_one_transaction_invalidate_once(self):
+        from .read_models import tour_detail
+        from .tiered_cache import payload_cache
+        from .cache_deps import dependencies
+        tour = self.create_tour()
+        other = self.create_tour('Castle')
+        dependencies.flush()
+        payload_cache.clear()
+        before = payload_cache.tag_versions(tour_detail.tags(other.pk))
+        with self.captureOnCommitCallbacks(execute=True):
+            for order in range(100):
+                tour.highlights.create(highlight=f'Stop {order}', display_order=order)
+            tour.save()
+        self.assertEqual(payload_cache.stats()['invalidations'], 3)  # home, tour_list, tour_detail:<tour>
+        self.assertEqual(payload_cache.tag_versions(tour_detail.tags(other.pk)), before)
+
+    def test_many_keys_collapse_into_one_bump(self):
+        from .read_models import tour_detail
+        from .tiered_cache import payload_cache
+        before = payload_cache.tag_versions(tour_detail.tags())
+        with self.captureOnCommitCallbacks(execute=True):
+            for n in range(60):
+                self.create_tour(f'Tour {n}')
+        self.assertEqual(payload_cache.stats()['invalidations'], 3)  # home, tour_list, tour_detail
+        self.assertNotEqual(payload_cache.tag_versions(tour_detail.tags()), before)
+
+    def test_batch_schedules_one_flush(self):
+        from .cache_deps import dependencies
+        with self.captureOnCommitCallbacks() as callbacks:
+            with dependencies.batch():
+                for n in range(5):
+                    self.create_tour(f'Tour {n}')
+        self.assertEqual([callback for callback in callbacks if callback == dependencies.flush], [dependencies.flush])
+
+    def test_m2m_and_bulk_changes(self):
+        from django.contrib.auth.models import Group
+        from .cache_deps import DependencyRegistry
+        from .tiered_cache import payload_cache
+        registry = DependencyRegistry()
+        members = registry.declare('members', models=('auth.Group',), keyed={'auth.User': 'pk'})
+        user = User.objects.create_user('member', 'm@e.com', 'pw')
+        group = Group.objects.create(name='Guides')
+        before = payload_cache.tag_versions(members.tags(user.pk))
+        with self.captureOnCommitCallbacks(execute=True):
+            registry._m2m_changed(Group.user_set.through, user, 'post_add', False, Group, {group.pk})
+        after = payload_cache.tag_versions(members.tags(user.pk))
+        self.assertNotEqual(after, before)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            registry.changed(User, pk=[user.pk + 1])
+        self.assertEqual(payload_cache.tag_versions(members.tags(user.pk)), after)
+
+
+class TourCardProjectionTests(TestCase):
+    def setUp(self):
+        from django.core.cache import cache
+        from .models import SiteSetting, TourSupplier
+        from .tiered_cache import payload_cache
+        cache.clear()
+        payload_cache.clear()
+        SiteSetting.objects.create(pk=1, site_logo='settings/logo.png', site_logo_dark='settings/logo-dark.png')
+        self.supplier = TourSupplier.objects.create(company_name='Supplier', email='s@e.com', phone='1', address='a')
+        self.customer = Customer.objects.create(user=User.objects.create_user('reviewer', 'r@e.com', 'pw'))
+
+    def add_tours(self, count):
+        from .models import Tour
+        for n in range(Tour.objects.count(), Tour.objects.count() + count):
+            with self.captureOnCommitCallbacks(execute=True):
+                tour = Tour.objects.create(
+                    supplier=self.supplier, title=f'Tour {n}', description='Long description ' * 200,
+                    base_price=100, status='active'
+                )
+                for order in range(5):
+                    tour.images.create(image=f'tours/gallery/t{tour.pk}-{order}.jpg', display_order=5 - order)
+                tour.reviews.create(customer=self.customer, overall_rating=5, review='-', status='approved')
+
+    def test_cards_load_card_columns_and_card_image(self):
+        from .tour_cards import tour_cards
+        self.add_tours(2)
+        tour = tour_cards().get(title='Tour 0')
+        self.assertIn('description', tour.get_deferred_fields())
+        self.assertEqual(tour.card_image.name, f'tours/gallery/t{tour.pk}-4.jpg')  # display_order 1
+
+    def test_listing_queries_do_not_grow_with_the_page(self):
+        from django.db import connection
+        from .models import Tour
+        from django.test.utils import CaptureQueriesContext
+        self.add_tours(1)
+        # Warm the site chrome and facet index
+        self.client.get(reverse('tour_list_fronted'), {'sort': 'price_low'})
+        with CaptureQueriesContext(connection) as one:
+            self.client.get(reverse('tour_list_fronted'), {'sort': 'newest'})
+        self.add_tours(11)
+        with CaptureQueriesContext(connection) as twelve:
+            response = self.client.get(reverse('tour_list_fronted'), {'sort': 'rating'})
+        self.assertEqual(len(twelve), len(one))
+        self.assertFalse([query for query in twelve.captured_queries if 'accounts_tourreview' in query['sql']])
+        self.assertFalse([query for query in twelve.captured_queries if 'accounts_tourimage' in query['sql']])
+        last = Tour.objects.latest('pk').pk
+        self.assertContains(response, f't{last}-4.')  # display_order 1
+        self.assertNotContains(response, f't{last}-3.')  # display_order 2
+
+
+class TourCardImageTests(TestCase):
+    def setUp(self):
+        import shutil
+        import tempfile
+        from django.core.cache import cache
+        from .models import Tour, TourSupplier
+        media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media)
+        overrides = override_settings(MEDIA_ROOT=media, IMAGE_RENDITION_WORKERS=0)
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        cache.clear()
+        supplier = TourSupplier.objects.create(company_name='Supplier', email='s@e.com', phone='1', address='a')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tour = Tour.objects.create(supplier=supplier, title='Canal', description='-', base_price=100)
+
+    def card(self):
+        from .models import Tour
+        return Tour.objects.values_list('card_image', 'card_thumbnail').get(pk=self.tour.pk)
+
+    def add_image(self, name, **fields):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.tour.images.create(image=f'tours/gallery/{name}', **fields)
+
+    def test_gallery_changes_move_the_card_image(self):
+        self.assertEqual(self.card(), ('', ''))
+        second = self.add_image('second.jpg', display_order=2)
+        first = self.add_image('first.jpg', display_order=1)
+        self.assertEqual(self.card(), ('tours/gallery/first.jpg', ''))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tour.main_image = 'tours/main.jpg'
+            self.tour.save()
+        self.assertEqual(self.card()[0], 'tours/main.jpg')
+
+        self.client.force_login(User.objects.create_superuser('admin', 'a@e.com', 'pw'))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse('tour_image_set_primary', args=[self.tour.pk, second.pk]))
+        self.assertEqual(self.card()[0], 'tours/gallery/second.jpg')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            second.delete()
+        self.assertEqual(self.card()[0], 'tours/main.jpg')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tour.main_image = None
+            self.tour.save(update_fields=['main_image'])
+        self.assertEqual(self.card()[0], 'tours/gallery/first.jpg')
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+        self.assertEqual(self.card(), ('', ''))
+
+    def test_rendering_fills_in_the_thumbnail(self):
+        from io import BytesIO
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from PIL import Image
+        output = BytesIO()
+        Image.new('RGB', (1000, 500)).save(output, 'JPEG')
+        with self.captureOnCommitCallbacks(execute=True):
+            image = self.tour.images.create(image=SimpleUploadedFile('harbour.jpg', output.getvalue(), 'image/jpeg'))
+        self.assertEqual(self.card(), (image.image.name, image.image.name.replace('.jpg', '.w640.jpg')))
+
+        self.tour.refresh_from_db()
+        self.assertEqual(self.tour.card_thumbnail_url, '/media/' + self.tour.card_thumbnail)
+
+    def test_backfill_recomputes_every_tour(self):
+        from io import StringIO
+        from django.core.management import call_command
+        from .models import Tour, TourImage
+        TourImage.objects.bulk_create([
+            TourImage(tour=self.tour, image='tours/gallery/b.jpg', display_order=0),
+            TourImage(tour=self.tour, image='tours/gallery/a.jpg', display_order=1, is_primary=True),
+        ])
+        self.assertEqual(self.card(), ('', ''))
+
+        out = StringIO()
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('backfill_card_images', stdout=out)
+        self.assertIn('Updated 1 of 1 tours', out.getvalue())
+        self.assertIn('0 without an image, 1 without a thumbnail', out.getvalue())
+        self.assertEqual(self.card(), ('tours/gallery/a.jpg', ''))
+
+        out = StringIO()
+        call_command('backfill_card_images', tours=[self.tour.pk], stdout=out)
+        self.assertIn('Updated 0 of 1 tours', out.getvalue())
+        self.assertEqual(Tour.objects.filter(card_image='tours/gallery/a.jpg').count(), 1)
@@ -0,0 +1,256 @@
+"""
+Two-level cache for whole public payloads (the home page, tour list pages).
+
+L1 is a size-bounded LRU dict in each process, L2 is the shared ``default``
+cache that every worker sees. An entry is fresh for a jittered ``timeout``, so
+entries written together don't expire together, and stays servable for
+``stale`` seconds after that. When an entry is stale, one worker rebuilds it
+while holding a lock key in L2, and every other request keeps getting the
+stale copy meanwhile (stale-while-revalidate). With nothing to serve, the
+other workers wait for that rebuild instead of running their own, so an
+expired ``home`` payload is rendered once, not once per request in flight.
+
+Entries are tagged. ``invalidate_tags`` bumps each tag's version key in L2,
+and every process then treats entries built under older versions as stale,
+its L1 included. Tag versions are also the one shared version counter for
+process-local state kept outside the cache (``tag_versions`` / ``bump_tag``),
+such as the tour facet index. Tags come from the dependency declarations in
+accounts/cache_deps.py, which bump them when the models they read change.
+Hit, miss and eviction counters are per process and shown on the admin
+request profiles page.
+"""
+import random
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict, namedtuple
+
+from django.core.cache import caches
+
+L1_MAX_ENTRIES = 256
+
+TIMEOUT = 60 * 10
+
+STALE = 60 * 5
+
+# Fresh lifetimes are cut by up to this fraction
+JITTER = 0.1
+
+# Longest a rebuild may hold the lock before another worker takes over
+LOCK_TIMEOUT = 30
+
+WAIT_INTERVAL = 0.05
+
+LOCK_STRIPES = 64
+
+# Backends whose incr() is one atomic operation; FileBasedCache and DatabaseCache read, then write
+ATOMIC_INCR_BACKENDS = ('LocMemCache', 'RedisCache', 'PyMemcacheCache', 'PyLibMCCache')
+
+# misses are lookups that ran build(), waits ones served by another worker's rebuild
+COUNTERS = ('l1_hits', 'l2_hits', 'stale_hits', 'waits', 'misses', 'evictions', 'invalidations')
+
+Entry = namedtuple('Entry', 'value fresh_until stale_until versions')
+
+
+def _entry_key(key):
+    return f'tiered:{key}'
+
+
+def _lock_key(key):
+    return f'tiered_lock:{key}'
+
+
+def _tag_key(tag):
+    return f'cache_tag:{tag}'
+
+
+class TieredCache:
+    def __init__(self, alias='default', max_entries=L1_MAX_ENTRIES):
+        self.alias = alias
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._l1 = OrderedDict()
+        self._counters = Counter()
+        # Threads of one process rebuilding the same key queue here rather than on the L2 lock
+        self._flights = [threading.Lock() for _ in range(LOCK_STRIPES)]
+
+    @property
+    def l2(self):
+        return caches[self.alias]
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self._counters[name] += amount
+
+    def stats(self):
+        with self._lock:
+            stats = {name: self._counters[name] for name in COUNTERS}
+            stats['l1_entries'] = len(self._l1)
+        stats['l1_max_entries'] = self.max_entries
+        lookups = sum(stats[name] for name in COUNTERS[:5])
+        stats['hit_ratio'] = round((lookups - stats['misses']) / lookups, 3) if lookups else None
+        return stats
+
+    def clear(self):
+        """Empty this process's L1 and reset its counters; L2 is left alone"""
+        with self._lock:
+            self._l1.clear()
+            self._counters.clear()
+
+    def tag_versions(self, tags):
+        if not tags:
+            return ()
+        keys = [_tag_key(tag) for tag in tags]
+        versions = self.l2.get_many(keys)
+        missing = [key for key in keys if key not in versions]
+        if missing:
+            # Seeded from the clock so a flushed L2 never reuses a version an L1 still holds
+            seed = time.time_ns()
+            for key in missing:
+                self.l2.add(key, seed, None)
+            versions.update(self.l2.get_many(missing))
+        return tuple(versions.get(key, 0) for key in keys)
+
+    @property
+    def atomic_bumps(self):
+        """Whether ``bump_tag`` hands every caller its own version (see ATOMIC_INCR_BACKENDS)"""
+        return type(self.l2).__name__ in ATOMIC_INCR_BACKENDS
+
+    def bump_tag(self, tag):
+        """Move ``tag`` to a new version and return it"""
+        try:
+            return self.l2.incr(_tag_key(tag))
+        except ValueError:
+            version = time.time_ns()
+            self.l2.set(_tag_key(tag), version, None)
+            return version
+
+    def invalidate_tags(self, *tags):
+        for tag in tags:
+            self.bump_tag(tag)
+        self._count('invalidations', len(tags))
+
+    def _l1_get(self, key):
+        with self._lock:
+            entry = self._l1.get(key)
+            if entry is not None:
+                self._l1.move_to_end(key)
+            return entry
+
+    def _l1_set(self, key, entry):
+        with self._lock:
+            self._l1[key] = entry
+            self._l1.move_to_end(key)
+            while len(self._l1) > self.max_entries:
+                self._l1.popitem(last=False)
+                self._counters['evictions'] += 1
+
+    def set(self, key, value, timeout=TIMEOUT, stale=STALE, tags=(), versions=None):
+        if versions is None:
+            versions = self.tag_versions(tags)
+        fresh_for = timeout * random.uniform(1 - JITTER, 1)
+        now = time.time()
+        entry = Entry(value, now + fresh_for, now + fresh_for + stale, versions)
+        self.l2.set(_entry_key(key), entry, fresh_for + stale)
+        self._l1_set(key, entry)
+
+    def delete(self, key):
+        with self._lock:
+            self._l1.pop(key, None)
+        self.l2.delete(_entry_key(key))
+
+    def _lookup(self, key, versions, count=True):
+        """``(fresh entry, None)`` from L1 or L2, or ``(None, newest servable stale entry)``"""
+        now = time.time()
+        local = self._l1_get(key)
+        if local is not None and local.versions == versions and now < local.fresh_until:
+            if count:
+                self._count('l1_hits')
+            return local, None
+        shared = self.l2.get(_entry_key(key))
+        if shared is not None and shared.versions == versions and now < shared.fresh_until:
+            self._l1_set(key, shared)
+            if count:
+                self._count('l2_hits')
+            return shared, None
+        candidates = [entry for entry in (local, shared) if entry is not None and now < entry.stale_until]
+        return None, max(candidates, key=lambda entry: entry.fresh_until, default=None)
+
+    def _acquire(self, key):
+        token = uuid.uuid4().hex
+        # add() is not atomic on every backend (FileBasedCache checks, then writes); reading the token back
+        # narrows the race to a double rebuild
+        if self.l2.add(_lock_key(key), token, LOCK_TIMEOUT) and self.l2.get(_lock_key(key)) == token:
+            return token
+        return None
+
+    def _release(self, key, token):
+        if self.l2.get(_lock_key(key)) == token:
+            self.l2.delete(_lock_key(key))
+
+    def _wait(self, key, versions):
+        """Wait for another worker's rebuild; ``None`` if it gave up or took too long"""
+        deadline = time.monotonic() + LOCK_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(WAIT_INTERVAL)
+            entry, stale = self._lookup(key, versions, count=False)
+            if entry is not None:
+                self._count('waits')
+                return entry
+            if not self.l2.has_key(_lock_key(key)):
+                # The holder may have written the entry and released between the two reads
+                entry, stale = self._lookup(key, versions, count=False)
+                if entry is not None:
+                    self._count('waits')
+                    return entry
+                break
+        return None
+
+    def get_or_set(self, key, build, timeout=TIMEOUT, stale=STALE, tags=()):
+        """The cached value for ``key``, calling ``build()`` in at most one worker when it is missing or stale"""
+        versions = self.tag_versions(tags)
+        entry, fallback = self._lookup(key, versions)
+        if entry is not None:
+            return entry.value
+
+        flight = self._flights[hash(key) % LOCK_STRIPES]
+        queued = flight.acquire(timeout=LOCK_TIMEOUT) if fallback is None else flight.acquire(blocking=False)
+        if not queued and fallback is not None:
+            self._count('stale_hits')
+            return fallback.value
+        try:
+            # Another thread of this process may have rebuilt it while we queued
+            entry, fallback = self._lookup(key, versions, count=False)
+            if entry is not None:
+                self._count('waits')
+                return entry.value
+            token = self._acquire(key)
+            if token is not None:
+                # The previous holder may have finished between our lookup and taking the lock
+                entry, _ = self._lookup(key, versions, count=False)
+                if entry is not None:
+                    self._release(key, token)
+                    self._count('waits')
+                    return entry.value
+            elif fallback is not None:
+                self._count('stale_hits')
+                return fallback.value
+            else:
+                entry = self._wait(key, versions)
+                if entry is not None:
+                    return entry.value
+            self._count('misses')
+            try:
+                value = build()
+                self.set(key, value, timeout, stale, versions=versions)
+            finally:
+                if token is not None:
+                    self._release(key, token)
+            return value
+        finally:
+            if queued:
+                flight.release()
+
+
+payload_cache = TieredCache()
+
@@ -0,0 +1,142 @@
+"""
+Lean "tour card" projection for listing pages.
+
+The tour list, find tour, filtered list, feature section, home feature
+sections, related tours and wishlist pages all render the same card: a
+title, short description, price, rating, badges, location names, the
+supplier logo and one image. ``tour_cards`` narrows a Tour queryset to those
+columns with ``only()`` (the long descriptions, meeting point, map embed and
+SEO text stay in the database) and joins the related rows for their names
+only. Reviews are never loaded; cards show the denormalised
+``average_rating`` and ``total_reviews``.
+
+The card image is denormalised onto the tour too, so a listing reads no
+gallery rows. ``Tour.card_image`` is the primary gallery image, else the main
+image, else the first gallery image by ``display_order``, and
+``Tour.card_thumbnail`` is that image's ``THUMBNAIL_WIDTH`` JPEG rendition
+(empty until it is rendered, or when the original is no wider). Tour and
+TourImage saves and deletes refresh them after commit (accounts/signals.py),
+the rendition workers and ``generate_renditions`` fill in the thumbnail once
+it exists, and the ``backfill_card_images`` command recomputes every tour.
+Rows written with ``QuerySet.update()`` or ``bulk_create()`` need
+``refresh_card_images()``.
+
+``listed_tours()`` and ``tour_list_paginator()`` build the tour list's
+queryset and its sort order. The tour list views and the hot query catalogue
+(accounts/query_plans.py) both use them.
+"""
+from collections import defaultdict
+
+from django.db.models import CharField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, NullIf
+
+THUMBNAIL_WIDTH = 640
+
+CARD_RELATIONS = ('supplier', 'category', 'destination_region', 'city__country')
+
+CARD_FIELDS = (
+    'title', 'title_dk', 'slug', 'short_description', 'short_description_dk', 'card_image', 'card_thumbnail',
+    'duration_text', 'max_participants', 'base_price', 'currency', 'discount_percentage',
+    'average_rating', 'total_reviews', 'status', 'is_featured', 'is_bestseller', 'created_at',
+    'instant_confirmation', 'free_cancellation', 'skip_the_line', 'live_guide', 'wheelchair_accessible',
+    'supplier__company_name', 'supplier__logo',
+    'category__name', 'category__name_dk',
+    'destination_region__name', 'destination_region__name_dk',
+    'city__name', 'city__name_dk', 'city__country__name',
+)
+
+UPDATE_BATCH = 500
+
+TOUR_LIST_SORTS = ('recommended', 'rating', 'price_low', 'price_high', 'newest')
+
+TOUR_LIST_PER_PAGE = 12
+
+
+def card_fields(prefix=''):
+    """CARD_FIELDS for a query that reaches the tour through ``prefix`` (e.g. ``'tour__'``)"""
+    return [prefix + field for field in CARD_FIELDS]
+
+
+def tour_cards(queryset=None):
+    """``queryset`` (every tour by default) reduced to what a tour card renders"""
+    from .models import Tour
+
+    if queryset is None:
+        queryset = Tour.objects.all()
+    return queryset.select_related(*CARD_RELATIONS).only(*CARD_FIELDS)
+
+
+def listed_tours():
+    """Active tours, reduced to the card columns"""
+    from .models import Tour
+
+    return tour_cards(Tour.objects.filter(status='active'))
+
+
+def tour_list_paginator(tours, sort_by, search_query=None):
+    """KeysetPaginator over ``tours`` in the tour list's ``sort`` order (``search_query`` ranks "recommended")"""
+    from . import search
+    from .pagination import KeysetPaginator
+
+    if sort_by == 'price_low':
+        ordering = ('base_price',)
+    elif sort_by == 'price_high':
+        ordering = ('-base_price',)
+    elif sort_by == 'rating':
+        ordering = ('-average_rating',)
+    elif sort_by == 'newest':
+        ordering = ('-created_at',)
+    elif search_query:  # recommended while searching - best match first
+        tours = tours.annotate(search_rank=search.rank(search_query))
+        ordering = ('search_rank', '-created_at')
+    else:  # recommended - featured tours first, then by rating
+        ordering = ('-is_featured', '-average_rating', '-created_at')
+    return KeysetPaginator(tours, TOUR_LIST_PER_PAGE, ordering=ordering)
+
+
+def card_image_expression():
+    """SQL for the name of a tour's card image, NULL when it has none"""
+    from .models import TourImage
+
+    gallery = TourImage.objects.filter(tour=OuterRef('pk')).order_by('display_order', 'pk').values('image')
+    return Coalesce(
+        Subquery(gallery.filter(is_primary=True)[:1]),
+        NullIf('main_image', Value('')),
+        Subquery(gallery[:1]),
+        output_field=CharField(),
+    )
+
+
+def card_thumbnail(name):
+    """The thumbnail rendition of ``name``, or '' while it doesn't exist"""
+    from .renditions import available_widths, rendition_name
+
+    if name and THUMBNAIL_WIDTH in available_widths(name):
+        return rendition_name(name, THUMBNAIL_WIDTH, 'jpeg')
+    return ''
+
+
+def refresh_card_images(tours):
+    """Bring the card image and thumbnail of ``tours`` up to date; returns the ids of the tours that changed"""
+    from .cache_deps import dependencies
+    from .models import Tour
+
+    changes = defaultdict(list)
+    rows = tours.order_by().annotate(picked=card_image_expression()).values_list(
+        'pk', 'card_image', 'card_thumbnail', 'picked'
+    )
+    for pk, image, thumbnail, picked in rows.iterator():
+        picked = picked or ''
+        expected = card_thumbnail(picked)
+        if (image, thumbnail) != (picked, expected):
+            changes[picked, expected].append(pk)
+
+    changed = []
+    for (image, thumbnail), ids in changes.items():
+        for start in range(0, len(ids), UPDATE_BATCH):
+            chunk = ids[start:start + UPDATE_BATCH]
+            Tour.objects.filter(pk__in=chunk).update(card_image=image, card_thumbnail=thumbnail)
+        changed.extend(ids)
+    if changed:
+        dependencies.changed(Tour, pk=changed)
+    return changed
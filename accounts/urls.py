@@ -21,6 +21,7 @@ from accounts.admin_panel import views_messages as message_views
 from accounts.admin_panel import views_feature_section as feature_section_views
 from accounts.admin_panel import views_website_menu as website_menu_views
 from accounts.admin_panel import views_faq as faq_views
+from accounts.admin_panel import views_profiling as profiling_views
 from accounts import views_frontend
 from accounts.supplier_panel import views as supplier_views
 
@@ -84,6 +85,8 @@ urlpatterns = [
     
     # Site Settings
     path('admin/settings/', admin_views.site_settings, name='site_settings'),
+    path('admin/profiling/', profiling_views.request_profiles, name='request_profiles'),
+    path('admin/profiling/json/', profiling_views.request_profiles_json, name='request_profiles_json'),
 
     # Tour Supplier CRUD
     path('admin/tour-suppliers/', tour_supplier_views.tour_supplier_list, name='tour_supplier_list'),
@@ -212,6 +215,7 @@ urlpatterns = [
     path('admin/bookings/<int:pk>/invoice/', booking_views.booking_invoice, name='booking_invoice'),
     path('admin/bookings/<int:pk>/add-payment/', booking_views.booking_add_payment, name='booking_add_payment'),
     path('admin/bookings/<int:pk>/send-invoice/', booking_views.booking_send_invoice, name='booking_send_invoice'),
+    path('admin/bookings/tour-pricing/<int:tour_id>/', booking_views.booking_tour_pricing, name='booking_tour_pricing'),
 
     # Payment CRUD
     path('admin/payments/', payment_views.payment_list, name='payment_list'),